@@ -0,0 +1,108 @@
+"""
+Micro-benchmarks for permission-checks based on `CompiledRules`
+compared to the previous, rule-by-rule evaluation.
+
+Run with `python benchmarks/bench_acl.py`.
+"""
+
+from timeit import timeit
+
+from dcm_frontend.config import AppConfig
+from dcm_frontend.models import (
+    User,
+    SimpleRule,
+    WorkspaceRule,
+    ACL,
+    compile_rules,
+)
+
+
+def legacy_has_permission(rules, user) -> bool:
+    """Previous implementation of `requires_permission`."""
+    return any(
+        any(group.id_ == rule.group_id for group in user.groups)
+        if isinstance(rule, SimpleRule)
+        else any(
+            group.id_ == rule.group_id and group.workspace is not None
+            for group in user.groups
+        )
+        for rule in rules
+    )
+
+
+def legacy_workspaces(rules, user):
+    """Previous implementation of `generate_workspaces`."""
+    srules = filter(
+        lambda r: isinstance(r, SimpleRule)
+        and legacy_has_permission([r], user),
+        rules,
+    )
+    if len(list(srules)) > 0:
+        return None
+    wrules_gids = [
+        r.group_id
+        for r in rules
+        if isinstance(r, WorkspaceRule) and legacy_has_permission([r], user)
+    ]
+    return {
+        g.workspace
+        for g in user.groups
+        if g.id_ in wrules_gids and g.workspace is not None
+    }
+
+
+def legacy_reduce(acl: ACL, user):
+    """Previous implementation of `ACL.reduce`."""
+    return {
+        k: any(legacy_has_permission(rules, user) for _ in user.groups)
+        for k, rules in acl.__dict__.items()
+        if isinstance(rules, list)
+        and all(isinstance(rule, SimpleRule | WorkspaceRule) for rule in rules)
+    }
+
+
+def main(number: int = 20000) -> None:
+    """Runs benchmarks and prints results."""
+    acl = AppConfig.ACL
+    user = User(
+        {
+            "groups": [
+                {"id": "curator", "workspace": f"workspace-{i}"}
+                for i in range(10)
+            ]
+        }
+    )
+    rules = acl.READ_JOBCONFIG
+    compiled = compile_rules(rules)
+
+    assert legacy_has_permission(rules, user) == compiled.has_permission(user)
+    assert legacy_workspaces(rules, user) == compiled.workspaces(user)
+    assert legacy_reduce(acl, user) == acl.reduce(user)
+
+    for name, legacy, new in (
+        (
+            "requires_permission",
+            lambda: legacy_has_permission(rules, user),
+            lambda: compiled.has_permission(user),
+        ),
+        (
+            "generate_workspaces",
+            lambda: legacy_workspaces(rules, user),
+            lambda: compiled.workspaces(user),
+        ),
+        (
+            "ACL.reduce",
+            lambda: legacy_reduce(acl, user),
+            lambda: acl.reduce(user),
+        ),
+    ):
+        t_legacy = timeit(legacy, number=number) / number
+        t_new = timeit(new, number=number) / number
+        print(
+            f"{name:20s} legacy: {t_legacy * 1e6:8.2f} us, "
+            + f"compiled: {t_new * 1e6:8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark for the JSON-providers (see `JSON_PROVIDER`).
+
+Compares flask's default provider with `JSONProvider` and
+`FastJSONProvider` on a representative job report (job info with
+children-reports and logs for a number of records).
+
+Run with `python benchmarks/bench_json_provider.py [<number of records>]`.
+"""
+
+import sys
+import json
+from timeit import timeit
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from dcm_frontend.json_provider import JSONProvider, FastJSONProvider
+
+
+def _log(n: int) -> dict:
+    return {
+        "EVENT": [
+            {
+                "datetime": "2025-01-01T00:00:00.000000+00:00",
+                "origin": "Job Processor",
+                "body": f"Event {i}: Some log message.",
+            }
+            for i in range(n)
+        ],
+        "INFO": [
+            {
+                "datetime": "2025-01-01T00:00:00.000000+00:00",
+                "origin": "Import Module",
+                "body": f"Info {i}: Some longer log message with ümlauts.",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def generate_report(n: int) -> dict:
+    """Returns job info with report for `n` records."""
+    return {
+        "token": "token-0",
+        "jobConfigId": "job-config-0",
+        "workspaceId": "workspace-0",
+        "status": "completed",
+        "success": True,
+        "triggerType": "manual",
+        "datetimeStarted": "2025-01-01T00:00:00.000000+00:00",
+        "datetimeEnded": "2025-01-01T01:00:00.000000+00:00",
+        "report": {
+            "host": "http://localhost:8087",
+            "token": {"value": "token-0", "expires": False},
+            "args": {"process": {"id": "job-config-0"}},
+            "progress": {"status": "completed", "verbose": "", "numeric": 100},
+            "log": _log(10),
+            "data": {
+                "success": True,
+                "records": {
+                    f"record-{i}": {
+                        "completed": True,
+                        "success": True,
+                        "stages": {
+                            stage: {
+                                "completed": True,
+                                "success": True,
+                                "logId": f"{stage}-{i}",
+                            }
+                            for stage in (
+                                "import_ies",
+                                "build_ip",
+                                "validation",
+                                "transfer",
+                                "ingest",
+                            )
+                        },
+                    }
+                    for i in range(n)
+                },
+            },
+            "children": {
+                f"child-{i}": {
+                    "progress": {"status": "completed", "numeric": 100},
+                    "log": _log(3),
+                }
+                for i in range(n)
+            },
+        },
+    }
+
+
+def main(n: int = 1000, repeat: int = 10) -> None:
+    """Runs benchmark and prints results."""
+    report = generate_report(n)
+    print(f"payload: {n} records, {len(json.dumps(report)) / 1e6:.2f} MB")
+    for provider in (DefaultJSONProvider, JSONProvider, FastJSONProvider):
+        app = Flask(__name__)
+        app.json = provider(app)
+        with app.app_context():
+            t = timeit(lambda: jsonify(report).get_data(), number=repeat)
+        print(f"{provider.__name__:20s} {t / repeat * 1e3:8.2f} ms/request")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
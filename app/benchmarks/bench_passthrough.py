@@ -0,0 +1,125 @@
+"""
+Benchmark for forwarding backend-responses with and without
+deserialization (see `BACKEND_PASSTHROUGH`).
+
+Compares the regular path (parse into pydantic-models, `to_dict`,
+`jsonify`) with the passthrough path (forward bytes unchanged) for a
+representative list of IEs.
+
+Run with `python benchmarks/bench_passthrough.py [<number of IEs>]`.
+"""
+
+from typing import Optional
+import sys
+import json
+from timeit import timeit
+
+from flask import Flask, jsonify
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    def to_dict(self) -> dict:
+        """Mimics the SDK-models' `to_dict`."""
+        return self.model_dump(by_alias=True, exclude_none=True)
+
+
+class Record(_Model):
+    """Simplified IE-record."""
+
+    id: str
+    report_id: Optional[str] = Field(default=None, alias="reportId")
+    status: str
+    datetime_processed: Optional[str] = Field(
+        default=None, alias="datetimeProcessed"
+    )
+    bitstream: bool = False
+    skip_object_validation: bool = Field(
+        default=False, alias="skipObjectValidation"
+    )
+
+
+class IE(_Model):
+    """Simplified IE."""
+
+    id: str
+    job_config_id: str = Field(alias="jobConfigId")
+    source_organization: Optional[str] = Field(
+        default=None, alias="sourceOrganization"
+    )
+    origin_system_id: Optional[str] = Field(
+        default=None, alias="originSystemId"
+    )
+    external_id: Optional[str] = Field(default=None, alias="externalId")
+    archive_id: Optional[str] = Field(default=None, alias="archiveId")
+    records: dict[str, Record] = Field(default_factory=dict)
+
+
+class IEs(_Model):
+    """Simplified IE-list."""
+
+    count: int
+    ies: list[IE]
+
+
+def generate_payload(n: int) -> bytes:
+    """Returns JSON-payload of `n` IEs as sent by the backend."""
+    return json.dumps(
+        {
+            "count": n,
+            "ies": [
+                {
+                    "id": f"ie-{i}",
+                    "jobConfigId": "job-config-0",
+                    "sourceOrganization": "https://d-nb.info/gnd/0",
+                    "originSystemId": "oai",
+                    "externalId": f"oai:example.org:{i}",
+                    "archiveId": "archive-0",
+                    "records": {
+                        f"record-{i}-{j}": {
+                            "id": f"record-{i}-{j}",
+                            "reportId": f"token-{i}-{j}",
+                            "status": "complete",
+                            "datetimeProcessed": "2025-01-01T00:00:00+00:00",
+                            "bitstream": False,
+                            "skipObjectValidation": False,
+                        }
+                        for j in range(3)
+                    },
+                }
+                for i in range(n)
+            ],
+        }
+    ).encode(encoding="utf-8")
+
+
+def main(n: int = 1000, repeat: int = 20) -> None:
+    """Runs benchmark and prints results."""
+    app = Flask(__name__)
+    payload = generate_payload(n)
+
+    def regular():
+        response = jsonify(IEs.model_validate_json(payload).to_dict())
+        return response.get_data()
+
+    def passthrough():
+        # flask-response forwarding the unchanged body
+        return b"".join(
+            app.response_class(iter([payload])).iter_encoded()
+        )
+
+    with app.app_context():
+        assert json.loads(regular()) == json.loads(passthrough())
+        t_regular = timeit(regular, number=repeat) / repeat
+        t_passthrough = timeit(passthrough, number=repeat) / repeat
+
+    print(f"payload: {n} IEs, {len(payload) / 1e6:.2f} MB")
+    print(f"regular:     {t_regular * 1e3:8.2f} ms/request")
+    print(f"passthrough: {t_passthrough * 1e3:8.2f} ms/request")
+    print(f"speedup:     {t_regular / t_passthrough:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
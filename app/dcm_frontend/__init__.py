@@ -12,6 +12,14 @@ from dcm_common.services import extensions
 import dcm_backend_sdk
 
 from dcm_frontend.config import AppConfig
+from dcm_frontend.connection_pool import ConnectionPool
+from dcm_frontend.workspace_index import WorkspaceIndex
+from dcm_frontend.job_status import JobStatusBroker
+from dcm_frontend.json_provider import JSONProvider, FastJSONProvider
+from dcm_frontend.compression import ResponseCompression
+from dcm_frontend.backend_calls import BackendCallRecorder
+from dcm_frontend.metrics import Metrics
+from dcm_frontend.session_sweeper import SessionSweeper
 from dcm_frontend.views import (
     ClientView,
     AuthView,
@@ -25,7 +33,7 @@ from dcm_frontend.views import (
     JobView,
 )
 from dcm_frontend.models import Session, User
-from dcm_frontend.util import call_backend
+from dcm_frontend.util import call_backend, LRUCache
 
 
 def app_factory(config: AppConfig):
@@ -37,32 +45,54 @@ def app_factory(config: AppConfig):
 
     app = Flask(__name__, static_folder=config.STATIC_PATH)
     app.config.from_object(config)
+    if config.JSON_PROVIDER == "orjson":
+        app.json = FastJSONProvider(app)
+    else:
+        app.json = JSONProvider(app)
 
-    # initialize dcm-backend APIs
-    backend_user_api = dcm_backend_sdk.UserApi(
-        dcm_backend_sdk.ApiClient(
-            dcm_backend_sdk.Configuration(host=config.BACKEND_HOST)
-        )
+    # record calls to the backend per request
+    backend_call_recorder = BackendCallRecorder(
+        server_timing=config.BACKEND_CALLS_SERVER_TIMING,
+        expose_calls=config.BACKEND_CALLS_HEADER,
+        log_threshold=config.BACKEND_CALLS_LOG_THRESHOLD,
+    )
+    backend_call_recorder.init_app(app)
+    app.extensions["backend_call_recorder"] = backend_call_recorder
+
+    # collect metrics (exported via MiscellaneousView)
+    if config.METRICS:
+        metrics = Metrics()
+        metrics.init_app(app)
+        app.extensions["metrics"] = metrics
+    else:
+        metrics = None
+
+    # initialize dcm-backend APIs (sharing a single connection pool)
+    backend_pool = ConnectionPool(
+        config.BACKEND_HOST,
+        num_pools=config.BACKEND_POOL_NUM_POOLS,
+        maxsize=config.BACKEND_POOL_MAXSIZE,
+        block=config.BACKEND_POOL_BLOCK,
+        keepalive=config.BACKEND_POOL_KEEPALIVE,
+        idle_timeout=config.BACKEND_POOL_IDLE_TIMEOUT,
     )
+    backend_user_api = dcm_backend_sdk.UserApi(backend_pool.api_client)
     backend_template_api = dcm_backend_sdk.TemplateApi(
-        dcm_backend_sdk.ApiClient(
-            dcm_backend_sdk.Configuration(host=config.BACKEND_HOST)
-        )
+        backend_pool.api_client
     )
-    backend_config_api = dcm_backend_sdk.ConfigApi(
-        dcm_backend_sdk.ApiClient(
-            dcm_backend_sdk.Configuration(host=config.BACKEND_HOST)
-        )
+    backend_config_api = dcm_backend_sdk.ConfigApi(backend_pool.api_client)
+    backend_job_api = dcm_backend_sdk.JobApi(backend_pool.api_client)
+    backend_artifact_api = dcm_backend_sdk.ArtifactApi(
+        backend_pool.api_client
     )
-    backend_job_api = dcm_backend_sdk.JobApi(
-        dcm_backend_sdk.ApiClient(
-            dcm_backend_sdk.Configuration(host=config.BACKEND_HOST)
-        )
+
+    # shared index of resource-workspace-relations
+    workspace_index = WorkspaceIndex(
+        config, backend_config_api, backend_job_api
     )
-    backend_artifact_api = dcm_backend_sdk.ArtifactApi(
-        dcm_backend_sdk.ApiClient(
-            dcm_backend_sdk.Configuration(host=config.BACKEND_HOST)
-        )
+    # shared polling of job-status for event-streams
+    job_status_broker = JobStatusBroker(
+        config, backend_config_api, backend_job_api, workspace_index
     )
 
     view_client = ClientView(config)
@@ -70,34 +100,109 @@ def app_factory(config: AppConfig):
     view_user = UserView(config, backend_user_api)
     view_permission = PermissionView(config)
     view_user_config = UserConfigView(config, backend_config_api)
-    view_workspace = WorkspaceView(config, backend_config_api)
+    view_workspace = WorkspaceView(
+        config, backend_config_api, workspace_index=workspace_index
+    )
     view_template = TemplateView(
-        config, backend_config_api, backend_template_api
+        config,
+        backend_config_api,
+        backend_template_api,
+        workspace_index=workspace_index,
+    )
+    view_misc = MiscellaneousView(config, metrics=metrics)
+    view_job_config = JobConfigView(
+        config, backend_config_api, workspace_index=workspace_index
     )
-    view_misc = MiscellaneousView(config)
-    view_job_config = JobConfigView(config, backend_config_api)
     view_job = JobView(
-        config, backend_job_api, backend_config_api, backend_artifact_api
+        config,
+        backend_job_api,
+        backend_config_api,
+        backend_artifact_api,
+        backend_session=backend_pool.session,
+        workspace_index=workspace_index,
+        job_status_broker=job_status_broker,
     )
 
     # register extensions
     login_manager = LoginManager(app)
+    app.extensions["backend_pool"] = backend_pool
+    app.extensions["workspace_index"] = workspace_index
+    app.extensions["job_status_broker"] = job_status_broker
 
     # session_key calculation-optimization (do not re-calculate keys)
     # session_key_store maps session id to session key in memory
-    session_key_store = {}
+    session_key_store = LRUCache(
+        config.SESSION_KEY_CACHE_MAXSIZE, config.SESSION_KEY_CACHE_TTL
+    )
+    # unknown_sessions contains recently rejected session ids (these
+    # are rejected without accessing the sessions-db)
+    unknown_sessions = LRUCache(
+        config.SESSION_KEY_CACHE_MAXSIZE, config.SESSION_NEGATIVE_CACHE_TTL
+    )
+    app.extensions["session_key_store"] = session_key_store
+    app.extensions["unknown_sessions"] = unknown_sessions
 
-    @login_manager.user_loader
-    def load_user(session_id):
+    def collect_cache_metrics():
+        """Returns hit-rates and sizes of session- and user-caches."""
+        caches = {
+            "session_key": session_key_store.stats(),
+            "unknown_sessions": unknown_sessions.stats(),
+        }
+        if not config.SESSION_DISABLE_USER_CACHING:
+            caches["user"] = config.user_configs.stats()
+        return [
+            (
+                f"dcm_frontend_cache_{name}",
+                type_,
+                help_,
+                [
+                    (
+                        f"dcm_frontend_cache_{name}",
+                        {"cache": cache},
+                        stats[key],
+                    )
+                    for cache, stats in caches.items()
+                ],
+            )
+            for name, key, type_, help_ in (
+                ("hits_total", "hits", "counter", "Number of cache hits."),
+                (
+                    "misses_total",
+                    "misses",
+                    "counter",
+                    "Number of cache misses.",
+                ),
+                (
+                    "evictions_total",
+                    "evictions",
+                    "counter",
+                    "Number of evicted cache entries.",
+                ),
+                ("entries", "size", "gauge", "Number of cache entries."),
+            )
+        ]
+
+    if metrics is not None:
+        metrics.add_collector(collect_cache_metrics)
+
+    def reject_session(session_id, session_key):
+        """Deletes session and marks session id as unknown."""
+        config.sessions.delete(session_key)
+        session_key_store.pop(session_id)
+        unknown_sessions.set(session_id, True)
+
+    def load_session(session_id):
         """
-        Load the user object from the user ID stored in the session.
+        Returns pair of session key and user-config id for the given
+        session id from the sessions-db (or `(None, None)`).
         """
         # get session-key
-        if session_id not in session_key_store:
-            session_key_store[session_id] = sha512(
+        session_key = session_key_store.get(session_id)
+        if session_key is None:
+            session_key = sha512(
                 session_id.encode(encoding="utf-8")
             ).hexdigest()
-        session_key = session_key_store[session_id]
+            session_key_store.set(session_id, session_key)
         # get record from sessions-db
         session = config.sessions.read(session_key)
 
@@ -106,28 +211,59 @@ def app_factory(config: AppConfig):
                 "authentication using a session-id failed (unknown id)",
                 file=sys.stderr,
             )
-            config.sessions.delete(session_key)
-            return None
+            reject_session(session_id, session_key)
+            return None, None
 
         user_config_id = session.get("userConfigId")
         # session is somehow broken
         if user_config_id is None:
-            config.sessions.delete(session_key)
-            return None
+            reject_session(session_id, session_key)
+            return None, None
 
         # check session expiration
         if not view_auth.check_session_expiration(session):
-            config.sessions.delete(session_key)
+            reject_session(session_id, session_key)
+            return None, None
+
+        return session_key, user_config_id
+
+    @login_manager.user_loader
+    def load_user(session_id):
+        """
+        Load the user object from the user ID stored in the session.
+        """
+        # reject recently failed session ids
+        if session_id in unknown_sessions:
             return None
 
-        # get associated user-config
+        if config.SESSION_SIGNED:
+            # verify signed session (without accessing sessions-db)
+            claim = config.session_signer.verify(session_id)
+            if claim is None:
+                unknown_sessions.set(session_id, True)
+                return None
+            session_key = claim.key
+            user_config_id = claim.user_config_id
+            # periodically check whether session still exists
+            if config.session_signer.requires_revalidation(claim):
+                if config.sessions.read(session_key) is None:
+                    reject_session(session_id, session_key)
+                    return None
+                config.session_signer.validated(claim)
+        else:
+            session_key, user_config_id = load_session(session_id)
+            if session_key is None:
+                return None
+
+        # get associated (parsed) user-config
         if config.SESSION_DISABLE_USER_CACHING:
-            user_config = None
+            user = None
         else:
-            user_config = config.user_configs.read(user_config_id)
+            user = config.user_configs.get_user(user_config_id)
 
         # if not yet available, fetch from backend
-        if user_config is None:
+        if user is None:
+            user_config = None
             get_config_response = call_backend(
                 endpoint=backend_config_api.get_user_config_with_http_info,
                 args=[user_config_id],
@@ -138,19 +274,27 @@ def app_factory(config: AppConfig):
                 user_config = get_config_response.data.to_dict()
             if not config.SESSION_DISABLE_USER_CACHING:
                 config.user_configs.write(user_config_id, user_config)
+            user = User({}) if user_config is None else User(user_config)
 
         return Session(
+            id=session_id,
             key=session_key,
             user_config_id=user_config_id,
-            user=User({}) if user_config is None else User(user_config),
+            user=user,
         )
 
-    # cleanup old sessions
-    for session_id in config.sessions.keys():
-        session = config.sessions.read(session_id)
-        if not view_auth.check_session_expiration(session):
-            config.sessions.delete(session_id)
-            print(f"Deleted expired session '{session_id}'.")
+    # cleanup old sessions (in background)
+    session_sweeper = SessionSweeper(
+        config.sessions,
+        view_auth.check_session_expiration,
+        interval=config.SESSION_SWEEP_INTERVAL,
+        batch_size=config.SESSION_SWEEP_BATCH_SIZE,
+        batch_delay=config.SESSION_SWEEP_BATCH_DELAY,
+        lock_file=config.SESSION_SWEEP_LOCK_FILE,
+    )
+    if config.SESSION_SWEEP_INTERVAL > 0:
+        session_sweeper.start()
+    app.extensions["session_sweeper"] = session_sweeper
 
     if config.ALLOW_CORS:
         app.extensions["cors"] = extensions.cors_loader(
@@ -184,4 +328,15 @@ def app_factory(config: AppConfig):
     )
     app.register_blueprint(view_job.get_blueprint(), url_prefix="/api/curator")
 
+    # compress API-responses
+    if config.COMPRESSION:
+        app.after_request(
+            ResponseCompression(
+                min_size=config.COMPRESSION_MIN_SIZE,
+                level=config.COMPRESSION_LEVEL,
+                brotli_level=config.COMPRESSION_BROTLI_LEVEL,
+                path_prefixes=("/api/",),
+            )
+        )
+
     return app
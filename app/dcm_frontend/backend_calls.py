@@ -0,0 +1,130 @@
+"""
+Per-request instrumentation of calls to the backend.
+"""
+
+from typing import Optional
+from collections import Counter, OrderedDict
+import sys
+import threading
+
+from flask import Flask, Response, request
+
+from dcm_frontend.util import backend_calls
+
+
+class BackendCallRecorder:
+    """
+    Records the calls to the backend (via `call_backend`,
+    `call_backend_many`, and `call_backend_raw`) that are made while
+    handling a request.
+
+    The result is added to the response as
+    * 'Server-Timing'-header (total number and duration of calls), and
+    * 'X-Backend-Calls'-header (number and duration of calls per
+      SDK-method; only if `expose_calls` is set).
+    Additionally, statistics are aggregated per view (see `stats`) and
+    requests exceeding `log_threshold` calls are logged.
+
+    Keyword arguments:
+    server_timing -- whether to add the 'Server-Timing'-header
+                     (default True)
+    expose_calls -- whether to add the 'X-Backend-Calls'-header
+                    (default False)
+    log_threshold -- minimum number of calls for a request to be
+                     logged; a value below or equal to zero disables
+                     logging
+                     (default 0)
+    """
+
+    def __init__(
+        self,
+        server_timing: bool = True,
+        expose_calls: bool = False,
+        log_threshold: int = 0,
+    ) -> None:
+        self.server_timing = server_timing
+        self.expose_calls = expose_calls
+        self.log_threshold = log_threshold
+        self._stats: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """Registers request-handlers with `app`."""
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+
+    def before_request(self) -> None:
+        """Starts recording for the current request."""
+        backend_calls.set([])
+
+    @staticmethod
+    def summarize(
+        calls: list[tuple[str, float]],
+    ) -> "OrderedDict[str, tuple[int, float]]":
+        """
+        Returns number and total duration of `calls` per SDK-method
+        (in order of first occurrence).
+        """
+        summary: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        for name, duration in calls:
+            count, total = summary.get(name, (0, 0.0))
+            summary[name] = (count + 1, total + duration)
+        return summary
+
+    def after_request(self, response: Response) -> Response:
+        """Adds headers for and aggregates the current request."""
+        calls: Optional[list] = backend_calls.get()
+        backend_calls.set(None)
+        if calls is None:
+            return response
+
+        duration = sum(c[1] for c in calls)
+        if self.server_timing:
+            response.headers.add(
+                "Server-Timing",
+                f"backend;dur={duration * 1000:.1f};"
+                + f'desc="{len(calls)} calls"',
+            )
+        if self.expose_calls and calls:
+            response.headers["X-Backend-Calls"] = ", ".join(
+                f"{name};count={count};dur={total * 1000:.1f}"
+                for name, (count, total) in self.summarize(calls).items()
+            )
+
+        view = request.endpoint or "<unknown>"
+        with self._lock:
+            stats = self._stats.setdefault(
+                view,
+                {
+                    "requests": 0,
+                    "calls": 0,
+                    "maxCalls": 0,
+                    "duration": 0.0,
+                    "methods": Counter(),
+                },
+            )
+            stats["requests"] += 1
+            stats["calls"] += len(calls)
+            stats["maxCalls"] = max(stats["maxCalls"], len(calls))
+            stats["duration"] += duration
+            stats["methods"].update(c[0] for c in calls)
+
+        if 0 < self.log_threshold <= len(calls):
+            print(
+                f"Request '{request.method} {request.path}' made "
+                + f"{len(calls)} backend calls ({duration * 1000:.1f}ms): "
+                + ", ".join(
+                    f"{name} ({count}x)"
+                    for name, (count, _) in self.summarize(calls).items()
+                ),
+                file=sys.stderr,
+            )
+        return response
+
+    def stats(self) -> dict:
+        """Returns aggregated statistics per view as JSON."""
+        with self._lock:
+            return {
+                view: stats | {"methods": dict(stats["methods"])}
+                for view, stats in self._stats.items()
+            }
@@ -0,0 +1,159 @@
+"""
+Compression of (large) API responses.
+"""
+
+from typing import Optional
+from collections.abc import Iterable, Iterator
+import gzip
+import zlib
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class ResponseCompression:
+    """
+    Callable that can be registered as `after_request`-handler to
+    compress responses with gzip or brotli (if the `brotli`-package is
+    available and preferred by the client), based on the request's
+    'Accept-Encoding'-header.
+
+    Responses are not compressed if
+    * the request-path does not match any of `path_prefixes`,
+    * the mimetype is not listed in `mimetypes`,
+    * the response is marked as `direct_passthrough` or already has a
+      'Content-Encoding', or
+    * the response is smaller than `min_size` (if the size is known).
+
+    Streamed responses are compressed incrementally.
+
+    Keyword arguments:
+    min_size -- minimum size of responses in bytes to be compressed
+                (default 1024)
+    level -- gzip-compression level (1-9)
+             (default 6)
+    brotli_level -- brotli-quality (0-11)
+                    (default 4)
+    path_prefixes -- request-path prefixes for which responses are
+                     compressed
+                     (default ("/api/",))
+    mimetypes -- mimetypes of responses that are compressed
+                 (default None; corresponds to `MIMETYPES`)
+    """
+
+    MIMETYPES = (
+        "application/json",
+        "application/x-ndjson",
+        "text/plain",
+        "text/html",
+        "text/csv",
+    )
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        level: int = 6,
+        brotli_level: int = 4,
+        path_prefixes: Iterable[str] = ("/api/",),
+        mimetypes: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.min_size = min_size
+        self.level = level
+        self.brotli_level = brotli_level
+        self.path_prefixes = tuple(path_prefixes)
+        self.mimetypes = tuple(
+            self.MIMETYPES if mimetypes is None else mimetypes
+        )
+
+    def get_encoding(self) -> Optional[str]:
+        """
+        Returns the preferred supported encoding of the current request
+        or `None`.
+        """
+        accept = request.accept_encodings
+        candidates = [
+            (accept.quality(encoding), encoding)
+            for encoding in (("br", "gzip") if brotli else ("gzip",))
+        ]
+        quality, encoding = max(candidates, key=lambda c: c[0])
+        return encoding if quality > 0 else None
+
+    def _compressor(self, encoding: str):
+        """
+        Returns pair of functions for compressing a chunk and finishing
+        the compression.
+        """
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=self.brotli_level)
+            return compressor.process, compressor.finish
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+        return compressor.compress, compressor.flush
+
+    def _compress_stream(
+        self, encoding: str, chunks: Iterable[bytes]
+    ) -> Iterator[bytes]:
+        """Compresses `chunks` incrementally."""
+        compress, finish = self._compressor(encoding)
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(encoding="utf-8")
+                data = compress(chunk)
+                if data:
+                    yield data
+            yield finish()
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    def compress(self, encoding: str, data: bytes) -> bytes:
+        """Returns `data` compressed with `encoding`."""
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_level)
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def __call__(self, response: Response) -> Response:
+        if (
+            not request.path.startswith(self.path_prefixes)
+            or response.mimetype not in self.mimetypes
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or request.method == "HEAD"
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        if (
+            response.content_length is not None
+            and response.content_length < self.min_size
+        ):
+            return response
+        encoding = self.get_encoding()
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self._compress_stream(
+                encoding, response.response
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(self.compress(encoding, data))
+        response.headers["Content-Encoding"] = encoding
+
+        # compressed representation is only semantically equivalent
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            response.set_etag(etag, weak=True)
+        return response
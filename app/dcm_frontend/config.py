@@ -5,11 +5,15 @@ import os
 from pathlib import Path
 import json
 from importlib.metadata import version
+from concurrent.futures import ThreadPoolExecutor
 
 from dcm_common.services import BaseConfig
 from dcm_common.db.key_value_store import util
 
 from dcm_frontend.models import Rule, SimpleRule, WorkspaceRule, GroupInfo, ACL
+from dcm_frontend.user_cache import UserCache, InvalidationChannel
+from dcm_frontend.session_store import SessionStore
+from dcm_frontend.signed_session import SessionSigner
 
 
 class AppConfig(BaseConfig):
@@ -39,6 +43,20 @@ class AppConfig(BaseConfig):
     )
 
     USE_GRAVATAR = int(os.environ.get("USE_GRAVATAR", 0)) == 1
+    # JSON-serialization of responses; one of 'orjson' (requires the
+    # 'orjson'-extra, falls back to 'stdlib' otherwise) and 'stdlib'
+    JSON_PROVIDER = os.environ.get("JSON_PROVIDER") or "orjson"
+    # compression of API-responses (brotli requires the 'brotli'-extra)
+    COMPRESSION = int(os.environ.get("COMPRESSION", 1)) == 1
+    COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_LEVEL = int(os.environ.get("COMPRESSION_LEVEL", 6))
+    COMPRESSION_BROTLI_LEVEL = int(
+        os.environ.get("COMPRESSION_BROTLI_LEVEL", 4)
+    )
+    # metrics-endpoint (Prometheus text-format); requires a token (only
+    # accessible from localhost without token in testing-mode)
+    METRICS = int(os.environ.get("METRICS", 1)) == 1
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
 
     # ------ FLASK-LOGIN ------
     SECRET_KEY_OK = os.environ.get("SECRET_KEY") is not None
@@ -56,15 +74,87 @@ class AppConfig(BaseConfig):
     SESSION_EXPIRATION_DELTA = float(
         os.environ.get("SESSION_EXPIRATION_DELTA", 2419200)  # four weeks
     )
+    # only persist a refreshed expiresAt once this fraction of the
+    # expiration window has passed (deferred and written in batches)
+    SESSION_COALESCE_WRITES = (
+        int(os.environ.get("SESSION_COALESCE_WRITES", 0))
+    ) == 1
+    SESSION_REFRESH_THRESHOLD = float(
+        os.environ.get("SESSION_REFRESH_THRESHOLD", 0.05)
+    )
+    SESSION_FLUSH_INTERVAL = float(
+        os.environ.get("SESSION_FLUSH_INTERVAL", 5)
+    )
+    SESSION_SWEEP_INTERVAL = float(
+        os.environ.get("SESSION_SWEEP_INTERVAL", 3600)
+    )
+    SESSION_SWEEP_BATCH_SIZE = int(
+        os.environ.get("SESSION_SWEEP_BATCH_SIZE", 100)
+    )
+    SESSION_SWEEP_BATCH_DELAY = float(
+        os.environ.get("SESSION_SWEEP_BATCH_DELAY", 0.1)
+    )
+    SESSION_SWEEP_LOCK_FILE = (
+        Path(os.environ["SESSION_SWEEP_LOCK_FILE"])
+        if "SESSION_SWEEP_LOCK_FILE" in os.environ
+        else None
+    )
+    # signed sessions carry all data for authentication in the cookie;
+    # the session-db is only consulted for re-validation
+    SESSION_SIGNED = (int(os.environ.get("SESSION_SIGNED", 0))) == 1
+    SESSION_SIGNED_REVALIDATE = float(
+        os.environ.get("SESSION_SIGNED_REVALIDATE", 60)
+    )
+    SESSION_REVOCATION_FILE = (
+        Path(os.environ["SESSION_REVOCATION_FILE"])
+        if "SESSION_REVOCATION_FILE" in os.environ
+        else None
+    )
     SESSION_DISABLE_USER_CACHING = (
         int(os.environ.get("SESSION_DISABLE_USER_CACHING", 0))
     ) == 1
+    USER_CACHE_MAXSIZE = int(os.environ.get("USER_CACHE_MAXSIZE", 1024))
+    USER_CACHE_MAX_AGE = float(os.environ.get("USER_CACHE_MAX_AGE", 60))
+    # this store caches user-configurations (can be shared between
+    # workers; requires USER_CACHE_INVALIDATION_FILE in that case)
+    USER_CACHE_DB_ADAPTER = os.environ.get("USER_CACHE_DB_ADAPTER")
+    USER_CACHE_DB_SETTINGS = (
+        json.loads(os.environ["USER_CACHE_DB_SETTINGS"])
+        if "USER_CACHE_DB_SETTINGS" in os.environ
+        else None
+    )
+    USER_CACHE_INVALIDATION_FILE = (
+        Path(os.environ["USER_CACHE_INVALIDATION_FILE"])
+        if "USER_CACHE_INVALIDATION_FILE" in os.environ
+        else None
+    )
+    SESSION_KEY_CACHE_MAXSIZE = int(
+        os.environ.get("SESSION_KEY_CACHE_MAXSIZE", 10000)
+    )
+    SESSION_KEY_CACHE_TTL = float(
+        os.environ.get("SESSION_KEY_CACHE_TTL", 3600)
+    )
+    SESSION_NEGATIVE_CACHE_TTL = float(
+        os.environ.get("SESSION_NEGATIVE_CACHE_TTL", 10)
+    )
 
     # ------ REQUESTS TO OAI-REPOSITORIES ------
     OAI_TIMEOUT = int(os.environ.get("OAI_TIMEOUT") or 60)
     OAI_MAX_RESUMPTION_TOKENS = int(
         os.environ.get("OAI_MAX_RESUMPTION_TOKENS") or 5
     )
+    # cached responses (per operation); stale responses are served
+    # while being refreshed in the background
+    OAI_CACHE_MAXSIZE = int(os.environ.get("OAI_CACHE_MAXSIZE", 128))
+    OAI_CACHE_TTL = float(os.environ.get("OAI_CACHE_TTL", 3600))
+    OAI_CACHE_MAX_STALE = float(os.environ.get("OAI_CACHE_MAX_STALE", 86400))
+    OAI_CACHE_REFRESH_WORKERS = int(
+        os.environ.get("OAI_CACHE_REFRESH_WORKERS", 2)
+    )
+    # asynchronous requests (see query-parameter 'async')
+    OAI_PROBE_WORKERS = int(os.environ.get("OAI_PROBE_WORKERS", 4))
+    OAI_PROBE_MAX_PENDING = int(os.environ.get("OAI_PROBE_MAX_PENDING", 32))
+    OAI_PROBE_TTL = float(os.environ.get("OAI_PROBE_TTL", 600))
 
     # ------ PERMISSIONS ------
     TEST_PERMISSIONS_SIMPLE: Optional[Rule] = None  # used in testing
@@ -285,19 +375,109 @@ class AppConfig(BaseConfig):
         },
     }
 
+    # ------ JOB-STATUS ------
+    # shared polling of job-status for event-streams (see
+    # `JobStatusBroker`)
+    JOB_STATUS_POLL_INTERVAL = float(
+        os.environ.get("JOB_STATUS_POLL_INTERVAL", 1.0)
+    )
+    JOB_STATUS_KEEPALIVE = float(os.environ.get("JOB_STATUS_KEEPALIVE", 15.0))
+    JOB_STATUS_STREAM_DURATION = float(
+        os.environ.get("JOB_STATUS_STREAM_DURATION", 300.0)
+    )
+
+    # ------ WORKSPACE-INDEX ------
+    # caches relations of resources to workspaces for enforcing
+    # workspace-rules (see `WorkspaceIndex`)
+    WORKSPACE_INDEX_TTL = float(os.environ.get("WORKSPACE_INDEX_TTL", 60))
+    WORKSPACE_INDEX_MAXSIZE = int(
+        os.environ.get("WORKSPACE_INDEX_MAXSIZE", 10000)
+    )
+
     # ------ DCM-BACKEND ------
     BACKEND_HOST = os.environ.get("BACKEND_HOST") or "http://localhost:8086"
     BACKEND_TIMEOUT = float(os.environ.get("BACKEND_TIMEOUT", 10.0))
+    # concurrent requests (e.g. when fetching lists of resources)
+    BACKEND_MAX_CONCURRENCY = int(
+        os.environ.get("BACKEND_MAX_CONCURRENCY", 8)
+    )
+    BACKEND_BATCH_DEADLINE = float(
+        os.environ.get("BACKEND_BATCH_DEADLINE", 30.0)
+    )
+    # per-request instrumentation of backend calls
+    BACKEND_CALLS_SERVER_TIMING = (
+        int(os.environ.get("BACKEND_CALLS_SERVER_TIMING", 1))
+    ) == 1
+    BACKEND_CALLS_HEADER = (
+        int(os.environ.get("BACKEND_CALLS_HEADER", 0))
+    ) == 1
+    BACKEND_CALLS_LOG_THRESHOLD = int(
+        os.environ.get("BACKEND_CALLS_LOG_THRESHOLD", 0)
+    )
+    # connection pool (shared by all requests to the backend)
+    BACKEND_POOL_NUM_POOLS = int(os.environ.get("BACKEND_POOL_NUM_POOLS", 4))
+    BACKEND_POOL_MAXSIZE = int(os.environ.get("BACKEND_POOL_MAXSIZE", 16))
+    BACKEND_POOL_BLOCK = int(os.environ.get("BACKEND_POOL_BLOCK", 0)) == 1
+    BACKEND_POOL_KEEPALIVE = float(
+        os.environ.get("BACKEND_POOL_KEEPALIVE", 60)
+    )
+    BACKEND_POOL_IDLE_TIMEOUT = float(
+        os.environ.get("BACKEND_POOL_IDLE_TIMEOUT", 300)
+    )
+    # endpoints (view-function names) that forward the backend's
+    # response body without deserializing and re-serializing
+    BACKEND_PASSTHROUGH = set(
+        filter(
+            None,
+            os.environ.get(
+                "BACKEND_PASSTHROUGH",
+                "get_job_info,get_job_ies,get_job_ie,get_bundle_job_report,"
+                + "list_hotfolder_directories",
+            ).split(","),
+        )
+    )
 
     def __init__(self) -> None:
-        self.sessions = util.load_adapter(
-            "sessions",
-            self.SESSION_DB_ADAPTER or "native",
-            self.SESSION_DB_SETTINGS or {"backend": "memory"},
+        # shared by all concurrent requests to the backend (bounds the
+        # total number of threads)
+        self.backend_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.BACKEND_MAX_CONCURRENCY),
+            thread_name_prefix="call-backend",
+        )
+        self.sessions = SessionStore(
+            util.load_adapter(
+                "sessions",
+                self.SESSION_DB_ADAPTER or "native",
+                self.SESSION_DB_SETTINGS or {"backend": "memory"},
+            ),
+            flush_interval=self.SESSION_FLUSH_INTERVAL,
+        )
+        self.session_signer = SessionSigner(
+            self.SECRET_KEY,
+            max_age=self.SESSION_EXPIRATION_DELTA,
+            revalidate_after=self.SESSION_SIGNED_REVALIDATE,
+            maxsize=self.SESSION_KEY_CACHE_MAXSIZE,
+            channel=(
+                None
+                if self.SESSION_REVOCATION_FILE is None
+                else InvalidationChannel(self.SESSION_REVOCATION_FILE)
+            ),
         )
         if not self.SESSION_DISABLE_USER_CACHING:
-            self.user_configs = util.load_adapter(
-                "user_configs", "native", {"backend": "memory"}
+            self.user_configs = UserCache(
+                util.load_adapter(
+                    "user_configs",
+                    self.USER_CACHE_DB_ADAPTER or "native",
+                    self.USER_CACHE_DB_SETTINGS or {"backend": "memory"},
+                ),
+                maxsize=self.USER_CACHE_MAXSIZE,
+                channel=(
+                    None
+                    if self.USER_CACHE_INVALIDATION_FILE is None
+                    else InvalidationChannel(
+                        self.USER_CACHE_INVALIDATION_FILE
+                    )
+                ),
             )
 
         try:
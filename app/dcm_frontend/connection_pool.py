@@ -0,0 +1,204 @@
+"""
+Shared connection-pool for all requests from the frontend-app to the
+dcm-backend.
+"""
+
+from typing import Optional
+import socket
+import threading
+from time import monotonic
+
+import urllib3
+from urllib3.connection import HTTPConnection
+import requests
+from requests.adapters import HTTPAdapter
+import dcm_backend_sdk
+
+
+class IdleEvictingPoolManager(urllib3.PoolManager):
+    """
+    `urllib3.PoolManager` that discards all pooled connections once it
+    has been idle for longer than `idle_timeout` seconds. This prevents
+    re-using keep-alive connections that have likely been closed by the
+    server (or some proxy) in the meantime.
+
+    Keyword arguments:
+    idle_timeout -- idle duration in seconds after which pooled
+                    connections are discarded; values of `None` or
+                    below or equal to zero disable eviction
+                    (default None)
+    """
+
+    def __init__(
+        self, *args, idle_timeout: Optional[float] = None, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.idle_timeout = idle_timeout
+        self.evictions = 0
+        self._last_used = monotonic()
+        self._eviction_lock = threading.Lock()
+
+    def evict_idle(self) -> bool:
+        """
+        Discards pooled connections if idle for too long. Returns `True`
+        if connections have been discarded.
+        """
+        if self.idle_timeout is None or self.idle_timeout <= 0:
+            return False
+        with self._eviction_lock:
+            if monotonic() - self._last_used <= self.idle_timeout:
+                return False
+            self.clear()
+            self.evictions += 1
+            self._last_used = monotonic()
+        return True
+
+    def connection_from_host(self, *args, **kwargs):
+        # used by both `urlopen` and `requests`' `HTTPAdapter`
+        self.evict_idle()
+        self._last_used = monotonic()
+        return super().connection_from_host(*args, **kwargs)
+
+    def stats(self) -> dict:
+        """Returns statistics for this pool-manager as JSON."""
+        pools = []
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is None:
+                continue
+            # the queue is pre-filled with `None`-placeholders
+            queue = pool.pool
+            idle = (
+                0
+                if queue is None
+                else sum(1 for conn in list(queue.queue) if conn is not None)
+            )
+            pools.append(
+                {
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "maxsize": 0 if queue is None else queue.maxsize,
+                    "connectionsCreated": pool.num_connections,
+                    "requests": pool.num_requests,
+                    "idle": idle,
+                }
+            )
+        return {"evictions": self.evictions, "pools": pools}
+
+
+class _PoolAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` that uses an existing (shared) `IdleEvictingPoolManager`
+    instead of creating its own.
+
+    Keyword arguments:
+    pool_manager -- pool-manager that is used for all requests
+    """
+
+    def __init__(
+        self, pool_manager: IdleEvictingPoolManager, **kwargs
+    ) -> None:
+        # needs to be set before calling super since that runs
+        # `init_poolmanager`
+        self._shared_pool_manager = pool_manager
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections, maxsize, block=False, **pool_kwargs
+    ):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = self._shared_pool_manager
+
+
+class ConnectionPool:
+    """
+    Connection-pool that is shared by all dcm-backend-SDK APIs (via
+    `api_client`) and raw http-requests (via `session`). Both use the
+    same `IdleEvictingPoolManager`, i.e., connection-limits apply to
+    the sum of both kinds of requests.
+
+    Keyword arguments:
+    host -- dcm-backend host address
+    num_pools -- number of per-host pools that are kept
+                 (default 4)
+    maxsize -- maximum number of reusable connections per host
+               (default 16)
+    block -- whether to block (instead of creating a throw-away
+             connection) if all connections for a host are in use
+             (default False)
+    keepalive -- idle time in seconds before TCP keep-alive probes are
+                 sent on pooled connections; values below or equal to
+                 zero disable TCP keep-alive
+                 (default 60)
+    idle_timeout -- idle time in seconds after which all pooled
+                    connections are discarded; values below or equal to
+                    zero disable eviction
+                    (default 300)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        num_pools: int = 4,
+        maxsize: int = 16,
+        block: bool = False,
+        keepalive: float = 60,
+        idle_timeout: float = 300,
+    ) -> None:
+        self.host = host
+        socket_options = self._get_socket_options(keepalive)
+
+        # SDK-client
+        configuration = dcm_backend_sdk.Configuration(host=host)
+        configuration.connection_pool_maxsize = maxsize
+        configuration.socket_options = socket_options
+        self.api_client = dcm_backend_sdk.ApiClient(configuration)
+        # replace the generated pool-manager while keeping the
+        # connection-settings derived from `configuration`
+        rest_client = self.api_client.rest_client
+        rest_client.pool_manager = IdleEvictingPoolManager(
+            num_pools=num_pools,
+            block=block,
+            idle_timeout=idle_timeout,
+            **rest_client.pool_manager.connection_pool_kw,
+        )
+
+        # raw requests (e.g. streaming of artifacts)
+        self.session = requests.Session()
+        self._adapter = _PoolAdapter(
+            rest_client.pool_manager,
+            pool_connections=num_pools,
+            pool_maxsize=maxsize,
+            pool_block=block,
+        )
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    @staticmethod
+    def _get_socket_options(keepalive: float) -> Optional[list]:
+        """Returns socket-options for TCP keep-alive (if enabled)."""
+        if keepalive <= 0:
+            return None
+        options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        # platform-specific
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, int(keepalive))
+            )
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+            options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, int(keepalive))
+            )
+        return options
+
+    def stats(self) -> dict:
+        """Returns pool-statistics as JSON."""
+        return self.api_client.rest_client.pool_manager.stats()
+
+    def clear(self) -> None:
+        """Closes all pooled connections."""
+        self.api_client.rest_client.pool_manager.clear()
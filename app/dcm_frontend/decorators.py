@@ -1,11 +1,12 @@
 """Decorator definitions"""
 
 from functools import wraps
+from hashlib import sha256
 
-from flask import Response
+from flask import Response, request, make_response
 from flask_login import current_user as current_session
 
-from dcm_frontend.models import Rule, SimpleRule, WorkspaceRule
+from dcm_frontend.models import Rule, compile_rules
 
 
 def requires_permission(*rules: Rule):
@@ -17,12 +18,12 @@ def requires_permission(*rules: Rule):
     time of execution.
     """
 
+    compiled_rules = compile_rules(rules)
+
     def decorator(func):
         @wraps(func)
         def decorated_view(*args, **kwargs):
-            if not any(
-                rule.has_permission(current_session.user) for rule in rules
-            ):
+            if not compiled_rules.has_permission(current_session.user):
                 return Response("Forbidden", mimetype="text/plain", status=403)
             return func(*args, **kwargs)
 
@@ -33,50 +34,50 @@ def requires_permission(*rules: Rule):
 
 def generate_workspaces(*rules: Rule):
     """
-    Generates a list of (unique) authorized workspace-ids based on user
+    Generates a set of (unique) authorized workspace-ids based on user
     group memberships (for `current_user`) or `None` if any is valid.
 
     Note that the returned decorator expects a valid `current_user` at
     time of execution.
     """
 
+    compiled_rules = compile_rules(rules)
+
     def decorator(func):
         @wraps(func)
         def decorated_view(*args, **kwargs):
-            current_user = current_session.user
-            # check whether simple rule applies
-            srules = filter(  # filter for relevant rules
-                lambda r: isinstance(r, SimpleRule)
-                and r.has_permission(current_user),
-                rules,
+            return func(
+                *args,
+                workspaces=compiled_rules.workspaces(current_session.user),
+                **kwargs,
             )
-            if len(list(srules)) > 0:
-                workspaces = None
-            else:
-                # check whether workspace rules apply
-                wrules_gids = list(
-                    map(
-                        lambda r: r.group_id,
-                        filter(  # filter for relevant rules
-                            lambda r: isinstance(r, WorkspaceRule)
-                            and r.has_permission(current_user),
-                            rules,
-                        ),
-                    )
-                )
-                workspaces = set(
-                    map(
-                        lambda g: g.workspace,
-                        filter(  # filter for relevant groups
-                            lambda g: g.id_ in wrules_gids
-                            and g.workspace is not None,
-                            current_user.groups,
-                        ),
-                    )
-                )
-
-            return func(*args, workspaces=workspaces, **kwargs)
 
         return decorated_view
 
     return decorator
+
+
+def conditional_response(func):
+    """
+    Adds a strong ETag (based on the response body, if not already set)
+    to successful responses of the decorated view and responds with 304
+    if it matches the request's 'If-None-Match'-header.
+
+    Streamed responses are returned unchanged.
+    """
+
+    @wraps(func)
+    def decorated_view(*args, **kwargs):
+        response = make_response(func(*args, **kwargs))
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+        ):
+            return response
+        if response.get_etag()[0] is None:
+            response.set_etag(sha256(response.get_data()).hexdigest())
+        return response.make_conditional(request)
+
+    return decorated_view
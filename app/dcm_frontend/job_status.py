@@ -0,0 +1,246 @@
+"""
+Shared polling of job-status information from the backend for multiple
+subscribers (e.g. Server-Sent-Event-streams).
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import sys
+import threading
+from queue import Queue
+
+from dcm_backend_sdk import ConfigApi, JobApi
+
+from dcm_frontend.config import AppConfig
+from dcm_frontend.util import call_backend_many
+from dcm_frontend.workspace_index import WorkspaceIndex
+
+
+# job info-keys that make up a job's status
+JOB_STATUS_KEYS = ["status", "datetimeStarted", "triggerType"]
+
+
+@dataclass
+class Subscription:
+    """
+    Record of a subscription to job-status changes.
+
+    Keyword arguments:
+    job_config_ids -- job-configurations for which the status of the
+                      latest execution should be reported
+    tokens -- jobs for which the status should be reported
+    queue -- queue of status-events
+    """
+
+    job_config_ids: set[str] = field(default_factory=set)
+    tokens: set[str] = field(default_factory=set)
+    queue: Queue = field(default_factory=Queue)
+    # latest event per job-config id/token that has been queued
+    last: dict[str, dict] = field(default_factory=dict)
+
+    def push(self, key: str, event: dict) -> None:
+        """Queues `event` if it differs from the previous one."""
+        if self.last.get(key) == event:
+            return
+        self.last[key] = event
+        self.queue.put(event)
+
+
+class JobStatusBroker:
+    """
+    Polls the job-status for all job-configurations and job-tokens that
+    are subscribed to and pushes changes to the subscribers. Every
+    job-configuration and token is polled only once per interval,
+    regardless of the number of subscribers.
+
+    The polling runs in a background-thread that is started with the
+    first subscription and stops when the last subscription has been
+    removed.
+
+    Keyword arguments:
+    config -- app-configuration
+    backend_config_api -- backend-SDK config-API
+    backend_job_api -- backend-SDK job-API
+    workspace_index -- index that is updated with fetched job-
+                       configurations
+                       (default None)
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        backend_config_api: ConfigApi,
+        backend_job_api: JobApi,
+        workspace_index: Optional[WorkspaceIndex] = None,
+    ) -> None:
+        self.config = config
+        self.backend_config_api = backend_config_api
+        self.backend_job_api = backend_job_api
+        self.workspace_index = workspace_index
+        self._subscriptions: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.failed_polls = 0
+
+    def fetch(
+        self,
+        job_config_ids: Iterable[str] = (),
+        tokens: Iterable[str] = (),
+        workspaces: Optional[Iterable[str]] = None,
+    ) -> tuple[dict[str, Optional[str]], dict[str, Optional[dict]]]:
+        """
+        Fetches the latest executions of `job_config_ids` and the status
+        of all involved jobs (from `tokens` and latest executions)
+        concurrently.
+
+        Returns a tuple of
+        * mapping of job-configuration ids to their latest execution's
+          token (`None` if not executed yet) and
+        * mapping of tokens to their status (`None` if unavailable).
+        Job-configurations that could not be fetched or that are not
+        associated with one of `workspaces` (if not `None`) are omitted.
+        """
+        job_config_ids = list(job_config_ids)
+        latest_execs = {}
+        for job_config_id, response in zip(
+            job_config_ids,
+            call_backend_many(
+                [
+                    {
+                        "endpoint": (
+                            self.backend_config_api.get_job_config_with_http_info
+                        ),
+                        "args": (job_config_id,),
+                    }
+                    for job_config_id in job_config_ids
+                ],
+                request_timeout=self.config.BACKEND_TIMEOUT,
+                executor=self.config.backend_executor,
+                deadline=self.config.BACKEND_BATCH_DEADLINE,
+            ),
+        ):
+            if response.status_code != 200:
+                continue
+            if self.workspace_index is not None:
+                self.workspace_index.set(
+                    WorkspaceIndex.JOB_CONFIG,
+                    job_config_id,
+                    response.data.workspace_id,
+                )
+            if (
+                workspaces is not None
+                and response.data.workspace_id not in workspaces
+            ):
+                continue
+            latest_execs[job_config_id] = response.data.to_dict().get(
+                "latestExec"
+            )
+
+        tokens = list(
+            dict.fromkeys(
+                list(tokens)
+                + [token for token in latest_execs.values() if token]
+            )
+        )
+        infos = {}
+        for token, response in zip(
+            tokens,
+            call_backend_many(
+                [
+                    {
+                        "endpoint": (
+                            self.backend_job_api.get_job_info_with_http_info
+                        ),
+                        "args": (token, ",".join(JOB_STATUS_KEYS)),
+                    }
+                    for token in tokens
+                ],
+                request_timeout=self.config.BACKEND_TIMEOUT,
+                executor=self.config.backend_executor,
+                deadline=self.config.BACKEND_BATCH_DEADLINE,
+            ),
+        ):
+            if response.status_code != 200:
+                infos[token] = None
+                continue
+            info = response.data.to_dict()
+            infos[token] = {key: info.get(key) for key in JOB_STATUS_KEYS}
+        return latest_execs, infos
+
+    def subscribe(
+        self,
+        job_config_ids: Iterable[str] = (),
+        tokens: Iterable[str] = (),
+    ) -> Subscription:
+        """Returns a new (active) `Subscription`."""
+        subscription = Subscription(set(job_config_ids), set(tokens))
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="job-status-broker"
+                )
+                self._thread.start()
+        # poll immediately to provide initial state
+        self._wakeup.set()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes `subscription`."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    @property
+    def subscriptions(self) -> int:
+        """Returns current number of subscriptions."""
+        return len(self._subscriptions)
+
+    def _run(self) -> None:
+        """Polling-loop."""
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+                subscriptions = self._subscriptions.copy()
+
+            try:
+                self._poll(subscriptions)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                self.failed_polls += 1
+                print(
+                    f"Failed to poll job-status: {exc_info}",
+                    file=sys.stderr,
+                )
+
+            self._wakeup.wait(self.config.JOB_STATUS_POLL_INTERVAL)
+
+    def _poll(self, subscriptions: list[Subscription]) -> None:
+        """Runs a single poll for `subscriptions`."""
+        latest_execs, infos = self.fetch(
+            set().union(*(s.job_config_ids for s in subscriptions)),
+            set().union(*(s.tokens for s in subscriptions)),
+        )
+        for subscription in subscriptions:
+            for job_config_id in subscription.job_config_ids:
+                if job_config_id not in latest_execs:
+                    continue
+                token = latest_execs[job_config_id]
+                subscription.push(
+                    job_config_id,
+                    {
+                        "jobConfigId": job_config_id,
+                        "token": token,
+                        "info": infos.get(token) if token else None,
+                    },
+                )
+            for token in subscription.tokens:
+                subscription.push(
+                    token, {"token": token, "info": infos.get(token)}
+                )
+
@@ -0,0 +1,103 @@
+"""
+JSON-providers for the frontend-app (see `JSON_PROVIDER`-setting).
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider, _default
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _serialize_model(o: BaseModel) -> Any:
+    """
+    Returns JSON-compatible representation of a pydantic-model.
+    Backend-SDK-models are serialized via their `to_dict` since that
+    handles additional properties and explicit `None`-values.
+    """
+    if hasattr(o, "to_dict"):
+        return o.to_dict()
+    return o.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def _pydantic_default(o: Any) -> Any:
+    """
+    Extends flask's default-serialization by support for pydantic-
+    models.
+    """
+    if isinstance(o, BaseModel):
+        return _serialize_model(o)
+    return _default(o)
+
+
+class JSONProvider(DefaultJSONProvider):
+    """
+    Flask's default JSON-provider (based on `json`) with additional
+    support for pydantic-models.
+    """
+
+    default = staticmethod(_pydantic_default)
+
+
+class FastJSONProvider(JSONProvider):
+    """
+    JSON-provider based on `orjson` (falls back to `JSONProvider` if
+    not installed).
+
+    Differences to flask's default-provider:
+    * keys are not sorted (`sort_keys`),
+    * non-ASCII characters are not escaped,
+    * `datetime.datetime` and `datetime.date` are serialized in ISO-
+      format (instead of RFC 822), and
+    * pydantic-models are supported; top-level (non-SDK-)models are
+      serialized directly by pydantic without intermediate `dict`.
+
+    Calls with additional keyword arguments for `json.dumps`/
+    `json.loads` are delegated to the `json`-based implementation.
+    """
+
+    sort_keys = False
+    ensure_ascii = False
+
+    def _dumps(self, obj: Any, indent: bool = False) -> bytes:
+        """Serializes `obj` to UTF-8-encoded JSON."""
+        if isinstance(obj, BaseModel) and not hasattr(obj, "to_dict"):
+            return obj.model_dump_json(
+                by_alias=True, exclude_none=True, indent=2 if indent else None
+            ).encode(encoding="utf-8")
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_pydantic_default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._dumps(obj).decode(encoding="utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._dumps(
+                obj,
+                indent=(
+                    (self.compact is None and self._app.debug)
+                    or self.compact is False
+                ),
+            )
+            + b"\n",
+            mimetype=self.mimetype,
+        )
@@ -0,0 +1,237 @@
+"""
+Collection of app-metrics and export in the Prometheus text-format.
+"""
+
+from typing import Callable
+from collections.abc import Iterable
+from bisect import bisect_left
+import threading
+from time import perf_counter
+
+from flask import Flask, Response, g, request
+
+from dcm_frontend.util import backend_call_hooks, proxied_streams
+
+
+# metric family: name, type, help-text, and samples (triples of sample
+# name, labels, and value)
+MetricFamily = tuple[
+    str, str, str, list[tuple[str, dict[str, str], float]]
+]
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Returns `labels` formatted for the Prometheus text-format."""
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            f'{name}="'
+            + str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            + '"'
+            for name, value in labels.items()
+        )
+        + "}"
+    )
+
+
+def _format_value(value: float) -> str:
+    """Returns `value` formatted for the Prometheus text-format."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(families: Iterable[MetricFamily]) -> str:
+    """Returns `families` in the Prometheus text-format."""
+    lines = []
+    for name, type_, help_, samples in families:
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} {type_}")
+        for sample, labels, value in samples:
+            lines.append(
+                f"{sample}{_format_labels(labels)} {_format_value(value)}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed buckets (upper bounds) per
+    combination of label values.
+
+    Keyword arguments:
+    name -- metric name
+    help_ -- help-text
+    labelnames -- names of labels
+    buckets -- sorted upper bounds of buckets
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_: str,
+        labelnames: Iterable[str],
+        buckets: Iterable[float],
+    ) -> None:
+        self.name = name
+        self.help = help_
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # label values -> (bucket counts, sum)
+        self._data: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Adds observation `value` for the given label values."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._data.get(
+                labelvalues, ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            counts[index] += 1
+            self._data[labelvalues] = (counts, total + value)
+
+    def collect(self) -> MetricFamily:
+        """Returns current state as `MetricFamily`."""
+        samples = []
+        with self._lock:
+            data = [
+                (labelvalues, list(counts), total)
+                for labelvalues, (counts, total) in self._data.items()
+            ]
+        for labelvalues, counts, total in data:
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        labels | {"le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return self.name, "histogram", self.help, samples
+
+
+class Metrics:
+    """
+    Registry for app-metrics.
+
+    It records the duration of requests (per blueprint and view; see
+    `init_app`), calls to the backend while handling requests (per
+    SDK-method), and proxied response-bodies. Further metrics can be
+    provided by collectors (see `add_collector`).
+
+    Keyword arguments:
+    buckets -- upper bounds in seconds of the histogram-buckets
+               (default `Metrics.BUCKETS`)
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, buckets: Iterable[float] = BUCKETS) -> None:
+        buckets = tuple(buckets)
+        self.requests = Histogram(
+            "dcm_frontend_request_duration_seconds",
+            "Duration of requests until the response is returned by the"
+            + " app (excluding streamed bodies).",
+            ("blueprint", "endpoint"),
+            buckets,
+        )
+        self.backend_calls = Histogram(
+            "dcm_frontend_backend_call_duration_seconds",
+            "Duration of requests to the Backend-service.",
+            ("method",),
+            buckets,
+        )
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = [
+            self._collect_streams
+        ]
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers request-handlers with `app` which also hook into
+        calls to the backend that are made while handling a request.
+        """
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.teardown_request(self.teardown_request)
+
+    def before_request(self) -> None:
+        """Starts timing the current request."""
+        g.metrics_start = perf_counter()
+        backend_call_hooks.set((self.observe_backend_call,))
+
+    def teardown_request(self, *args) -> None:
+        """Stops observing calls to the backend."""
+        backend_call_hooks.set(())
+
+    def after_request(self, response: Response) -> Response:
+        """Records duration of the current request."""
+        start = g.pop("metrics_start", None)
+        if start is not None:
+            self.requests.observe(
+                perf_counter() - start,
+                request.blueprint or "",
+                request.endpoint or "",
+            )
+        return response
+
+    def observe_backend_call(self, method: str, duration: float) -> None:
+        """Records call to the backend."""
+        self.backend_calls.observe(duration, method)
+
+    def add_collector(
+        self, collector: Callable[[], Iterable[MetricFamily]]
+    ) -> None:
+        """
+        Adds `collector` which is called on every export and should
+        return an iterable of `MetricFamily`.
+        """
+        self._collectors.append(collector)
+
+    @staticmethod
+    def _collect_streams() -> list[MetricFamily]:
+        stats = proxied_streams.stats()
+        return [
+            (
+                "dcm_frontend_proxied_streams_active",
+                "gauge",
+                "Number of response-bodies currently proxied from the"
+                + " backend.",
+                [("dcm_frontend_proxied_streams_active", {}, stats["active"])],
+            ),
+            (
+                "dcm_frontend_proxied_streams_total",
+                "counter",
+                "Number of response-bodies proxied from the backend.",
+                [("dcm_frontend_proxied_streams_total", {}, stats["total"])],
+            ),
+            (
+                "dcm_frontend_proxied_bytes_total",
+                "counter",
+                "Number of bytes proxied from the backend.",
+                [("dcm_frontend_proxied_bytes_total", {}, stats["bytes"])],
+            ),
+        ]
+
+    def collect(self) -> list[MetricFamily]:
+        """Returns all metrics as list of `MetricFamily`."""
+        families = [self.requests.collect(), self.backend_calls.collect()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text-format."""
+        return render(self.collect())
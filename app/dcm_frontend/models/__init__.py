@@ -1,5 +1,13 @@
 from .user import GroupMembership, User, Session
-from .acl import Rule, SimpleRule, WorkspaceRule, GroupInfo, ACL
+from .acl import (
+    Rule,
+    SimpleRule,
+    WorkspaceRule,
+    CompiledRules,
+    compile_rules,
+    GroupInfo,
+    ACL,
+)
 
 
 __all__ = [
@@ -9,6 +17,8 @@ __all__ = [
     "Rule",
     "SimpleRule",
     "WorkspaceRule",
+    "CompiledRules",
+    "compile_rules",
     "GroupInfo",
     "ACL",
 ]
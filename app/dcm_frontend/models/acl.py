@@ -7,7 +7,7 @@ import abc
 
 from dcm_common.models import DataModel, JSONObject
 
-from dcm_frontend.models import User
+from dcm_frontend.models.user import User, group_bit
 
 
 class Rule(DataModel):
@@ -104,7 +104,7 @@ class SimpleRule(Rule):
     TYPE = "simple"
 
     def _has_permission(self, user: User):
-        return any(group.id_ == self.group_id for group in user.groups)
+        return bool(user.group_mask & group_bit(self.group_id))
 
 
 class WorkspaceRule(Rule):
@@ -116,10 +116,95 @@ class WorkspaceRule(Rule):
     TYPE = "workspace"
 
     def _has_permission(self, user: User):
-        return any(
-            group.id_ == self.group_id and group.workspace is not None
-            for group in user.groups
-        )
+        return bool(user.workspace_group_mask & group_bit(self.group_id))
+
+
+class CompiledRules:
+    """
+    Precompiled collection of `Rule`s for fast permission-checks.
+
+    `SimpleRule`s and `WorkspaceRule`s are combined into group-bitsets
+    that are matched against the `User`'s precomputed bitsets. Other
+    rule-types (including subclasses of the above) are evaluated
+    individually. Authorized workspaces are cached in
+    `User.permission_cache`.
+
+    Keyword arguments:
+    rules -- access-rules
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = tuple(rules)
+        self.simple_mask = 0
+        self.workspace_mask = 0
+        custom = []
+        for rule in self.rules:
+            # pylint: disable=unidiomatic-typecheck
+            if type(rule) is SimpleRule:
+                self.simple_mask |= group_bit(rule.group_id)
+            elif type(rule) is WorkspaceRule:
+                self.workspace_mask |= group_bit(rule.group_id)
+            else:
+                custom.append(rule)
+        self.custom = tuple(custom)
+
+    def has_permission(self, user: User) -> bool:
+        """
+        Returns `True` if the given `user` satisfies any of the rules.
+        """
+        return bool(
+            user.group_mask & self.simple_mask
+            or user.workspace_group_mask & self.workspace_mask
+        ) or any(rule.has_permission(user) for rule in self.custom)
+
+    def workspaces(self, user: User) -> Optional[frozenset[str]]:
+        """
+        Returns the (unique) authorized workspace-ids for `user` or
+        `None` if any workspace is valid (i.e. if a `SimpleRule`
+        applies).
+        """
+        key = (self, "workspaces")
+        if key in user.permission_cache:
+            return user.permission_cache[key]
+
+        if user.group_mask & self.simple_mask or any(
+            isinstance(rule, SimpleRule) and rule.has_permission(user)
+            for rule in self.custom
+        ):
+            workspaces = None
+        else:
+            group_ids = {
+                rule.group_id
+                for rule in self.custom
+                if isinstance(rule, WorkspaceRule)
+                and rule.has_permission(user)
+            }
+            workspaces = frozenset(
+                workspace
+                for group_id, workspaces_ in user.workspaces_by_group.items()
+                if group_bit(group_id) & self.workspace_mask
+                or group_id in group_ids
+                for workspace in workspaces_
+            )
+        user.permission_cache[key] = workspaces
+        return workspaces
+
+
+# compiled rules per (identical) list of rules; the compiled object
+# references the rules such that ids remain unique while cached
+_COMPILED_RULES: dict[tuple[int, ...], CompiledRules] = {}
+
+
+def compile_rules(rules: Iterable[Rule]) -> CompiledRules:
+    """Returns (cached) `CompiledRules` for `rules`."""
+    rules = tuple(rules)
+    key = tuple(map(id, rules))
+    compiled = _COMPILED_RULES.get(key)
+    if compiled is None:
+        if len(_COMPILED_RULES) >= 1024:
+            _COMPILED_RULES.clear()
+        compiled = _COMPILED_RULES.setdefault(key, CompiledRules(rules))
+    return compiled
 
 
 @dataclass
@@ -194,14 +279,7 @@ class ACL(DataModel):
     def reduce(self, user: User) -> JSONObject:
         """Returns permission-table as JSON."""
         return {
-            k: any(
-                # match any workspace
-                self.has_permission(
-                    rules,
-                    user,
-                )
-                for group in user.groups
-            )
+            k: compile_rules(rules).has_permission(user)
             for k, rules in self.__dict__.items()
             if isinstance(rules, list)
             and all(isinstance(rule, Rule) for rule in rules)
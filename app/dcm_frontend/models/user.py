@@ -1,12 +1,30 @@
 """User class definition"""
 
-from typing import Optional
+from typing import Optional, Any
 from dataclasses import dataclass
+import threading
 
 from flask_login import UserMixin
 from dcm_common.models import DataModel
 
 
+_GROUP_BITS: dict[str, int] = {}
+_GROUP_BITS_LOCK = threading.Lock()
+
+
+def group_bit(group_id: str) -> int:
+    """
+    Returns the bit (as integer) that represents `group_id` in
+    group-bitsets. Bits are assigned on first use and remain stable for
+    the lifetime of the process.
+    """
+    bit = _GROUP_BITS.get(group_id)
+    if bit is None:
+        with _GROUP_BITS_LOCK:
+            bit = _GROUP_BITS.setdefault(group_id, 1 << len(_GROUP_BITS))
+    return bit
+
+
 @dataclass
 class GroupMembership(DataModel):
     """GroupMembership data model."""
@@ -35,11 +53,33 @@ class User:
         self.update_groups()
 
     def update_groups(self) -> None:
-        """Updates group from stored config."""
+        """
+        Updates group from stored config.
+
+        This also precomputes the bitsets
+        * `group_mask` (all groups) and
+        * `workspace_group_mask` (groups with workspace)
+        as well as the mapping `workspaces_by_group` of group ids to
+        workspace ids that are used for permission-checks (see
+        `CompiledRules`).
+        """
         self.groups = [
             GroupMembership.from_json(group)
             for group in self.config.get("groups", [])
         ]
+        self.group_mask = 0
+        self.workspace_group_mask = 0
+        self.workspaces_by_group: dict[str, set[str]] = {}
+        for group in self.groups:
+            bit = group_bit(group.id_)
+            self.group_mask |= bit
+            if group.workspace is not None:
+                self.workspace_group_mask |= bit
+                self.workspaces_by_group.setdefault(group.id_, set()).add(
+                    group.workspace
+                )
+        # results of permission-checks (see `CompiledRules`)
+        self.permission_cache: dict[Any, Any] = {}
 
 
 @dataclass(kw_only=True)
@@ -0,0 +1,200 @@
+"""
+Cache for responses of oai-repositories.
+"""
+
+from typing import Any, Callable, Optional
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import sys
+import threading
+from time import monotonic
+
+from dcm_frontend.util import LRUCache
+
+
+class OAICache:
+    """
+    Thread-safe, size-bounded cache for results of requests to
+    oai-repositories (e.g., by url) with stale-while-revalidate.
+
+    Entries are fresh for `ttl` seconds. Afterwards, they are served
+    for up to another `max_stale` seconds while a refresh runs in the
+    background (at most one per key; refreshes are submitted to a
+    bounded `executor`). A failed refresh keeps the stale
+    entry. Older entries are treated as missing.
+
+    Concurrent fetches for the same key are de-duplicated: only one
+    call of `fetch` runs at a time while all other callers wait for and
+    share its result (or exception).
+
+    Keyword arguments:
+    maxsize -- maximum number of entries
+               (default 128)
+    ttl -- time in seconds for which an entry is fresh
+           (default 3600)
+    max_stale -- time in seconds for which an entry is served after it
+                 has become stale
+                 (default 86400)
+    executor -- executor for background refreshes (can be shared
+                between caches); if `None`, a single background thread
+                is used
+                (default None)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 3600,
+        max_stale: float = 86400,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.refreshes = 0
+        self.failed_refreshes = 0
+        self.deduplicated = 0
+        # key -> time of caching and result
+        self._entries = LRUCache(maxsize, ttl + max_stale)
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="oai-cache-refresh"
+        )
+        self._refreshing: set[str] = set()
+        # key -> result of running fetch
+        self._inflight: dict[str, Future] = {}
+        # changes on invalidation; prevents refreshes that started
+        # before from writing outdated results
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: str, fetch: Callable[[], Any], force: bool = False
+    ) -> Any:
+        """
+        Returns cached result for `key` or, if missing or `force` is
+        set, the result of `fetch` (which is then cached). Exceptions
+        raised by `fetch` are passed on to all waiting callers (but
+        not for background refreshes).
+
+        Keyword arguments:
+        key -- cache key
+        fetch -- callable that returns a fresh result
+        force -- whether to ignore cached results
+                 (default False)
+        """
+        if not force:
+            entry = self._entries.get(key)
+            if entry is not None:
+                timestamp, result = entry
+                if monotonic() - timestamp > self.ttl:
+                    self._refresh(key, fetch)
+                return result
+
+        return self._fetch(key, fetch, self._generation)
+
+    def _fetch(
+        self, key: str, fetch: Callable[[], Any], generation: int
+    ) -> Any:
+        """Runs `fetch` for `key` or waits for an ongoing call."""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.deduplicated += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as exc_info:
+            future.set_exception(exc_info)
+            raise
+        else:
+            self._set(key, result, generation)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        Returns cached (possibly stale) result for `key` or `None`
+        without fetching or refreshing.
+        """
+        entry = self._entries.get(key)
+        return None if entry is None else entry[1]
+
+    def set(self, key: str, result: Any) -> None:
+        """Sets `result` for `key`."""
+        self._set(key, result, self._generation)
+
+    def _set(self, key: str, result: Any, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._entries.set(key, (monotonic(), result))
+
+    def _refresh(self, key: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            generation = self._generation
+        try:
+            self._executor.submit(self._run_refresh, key, fetch, generation)
+        except RuntimeError:
+            # executor has been shut down
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _run_refresh(
+        self, key: str, fetch: Callable[[], Any], generation: int
+    ) -> None:
+        """Refreshes entry for `key`."""
+        try:
+            self._fetch(key, fetch, generation)
+        # pylint: disable=broad-exception-caught
+        except Exception as exc_info:
+            self.failed_refreshes += 1
+            print(
+                f"Failed to refresh cached oai-response for '{key}': "
+                + str(exc_info),
+                file=sys.stderr,
+            )
+        else:
+            self.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key: str) -> None:
+        """Removes entry for `key`."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def age(self) -> Optional[float]:
+        """
+        Returns age in seconds of the oldest entry (`None` if empty).
+        """
+        timestamps = [timestamp for timestamp, _ in self._entries.values()]
+        if not timestamps:
+            return None
+        return monotonic() - min(timestamps)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Returns cache-statistics as JSON."""
+        return self._entries.stats() | {
+            "refreshes": self.refreshes,
+            "failedRefreshes": self.failed_refreshes,
+            "deduplicated": self.deduplicated,
+        }
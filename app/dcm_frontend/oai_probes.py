@@ -0,0 +1,104 @@
+"""
+Asynchronous execution of requests to oai-repositories.
+"""
+
+from typing import Any, Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from secrets import token_urlsafe
+import threading
+
+from dcm_frontend.util import LRUCache
+
+
+@dataclass
+class Probe:
+    """Submitted request to an oai-repository."""
+
+    future: Future
+    # base url of the oai-repository
+    url: str
+    # userConfigId of the submitting user
+    owner: Optional[str] = None
+
+
+class OAIProbes:
+    """
+    Runs requests to oai-repositories (probes) on a bounded pool of
+    background threads. Probes are identified by a random token and
+    their results are kept for `ttl` seconds after submission.
+
+    Keyword arguments:
+    max_workers -- maximum number of concurrently running probes
+                   (default 4)
+    max_pending -- maximum number of unfinished probes; further probes
+                   are rejected
+                   (default 32)
+    ttl -- time in seconds for which probes (and their results) are
+           kept
+           (default 600)
+    maxsize -- maximum number of kept probes
+               (default 1024)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        ttl: float = 600,
+        maxsize: int = 1024,
+    ) -> None:
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._probes = LRUCache(maxsize, ttl)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="oai-probe"
+        )
+        self._lock = threading.Lock()
+
+    def _done(self, _: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    def submit(
+        self, fn: Callable[[], Any], url: str, owner: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Submits `fn` and returns the probe's token or `None` if the
+        maximum number of pending probes is reached.
+
+        Keyword arguments:
+        fn -- callable that performs the request
+        url -- base url of the oai-repository
+        owner -- userConfigId of the submitting user
+                 (default None)
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                return None
+            self.pending += 1
+        token = token_urlsafe(16)
+        future = self._executor.submit(fn)
+        self._probes.set(token, Probe(future, url, owner))
+        future.add_done_callback(self._done)
+        return token
+
+    def get(self, token: str, owner: Optional[str] = None) -> Optional[Probe]:
+        """
+        Returns `Probe` for `token` or `None` if unknown, expired, or
+        submitted by another `owner`.
+        """
+        probe = self._probes.get(token)
+        if probe is None or probe.owner != owner:
+            return None
+        return probe
+
+    def stats(self) -> dict:
+        """Returns probe-statistics as JSON."""
+        return {
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "kept": len(self._probes),
+        }
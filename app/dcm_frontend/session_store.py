@@ -0,0 +1,268 @@
+"""
+Session-store with support for deferred (coalesced) writes and a
+secondary index of sessions by user.
+"""
+
+from typing import Any, Optional
+from collections.abc import Iterable
+import threading
+from time import sleep
+
+from dcm_common.db import KeyValueStoreAdapter
+
+
+class SessionStore:
+    """
+    Wrapper for a key-value store of sessions (JSON) that supports
+    deferred writes via `write_deferred`. Deferred writes are kept in
+    memory (visible to `read`), coalesced per key, and persisted in
+    batches by a background thread that runs while writes are pending.
+
+    It exposes the same `read`-, `write`-, `delete`-, and `keys`-
+    interface as the wrapped store. A `write` or `delete` discards a
+    pending deferred write for the same key. Deferred writes only update
+    existing records, i.e., a pending write is dropped if the record has
+    been deleted in the meantime (e.g., by another worker).
+
+    Additionally, an index of the sessions by their 'userConfigId' is
+    kept in the wrapped store itself (records with keys
+    `USER_INDEX_PREFIX + <userConfigId>` containing a list of session
+    keys; see `get_user_sessions` and `delete_user_sessions`). This
+    index is shared by all instances using the same store. Since
+    updates of an index record by different processes are not atomic,
+    the index should be repaired periodically via `repair_index` (see
+    `SessionSweeper`). Index records are omitted from `keys`.
+
+    Keyword arguments:
+    adapter -- key-value store for sessions
+    flush_interval -- interval in seconds at which deferred writes are
+                      persisted
+                      (default 5.0)
+    """
+
+    USER_INDEX_PREFIX = "user:"
+
+    def __init__(
+        self, adapter: KeyValueStoreAdapter, flush_interval: float = 5.0
+    ) -> None:
+        self.adapter = adapter
+        self.flush_interval = flush_interval
+        self.writes = 0
+        self.deferred_writes = 0
+        self.coalesced_writes = 0
+        self.index_repairs = 0
+        self._pending: dict[str, Any] = {}
+        self._pending_lock = threading.Lock()
+        # serializes writes to the adapter (prevents a flush from
+        # overwriting more recent writes or resurrecting deleted keys)
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # session key -> userConfigId for sessions that are known to be
+        # listed in the index
+        self._owners: dict[str, str] = {}
+        # serializes updates of index records
+        self._index_lock = threading.Lock()
+
+    def _index_key(self, user_config_id: str) -> str:
+        return self.USER_INDEX_PREFIX + user_config_id
+
+    def _update_index(
+        self,
+        user_config_id: str,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Updates index record of `user_config_id`."""
+        # requires self._index_lock
+        index_key = self._index_key(user_config_id)
+        keys = set(self.adapter.read(index_key) or [])
+        updated = (keys | set(add)) - set(remove)
+        if updated == keys:
+            return
+        if updated:
+            self.adapter.write(index_key, sorted(updated))
+        else:
+            self.adapter.delete(index_key)
+
+    def _add_to_index(self, key: str, value: Any) -> None:
+        user_config_id = (
+            value.get("userConfigId") if isinstance(value, dict) else None
+        )
+        with self._index_lock:
+            owner = self._owners.get(key)
+            if owner == user_config_id:
+                return
+            if owner is not None:
+                self._update_index(owner, remove=[key])
+                del self._owners[key]
+            if user_config_id is not None:
+                self._update_index(user_config_id, add=[key])
+                self._owners[key] = user_config_id
+
+    def _remove_from_index(self, key: str, value: Any) -> None:
+        with self._index_lock:
+            owner = self._owners.pop(key, None)
+            if owner is None and isinstance(value, dict):
+                owner = value.get("userConfigId")
+            if owner is not None:
+                self._update_index(owner, remove=[key])
+
+    def read(self, key: str) -> Optional[Any]:
+        """
+        Returns session for `key` (including pending deferred writes).
+        """
+        with self._pending_lock:
+            if key in self._pending:
+                return self._pending[key]
+        return self.adapter.read(key)
+
+    def write(self, key: str, value: Any) -> None:
+        """Writes session for `key` to the store immediately."""
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending.pop(key, None)
+            self.adapter.write(key, value)
+            self.writes += 1
+        self._add_to_index(key, value)
+
+    def write_deferred(self, key: str, value: Any) -> None:
+        """Schedules writing session for `key` to the store."""
+        with self._pending_lock:
+            if key in self._pending:
+                self.coalesced_writes += 1
+            self._pending[key] = value
+            self.deferred_writes += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="session-flusher"
+                )
+                self._thread.start()
+
+    def delete(self, key: str) -> None:
+        """Deletes session for `key` from the store."""
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending.pop(key, None)
+            value = (
+                None if key in self._owners else self.adapter.read(key)
+            )
+            self.adapter.delete(key)
+        self._remove_from_index(key, value)
+
+    def keys(self) -> Iterable[str]:
+        """Returns keys of the store (excluding index records)."""
+        return (
+            key
+            for key in self.adapter.keys()
+            if not key.startswith(self.USER_INDEX_PREFIX)
+        )
+
+    def get_user_sessions(self, user_config_id: str) -> set[str]:
+        """Returns keys of indexed sessions for `user_config_id`."""
+        return set(
+            self.adapter.read(self._index_key(user_config_id)) or []
+        )
+
+    def delete_user_sessions(self, user_config_id: str) -> int:
+        """
+        Deletes all indexed sessions for `user_config_id` and returns
+        their number.
+        """
+        keys = self.get_user_sessions(user_config_id)
+        deleted = 0
+        for key in keys:
+            with self._pending_lock:
+                self._pending.pop(key, None)
+            if self.adapter.read(key) is not None:
+                deleted += 1
+            with self._write_lock:
+                self.adapter.delete(key)
+            with self._index_lock:
+                self._owners.pop(key, None)
+        with self._index_lock:
+            self._update_index(user_config_id, remove=keys)
+        return deleted
+
+    def repair_index(self) -> int:
+        """
+        Rebuilds the index from all sessions in the store (adds missing
+        and removes outdated entries). Returns the number of updated
+        index records.
+        """
+        scanned: set[str] = set()
+        expected: dict[str, set[str]] = {}
+        for key in list(self.keys()):
+            scanned.add(key)
+            value = self.adapter.read(key)
+            if isinstance(value, dict) and value.get("userConfigId"):
+                expected.setdefault(value["userConfigId"], set()).add(key)
+        repaired = 0
+        with self._index_lock:
+            user_config_ids = set(expected) | {
+                key[len(self.USER_INDEX_PREFIX):]
+                for key in list(self.adapter.keys())
+                if key.startswith(self.USER_INDEX_PREFIX)
+            }
+            for user_config_id in user_config_ids:
+                index_key = self._index_key(user_config_id)
+                current = set(self.adapter.read(index_key) or [])
+                # keep entries for sessions that have been created
+                # during the scan
+                updated = expected.get(user_config_id, set()) | {
+                    key
+                    for key in current
+                    if key not in scanned and self.adapter.read(key)
+                }
+                if updated == current:
+                    continue
+                if updated:
+                    self.adapter.write(index_key, sorted(updated))
+                else:
+                    self.adapter.delete(index_key)
+                repaired += 1
+        self.index_repairs += repaired
+        return repaired
+
+    def flush(self) -> int:
+        """
+        Persists all pending deferred writes for records that still
+        exist in the store; returns the number of persisted writes.
+        """
+        written = 0
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            for key, value in pending.items():
+                if self.adapter.read(key) is None:
+                    # deleted in the meantime; do not resurrect
+                    continue
+                self.adapter.write(key, value)
+                written += 1
+            self.writes += written
+        return written
+
+    @property
+    def pending(self) -> int:
+        """Returns current number of pending deferred writes."""
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        """Returns write- and index-statistics as JSON."""
+        return {
+            "indexedSessions": len(self._owners),
+            "indexRepairs": self.index_repairs,
+            "pending": self.pending,
+            "writes": self.writes,
+            "deferredWrites": self.deferred_writes,
+            "coalescedWrites": self.coalesced_writes,
+        }
+
+    def _run(self) -> None:
+        """Flush-loop."""
+        while True:
+            sleep(self.flush_interval)
+            self.flush()
+            with self._pending_lock:
+                if not self._pending:
+                    self._thread = None
+                    return
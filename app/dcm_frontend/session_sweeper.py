@@ -0,0 +1,153 @@
+"""
+Background cleanup of expired sessions.
+"""
+
+from typing import Any, Callable, Optional
+from pathlib import Path
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from dcm_frontend.session_store import SessionStore
+
+
+class SessionSweeper:
+    """
+    Periodically deletes expired sessions from a `SessionStore` in a
+    background thread. Every sweep processes the sessions in batches of
+    `batch_size` with a delay of `batch_delay` seconds in between and
+    subsequently repairs the store's index of sessions by user.
+
+    If a `lock_file` is given, only the owner of an exclusive lock on
+    that file sweeps (e.g., a single worker of a multi-process
+    deployment); other instances retry acquiring the lock once per
+    interval.
+
+    Keyword arguments:
+    sessions -- session-store
+    check -- callable that returns `False` for expired sessions (JSON)
+    interval -- interval between sweeps in seconds
+                (default 3600)
+    batch_size -- number of sessions that are processed per batch
+                  (default 100)
+    batch_delay -- delay between batches in seconds
+                   (default 0.1)
+    lock_file -- path to a lock-file that is used to ensure a single
+                 active sweeper
+                 (default None; no locking)
+    """
+
+    def __init__(
+        self,
+        sessions: SessionStore,
+        check: Callable[[dict], bool],
+        interval: float = 3600,
+        batch_size: int = 100,
+        batch_delay: float = 0.1,
+        lock_file: Optional[Path] = None,
+    ) -> None:
+        self.sessions = sessions
+        self.check = check
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.batch_delay = batch_delay
+        self.lock_file = lock_file
+        self.active = False
+        self.sweeps = 0
+        self.deleted = 0
+        self._lock_handle: Optional[Any] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def acquire_lock(self) -> bool:
+        """
+        Returns `True` if this instance is allowed to sweep (acquires
+        lock on `lock_file` if needed).
+        """
+        if self.lock_file is None or fcntl is None:
+            return True
+        if self._lock_handle is not None:
+            return True
+        # pylint: disable=consider-using-with
+        handle = open(self.lock_file, "a", encoding="utf-8")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._lock_handle = handle
+        return True
+
+    def release_lock(self) -> None:
+        """Releases lock on `lock_file` (if held)."""
+        if self._lock_handle is not None:
+            fcntl.flock(self._lock_handle, fcntl.LOCK_UN)
+            self._lock_handle.close()
+            self._lock_handle = None
+
+    def sweep(self) -> int:
+        """
+        Runs a single sweep and returns the number of deleted sessions.
+        """
+        deleted = 0
+        keys = list(self.sessions.keys())
+        for i in range(0, len(keys), self.batch_size):
+            if i > 0 and self._stop.wait(self.batch_delay):
+                break
+            for session_id in keys[i : i + self.batch_size]:
+                session = self.sessions.read(session_id)
+                if session is None or self.check(session):
+                    continue
+                self.sessions.delete(session_id)
+                deleted += 1
+                print(f"Deleted expired session '{session_id}'.")
+        else:
+            # not interrupted
+            self.sessions.repair_index()
+        self.sweeps += 1
+        self.deleted += deleted
+        return deleted
+
+    def start(self) -> None:
+        """Starts background thread (if not already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="session-sweeper"
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops background thread and releases the lock."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.release_lock()
+        self.active = False
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> dict:
+        """Returns sweeper-statistics as JSON."""
+        return {
+            "active": self.active,
+            "sweeps": self.sweeps,
+            "deleted": self.deleted,
+        }
+
+    def _run(self) -> None:
+        """Sweep-loop."""
+        while not self._stop.is_set():
+            self.active = self.acquire_lock()
+            if self.active:
+                self.sweep()
+            if self._stop.wait(self.interval):
+                return
@@ -0,0 +1,208 @@
+"""
+Signed (stateless) session-tokens with in-memory revocation.
+"""
+
+from typing import Optional
+from dataclasses import dataclass
+from hashlib import sha512
+import threading
+from time import time
+
+from itsdangerous import BadSignature, URLSafeSerializer
+
+from dcm_frontend.util import LRUCache
+from dcm_frontend.user_cache import InvalidationChannel
+
+
+@dataclass
+class SessionClaim:
+    """Verified content of a signed session-token."""
+
+    # random session id (the session key is derived from this id)
+    sid: str
+    user_config_id: str
+    issued_at: float
+    expires_at: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Returns session key (see `Session.key`)."""
+        return sha512(self.sid.encode(encoding="utf-8")).hexdigest()
+
+
+class SessionSigner:
+    """
+    Issues and verifies signed session-tokens that contain all data
+    required to authenticate a request (session id, user-configuration
+    id, and expiration date).
+
+    Revocations (single sessions or all sessions of a user) are kept in
+    memory and, if a `channel` is given, shared with other processes.
+    Additionally, verified sessions are re-validated against the
+    session-database once every `revalidate_after` seconds (see
+    `requires_revalidation`). Since revoked sessions are expected to be
+    deleted from the session-database, revocations of single sessions
+    are only kept until either the token or a re-validation would
+    reject the session (at most `maxsize` revocations are kept).
+
+    Keyword arguments:
+    secret_key -- secret used for signing
+    max_age -- maximum lifetime of a token in seconds; a value below or
+               equal to zero corresponds to no expiration
+               (default 0)
+    revalidate_after -- interval in seconds after which a session is
+                        re-validated against the session-database; a
+                        value below or equal to zero disables
+                        re-validation
+                        (default 60)
+    maxsize -- maximum number of remembered validations and revoked
+               sessions
+               (default 10000)
+    channel -- channel for revocations between processes
+               (default None)
+    """
+
+    SALT = "dcm-frontend-session"
+
+    def __init__(
+        self,
+        secret_key: str,
+        max_age: float = 0,
+        revalidate_after: float = 60,
+        maxsize: int = 10000,
+        channel: Optional[InvalidationChannel] = None,
+    ) -> None:
+        self.max_age = max_age
+        self.revalidate_after = revalidate_after
+        self.channel = channel
+        self._serializer = URLSafeSerializer(secret_key, salt=self.SALT)
+        self._validated = LRUCache(maxsize, revalidate_after)
+        # revoked session keys and userConfigId -> time of revocation
+        # (tokens issued before are invalid)
+        self._revoked_sessions = LRUCache(maxsize)
+        self._revoked_users: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def issue(self, sid: str, user_config_id: str) -> str:
+        """Returns signed token for the given session."""
+        issued_at = time()
+        return self._serializer.dumps(
+            [
+                sid,
+                user_config_id,
+                issued_at,
+                issued_at + self.max_age if self.max_age > 0 else None,
+            ]
+        )
+
+    def verify(self, token: str) -> Optional[SessionClaim]:
+        """
+        Returns `SessionClaim` if `token` is valid (correctly signed,
+        not expired, and not revoked) or `None` otherwise.
+        """
+        try:
+            claim = SessionClaim(*self._serializer.loads(token))
+        except (BadSignature, TypeError, ValueError):
+            return None
+        if claim.expires_at is not None and claim.expires_at <= time():
+            return None
+
+        self.sync()
+        if claim.key in self._revoked_sessions:
+            return None
+        with self._lock:
+            revoked_at = self._revoked_users.get(claim.user_config_id)
+        if revoked_at is not None and claim.issued_at <= revoked_at:
+            return None
+        return claim
+
+    def requires_revalidation(self, claim: SessionClaim) -> bool:
+        """
+        Returns `True` if the session has not been validated against
+        the session-database recently.
+        """
+        if self.revalidate_after <= 0:
+            return False
+        return claim.key not in self._validated
+
+    def validated(self, claim: SessionClaim) -> None:
+        """Marks session as validated against the session-database."""
+        if self.revalidate_after > 0:
+            self._validated.set(claim.key, True)
+
+    def _prune(self, now: float) -> None:
+        # requires self._lock
+        if self.max_age > 0:
+            for user_config_id, revoked_at in list(
+                self._revoked_users.items()
+            ):
+                if revoked_at + self.max_age <= now:
+                    del self._revoked_users[user_config_id]
+
+    def _revoke_session(self, key: str, expires_at: float) -> None:
+        ttl = expires_at - time()
+        if ttl > 0:
+            self._revoked_sessions.set(
+                key, True, None if ttl == float("inf") else ttl
+            )
+        self._validated.pop(key)
+
+    def _revoke_user(self, user_config_id: str, revoked_at: float) -> None:
+        with self._lock:
+            self._prune(time())
+            self._revoked_users[user_config_id] = max(
+                revoked_at, self._revoked_users.get(user_config_id, 0)
+            )
+        # validations are not associated with users; start over
+        self._validated.clear()
+
+    def revoke_session(self, key: str) -> None:
+        """Revokes session with session key `key`."""
+        # after a re-validation, the revocation is no longer needed
+        expires_at = time() + min(
+            self.max_age if self.max_age > 0 else float("inf"),
+            (
+                self.revalidate_after
+                if self.revalidate_after > 0
+                else float("inf")
+            ),
+        )
+        self._revoke_session(key, expires_at)
+        if self.channel is not None:
+            self.channel.publish(f"session:{key}:{expires_at}")
+
+    def revoke_user(self, user_config_id: str) -> None:
+        """Revokes all sessions of `user_config_id` issued until now."""
+        revoked_at = time()
+        self._revoke_user(user_config_id, revoked_at)
+        if self.channel is not None:
+            self.channel.publish(f"user:{user_config_id}:{revoked_at}")
+
+    def sync(self) -> None:
+        """Processes revocations from other processes (if any)."""
+        if self.channel is None:
+            return
+        messages = self.channel.poll()
+        if messages is None:
+            # revocations may have been lost; re-validate all sessions
+            self._validated.clear()
+            return
+        for message in messages:
+            kind, _, rest = message.partition(":")
+            value, _, timestamp = rest.rpartition(":")
+            try:
+                timestamp = float(timestamp)
+            except ValueError:
+                continue
+            if kind == "session":
+                self._revoke_session(value, timestamp)
+            elif kind == "user":
+                self._revoke_user(value, timestamp)
+
+    def stats(self) -> dict:
+        """Returns revocation-statistics as JSON."""
+        return {
+            "revokedSessions": len(self._revoked_sessions),
+            "revokedUsers": len(self._revoked_users),
+            "validated": len(self._validated),
+        }
@@ -0,0 +1,246 @@
+"""
+Cache for user-configurations and the derived `User`-objects.
+"""
+
+from typing import Any, Optional
+from collections.abc import Iterable
+from pathlib import Path
+import os
+import threading
+from time import monotonic
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from dcm_common.db import KeyValueStoreAdapter
+
+from dcm_frontend.models import User
+from dcm_frontend.util import LRUCache
+
+
+class InvalidationChannel:
+    """
+    File-based channel for broadcasting invalidated keys between
+    processes (e.g., workers of a multi-process deployment).
+
+    Invalidated keys are appended line by line to `path`. Every
+    instance tracks how far it has read the file (and skips its own
+    messages if possible); polling only requires a `stat` of the file
+    if nothing has changed. Once the file
+    exceeds `max_size`, it is replaced by an empty file which causes
+    all instances to perform a full reset.
+
+    Keyword arguments:
+    path -- path to the shared channel-file
+    max_size -- size in bytes after which the channel-file is replaced
+                (default 1048576)
+    """
+
+    def __init__(self, path: Path, max_size: int = 1048576) -> None:
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.touch()
+        self._lock_file = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.Lock()
+        stat = os.stat(self.path)
+        self._inode = stat.st_ino
+        self._offset = stat.st_size
+
+    def publish(self, key: str) -> None:
+        """Broadcasts invalidation of `key`."""
+        with open(self._lock_file, "a", encoding="utf-8") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if (
+                    self.path.exists()
+                    and self.path.stat().st_size > self.max_size
+                ):
+                    tmp = self.path.with_name(self.path.name + ".tmp")
+                    tmp.write_bytes(b"")
+                    os.replace(tmp, self.path)
+                with open(self.path, "ab") as file:
+                    stat = os.fstat(file.fileno())
+                    file.write(key.encode(encoding="utf-8") + b"\n")
+                    file.flush()
+                    # skip own message if up to date
+                    with self._lock:
+                        if (
+                            stat.st_ino == self._inode
+                            and stat.st_size == self._offset
+                        ):
+                            self._offset = file.tell()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def poll(self) -> Optional[list[str]]:
+        """
+        Returns list of keys that have been invalidated since the last
+        call or `None` if a full reset is required.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        with self._lock:
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._inode = stat.st_ino
+                self._offset = 0
+                reset = True
+            else:
+                reset = False
+            if stat.st_size == self._offset:
+                return None if reset else []
+            with open(self.path, "rb") as file:
+                file.seek(self._offset)
+                data = file.read(stat.st_size - self._offset)
+            # only consume complete lines
+            data = data[: data.rfind(b"\n") + 1]
+            self._offset += len(data)
+        if reset:
+            return None
+        return data.decode(encoding="utf-8").splitlines()
+
+
+class UserCache:
+    """
+    Wrapper for a key-value store of user-configurations (JSON) that
+    additionally keeps a bounded LRU-cache of the parsed (and to be
+    treated as immutable) `User`-objects.
+
+    It exposes the same `read`-, `write`-, `delete`-, and `keys`-
+    interface as the wrapped store. Every `write` and `delete` for a
+    user-configuration invalidates the associated `User`-object. The
+    time of the last `write` (or `touch`) is tracked per process (see
+    `age`).
+
+    If the store is shared between processes, an `InvalidationChannel`
+    should be given to propagate invalidations to all processes.
+
+    Keyword arguments:
+    adapter -- key-value store for user-configurations
+    maxsize -- maximum number of cached `User`-objects
+               (default 1024)
+    channel -- channel for invalidations between processes
+               (default None)
+    """
+
+    def __init__(
+        self,
+        adapter: KeyValueStoreAdapter,
+        maxsize: int = 1024,
+        channel: Optional[InvalidationChannel] = None,
+    ) -> None:
+        self.adapter = adapter
+        self.channel = channel
+        self._users = LRUCache(maxsize)
+        # version-counter per user-configuration (changes on write and
+        # delete); protects against caching a User that has been
+        # parsed from a config that has been replaced concurrently
+        self._versions: dict[str, int] = {}
+        self._generation = 0
+        self._timestamps: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _bump(self, user_config_id: str) -> None:
+        with self._lock:
+            self._versions[user_config_id] = (
+                self._versions.get(user_config_id, 0) + 1
+            )
+            self._timestamps.pop(user_config_id, None)
+        self._users.pop(user_config_id)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._timestamps.clear()
+        self._users.clear()
+
+    def _version(self, user_config_id: str) -> tuple[int, int]:
+        return self._generation, self._versions.get(user_config_id, 0)
+
+    def sync(self) -> None:
+        """Processes invalidations from other processes (if any)."""
+        if self.channel is None:
+            return
+        keys = self.channel.poll()
+        if keys is None:
+            self._reset()
+            return
+        for key in keys:
+            self._bump(key)
+
+    def read(self, key: str) -> Optional[Any]:
+        """Returns user-configuration for `key` from the store."""
+        return self.adapter.read(key)
+
+    def write(self, key: str, value: Any) -> None:
+        """Writes user-configuration for `key` to the store."""
+        self._bump(key)
+        self.adapter.write(key, value)
+        self.touch(key)
+        if self.channel is not None:
+            self.channel.publish(key)
+
+    def touch(self, key: str) -> None:
+        """Marks user-configuration for `key` as up to date."""
+        with self._lock:
+            self._timestamps[key] = monotonic()
+
+    def age(self, key: str) -> Optional[float]:
+        """
+        Returns time in seconds since the user-configuration for `key`
+        has been written or touched by this process (`None` if
+        unknown).
+        """
+        timestamp = self._timestamps.get(key)
+        if timestamp is None:
+            return None
+        return monotonic() - timestamp
+
+    def read_fresh(self, key: str, max_age: float) -> Optional[Any]:
+        """
+        Returns user-configuration for `key` from the store if it is
+        not older than `max_age` seconds (otherwise `None`).
+        """
+        self.sync()
+        age = self.age(key)
+        if age is None or age > max_age:
+            return None
+        return self.adapter.read(key)
+
+    def delete(self, key: str) -> None:
+        """Deletes user-configuration for `key` from the store."""
+        self._bump(key)
+        self.adapter.delete(key)
+        if self.channel is not None:
+            self.channel.publish(key)
+
+    def keys(self) -> Iterable[str]:
+        """Returns keys of the store."""
+        return self.adapter.keys()
+
+    def get_user(self, user_config_id: str) -> Optional[User]:
+        """
+        Returns (cached) `User` for `user_config_id` or `None` if no
+        user-configuration is stored.
+        """
+        self.sync()
+        version = self._version(user_config_id)
+        entry = self._users.get(user_config_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        user_config = self.adapter.read(user_config_id)
+        if user_config is None:
+            return None
+        user = User(user_config)
+        self._users.set(user_config_id, (version, user))
+        return user
+
+    def stats(self) -> dict:
+        """Returns cache-statistics as JSON."""
+        return self._users.stats()
@@ -1,10 +1,17 @@
 """Module providing helper functions for the project dcm-frontend."""
 
 from typing import Optional, Any, Callable
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from collections import OrderedDict
+from contextvars import ContextVar, copy_context
+import threading
+from time import monotonic, perf_counter
+from hashlib import sha256
 from urllib3.exceptions import MaxRetryError, ReadTimeoutError
 
+from flask import Response, request, stream_with_context
 import dcm_backend_sdk
 
 
@@ -15,6 +22,39 @@ except ImportError:
     _ValidationError = ValueError
 
 
+# calls to the backend (SDK-method name and duration in seconds) during
+# the current request; `None` if not recorded (see `BackendCallRecorder`)
+backend_calls: ContextVar[Optional[list[tuple[str, float]]]] = ContextVar(
+    "backend_calls", default=None
+)
+
+
+# callables that are invoked with SDK-method name and duration in
+# seconds for every call to the backend during the current request
+# (set per app, see `Metrics`)
+backend_call_hooks: ContextVar[tuple[Callable[[str, float], None], ...]] = (
+    ContextVar("backend_call_hooks", default=())
+)
+
+
+def _record_backend_call(endpoint: Callable, duration: float) -> None:
+    """
+    Records call to `endpoint` in `backend_calls` (if enabled) and
+    passes it to the `backend_call_hooks`.
+    """
+    calls = backend_calls.get()
+    hooks = backend_call_hooks.get()
+    if calls is None and not hooks:
+        return
+    name = getattr(endpoint, "__qualname__", str(endpoint))
+    for suffix in ("_with_http_info", "_without_preload_content"):
+        name = name.removesuffix(suffix)
+    if calls is not None:
+        calls.append((name, duration))
+    for hook in hooks:
+        hook(name, duration)
+
+
 @dataclass
 class BackendResponse():
     """
@@ -34,54 +74,39 @@ class BackendResponse():
     data: Optional[Any] = None
 
 
-def call_backend(
-    endpoint: Callable,
-    args: Optional[Iterable] = None,
-    kwargs: Optional[Mapping] = None,
-    request_timeout: int = 1,
-    check_endpoint_compatibility: bool = True
-) -> BackendResponse:
+def _check_endpoint_compatibility(
+    caller: str, endpoint: Callable, suffix: str = "with_http_info"
+) -> None:
     """
-    Attempt to make an API call to a specific endpoint
-    of a dcm-backend service.
-
-    Returns a `BackendResponse`-object.
-
-    Keyword arguments:
-    endpoint -- the API endpoint of dcm-backend to submit to
-    args -- API parameters as positional args;
-            either request body or query parameters
-    kwargs -- API parameters as kwargs;
-              either request body or query parameters
-              (default None for endpoints that accept no parameters)
-    request_timeout -- total timeout setting for this request
-    check_endpoint_compatibility -- whether to validate sdk-method name
-                                    for '..with_http_info'-suffix
+    Raises `ValueError` if `endpoint` is not a '..with_http_info'-SDK
+    method (or any other `suffix`).
     """
-    if (
-        check_endpoint_compatibility
-        and not endpoint.__name__.endswith("with_http_info")
-    ):
+    if not endpoint.__name__.endswith(suffix):
         raise ValueError(
-            "Method 'call_backend' received incompatible endpoint "
+            f"Method '{caller}' received incompatible endpoint "
             + f"'{endpoint.__name__}' (expected '{endpoint.__name__}"
-            + "_with_http_info')"
-        )
-    backend_response = BackendResponse()
-    try:
-        response = endpoint(
-            *(args or []),
-            **(kwargs or {}),
-            _request_timeout=request_timeout,
+            + f"_{suffix}')"
         )
-    except (ReadTimeoutError, MaxRetryError) as exc_info:
+
+
+def _handle_exception(
+    backend_response: BackendResponse,
+    endpoint: Callable,
+    exc_info: Exception,
+    request_timeout: int,
+) -> None:
+    """
+    Sets status code and fail reason of `backend_response` based on the
+    exception `exc_info` raised by a call to `endpoint`.
+    """
+    if isinstance(exc_info, (ReadTimeoutError, MaxRetryError)):
         backend_response.status_code = 504  # Gateway Timeout
         backend_response.fail_reason = (
             f"Cannot connect to '{endpoint.__qualname__}' of dcm-backend "
             f"service ({exc_info}). Consider increasing the timeout setting "
             f" for this request. Current value: {request_timeout}."
         )
-    except dcm_backend_sdk.rest.ApiException as exc_info:
+    elif isinstance(exc_info, dcm_backend_sdk.rest.ApiException):
         backend_response.status_code = exc_info.status  # Backend status code
         backend_response.fail_reason = (
             f"'Endpoint '{endpoint.__qualname__}' of dcm-backend service "
@@ -89,7 +114,7 @@ def call_backend(
             f"{exc_info.body}."
         ).replace("\n", "")
         backend_response.data = exc_info.data
-    except _ValidationError as exc_info:
+    elif isinstance(exc_info, _ValidationError):
         if not hasattr(exc_info, "errors"):  # ValueError
             backend_response.status_code = 422  # Unprocessable Content
             backend_response.fail_reason = (
@@ -104,21 +129,430 @@ def call_backend(
                     f"Bad request body for '{exc_info.title}' "
                     + f"({error['msg']}; {error['type']} at {error['loc']})./n"
                 )
-    except Exception as e:  # pylint: disable=broad-except
+    else:
         backend_response.status_code = 500  # Internal Server Error
         backend_response.fail_reason = (
-            f"An unexpected error occurred: {e}"
+            f"An unexpected error occurred: {exc_info}"
+        )
+
+
+def call_backend(
+    endpoint: Callable,
+    args: Optional[Iterable] = None,
+    kwargs: Optional[Mapping] = None,
+    request_timeout: int = 1,
+    check_endpoint_compatibility: bool = True
+) -> BackendResponse:
+    """
+    Attempt to make an API call to a specific endpoint
+    of a dcm-backend service.
+
+    Returns a `BackendResponse`-object.
+
+    Keyword arguments:
+    endpoint -- the API endpoint of dcm-backend to submit to
+    args -- API parameters as positional args;
+            either request body or query parameters
+    kwargs -- API parameters as kwargs;
+              either request body or query parameters
+              (default None for endpoints that accept no parameters)
+    request_timeout -- total timeout setting for this request
+    check_endpoint_compatibility -- whether to validate sdk-method name
+                                    for '..with_http_info'-suffix
+    """
+    if check_endpoint_compatibility:
+        _check_endpoint_compatibility("call_backend", endpoint)
+    backend_response = BackendResponse()
+    start = perf_counter()
+    try:
+        response = endpoint(
+            *(args or []),
+            **(kwargs or {}),
+            _request_timeout=request_timeout,
+        )
+    except Exception as exc_info:  # pylint: disable=broad-except
+        _record_backend_call(endpoint, perf_counter() - start)
+        _handle_exception(
+            backend_response, endpoint, exc_info, request_timeout
         )
     else:
+        _record_backend_call(endpoint, perf_counter() - start)
         backend_response.status_code = response.status_code  # Success
         backend_response.data = response.data
         backend_response.fail_reason = "No error occurred."
     return backend_response
 
 
+def call_backend_many(
+    calls: Iterable[Mapping],
+    request_timeout: int = 1,
+    max_workers: int = 8,
+    deadline: Optional[float] = None,
+    check_endpoint_compatibility: bool = True,
+    executor: Optional[Executor] = None,
+) -> list[BackendResponse]:
+    """
+    Concurrently make multiple API calls to endpoints of a dcm-backend
+    service (see `call_backend`).
+
+    Returns a list of `BackendResponse`-objects in the order of `calls`.
+    Calls that have not finished when the `deadline` is reached are
+    reported with status 504.
+
+    Keyword arguments:
+    calls -- iterable of mappings with the keys 'endpoint', 'args'
+             (optional), and 'kwargs' (optional); see `call_backend`
+             for details
+    request_timeout -- total timeout setting for individual requests
+    max_workers -- maximum number of concurrent requests if no
+                   `executor` is given
+                   (default 8)
+    deadline -- overall timeout in seconds for all calls; `None`
+                corresponds to no deadline
+                (default None)
+    check_endpoint_compatibility -- whether to validate sdk-method names
+                                    for '..with_http_info'-suffix
+    executor -- (shared) executor that runs the calls; if `None`, a
+                temporary executor is created for this call only
+                (default None)
+    """
+    calls = list(calls)
+    if check_endpoint_compatibility:
+        for call in calls:
+            _check_endpoint_compatibility(
+                "call_backend_many", call["endpoint"]
+            )
+    if len(calls) == 0:
+        return []
+
+    temporary_executor = executor is None
+    if temporary_executor:
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(calls))),
+            thread_name_prefix="call-backend",
+        )
+    # (copy context to preserve recording of backend calls)
+    futures = [
+        executor.submit(
+            copy_context().run,
+            call_backend,
+            endpoint=call["endpoint"],
+            args=call.get("args"),
+            kwargs=call.get("kwargs"),
+            request_timeout=request_timeout,
+            check_endpoint_compatibility=False,
+        )
+        for call in calls
+    ]
+    done, not_done = wait(futures, timeout=deadline)
+    # do not start queued calls after the deadline and do not wait for
+    # running calls that exceeded the deadline
+    for future in not_done:
+        future.cancel()
+    if temporary_executor:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    responses = []
+    for call, future in zip(calls, futures):
+        if future in done:
+            responses.append(future.result())
+            continue
+        responses.append(
+            BackendResponse(
+                fail_reason=(
+                    f"Call to '{call['endpoint'].__qualname__}' of "
+                    + "dcm-backend service did not finish within the "
+                    + f"deadline of {deadline} seconds."
+                ),
+                status_code=504,  # Gateway Timeout
+            )
+        )
+    return responses
+
+
+def call_backend_raw(
+    endpoint: Callable,
+    args: Optional[Iterable] = None,
+    kwargs: Optional[Mapping] = None,
+    request_timeout: int = 1,
+    check_endpoint_compatibility: bool = True
+) -> BackendResponse:
+    """
+    Attempt to make an API call to a specific endpoint of a dcm-backend
+    service without deserializing the response body (see
+    `call_backend`).
+
+    Returns a `BackendResponse`-object. If successful, `data` is the
+    unread `urllib3.HTTPResponse` which has to be consumed or released
+    by the caller (e.g., via `stream_raw_response`). Otherwise, `data`
+    contains the raw response body (if available).
+
+    Keyword arguments:
+    endpoint -- the API endpoint of dcm-backend to submit to
+    args -- API parameters as positional args;
+            either request body or query parameters
+    kwargs -- API parameters as kwargs;
+              either request body or query parameters
+              (default None for endpoints that accept no parameters)
+    request_timeout -- total timeout setting for this request
+    check_endpoint_compatibility -- whether to validate sdk-method name
+                                    for '..without_preload_content'-
+                                    suffix
+    """
+    if check_endpoint_compatibility:
+        _check_endpoint_compatibility(
+            "call_backend_raw", endpoint, "without_preload_content"
+        )
+    backend_response = BackendResponse()
+    start = perf_counter()
+    try:
+        response = endpoint(
+            *(args or []),
+            **(kwargs or {}),
+            _request_timeout=request_timeout,
+        )
+    except Exception as exc_info:  # pylint: disable=broad-except
+        _record_backend_call(endpoint, perf_counter() - start)
+        _handle_exception(
+            backend_response, endpoint, exc_info, request_timeout
+        )
+        return backend_response
+    _record_backend_call(endpoint, perf_counter() - start)
+
+    backend_response.status_code = response.status
+    if response.status >= 400:
+        # errors are not raised for raw responses
+        backend_response.data = response.data
+        response.release_conn()
+        backend_response.fail_reason = (
+            f"'Endpoint '{endpoint.__qualname__}' of dcm-backend service "
+            f"rejected submission with status code {response.status}: "
+            f"{backend_response.data.decode(errors='replace')}."
+        ).replace("\n", "")
+    else:
+        backend_response.data = response
+        backend_response.fail_reason = "No error occurred."
+    return backend_response
+
+
+class StreamStats:
+    """
+    Thread-safe counters for response-bodies that are proxied from the
+    backend (see `track`).
+    """
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.total = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def track(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yields from `chunks` while counting the forwarded bytes."""
+        with self._lock:
+            self.active += 1
+            self.total += 1
+        try:
+            for chunk in chunks:
+                with self._lock:
+                    self.bytes += len(chunk)
+                yield chunk
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def stats(self) -> dict:
+        """Returns stream-statistics as JSON."""
+        return {
+            "active": self.active,
+            "total": self.total,
+            "bytes": self.bytes,
+        }
+
+
+# proxied response-bodies of this process
+proxied_streams = StreamStats()
+
+
+def stream_raw_response(
+    response: Any, status: Optional[int] = None, chunk_size: int = 65536
+) -> Response:
+    """
+    Returns a flask-`Response` that forwards the body of the (unread)
+    `urllib3.HTTPResponse` `response` unchanged. The backend's
+    connection is released once the body has been sent.
+
+    Keyword arguments:
+    response -- raw response as returned by `call_backend_raw`
+    status -- status code of the response; `None` corresponds to the
+              status of `response`
+              (default None)
+    chunk_size -- size of forwarded chunks in bytes
+                  (default 65536)
+    """
+
+    def generate():
+        try:
+            yield from proxied_streams.track(
+                response.stream(chunk_size, decode_content=False)
+            )
+        finally:
+            response.release_conn()
+
+    headers = {}
+    for header in ("Content-Length", "Content-Encoding"):
+        if header in response.headers:
+            headers[header] = response.headers[header]
+    return Response(
+        stream_with_context(generate()),
+        status=response.status if status is None else status,
+        content_type=response.headers.get("Content-Type", "application/json"),
+        headers=headers,
+    )
+
+
+def model_etag(model: Any, *volatile: str) -> Optional[str]:
+    """
+    Returns an ETag for a backend-SDK `model` based on its 'id',
+    'datetimeModified' (or 'datetimeCreated' if not modified yet), and
+    the given `volatile` fields (aliases of fields that are not covered
+    by 'datetimeModified', e.g. computed by the backend). This allows
+    validating requests without serializing the model.
+
+    Returns `None` if the model does not provide a timestamp.
+    """
+    dump = model.model_dump(
+        include={
+            name
+            for name, info in type(model).model_fields.items()
+            if (info.alias or name)
+            in ("id", "datetimeModified", "datetimeCreated", *volatile)
+        },
+        by_alias=True,
+    )
+    if dump.get("datetimeModified") is None and (
+        dump.get("datetimeCreated") is None
+    ):
+        return None
+    return sha256(
+        repr(sorted(dump.items(), key=lambda i: i[0])).encode(
+            encoding="utf-8"
+        )
+    ).hexdigest()
+
+
+def not_modified(etag: Optional[str]) -> Optional[Response]:
+    """
+    Returns 304-`Response` if `etag` matches the current request's
+    'If-None-Match'-header, otherwise `None`.
+    """
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
 def remove_from_json(json: Mapping, keys: Iterable[str]) -> dict:
     """
     Returns a copy of the given `json` where all `keys` have been
     removed.
     """
     return {k: v for k, v in json.items() if k not in keys}
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache with optional
+    time-to-live for its entries.
+
+    Keyword arguments:
+    maxsize -- maximum number of entries
+               (default 128)
+    ttl -- time-to-live for entries in seconds; `None` corresponds to
+           no expiration
+           (default None)
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Any, tuple[Any, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns value for `key` or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Sets `value` for `key`. The optional `ttl` overrides the
+        instance's default time-to-live.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = (
+                value, None if ttl is None else monotonic() + ttl
+            )
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Removes and returns value for `key` (ignores expiration)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def values(self) -> list[Any]:
+        """Returns values of all entries that have not expired."""
+        now = monotonic()
+        with self._lock:
+            return [
+                value
+                for value, expires_at in self._data.values()
+                if expires_at is None or expires_at > now
+            ]
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+        return entry is not None and (
+            entry[1] is None or entry[1] > monotonic()
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """Returns cache-statistics as JSON."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -57,8 +57,46 @@ class AuthView(services.View):
             return False
         return expires_at > datetime.now()
 
+    def requires_refresh(self, session: dict) -> bool:
+        """
+        Returns `True` if the session's expiresAt field should be
+        persisted again (always if `SESSION_COALESCE_WRITES` is not
+        set; otherwise only once `SESSION_REFRESH_THRESHOLD` of the
+        expiration window has passed).
+
+        Keyword arguments:
+        session -- session as JSON
+        """
+        if not self.config.SESSION_COALESCE_WRITES:
+            return True
+        if self.config.SESSION_EXPIRATION_DELTA <= 0:
+            return False
+        try:
+            remaining = (
+                datetime.fromisoformat(session["expiresAt"]) - datetime.now()
+            ).total_seconds()
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            return True
+        return (
+            self.config.SESSION_EXPIRATION_DELTA - remaining
+            >= self.config.SESSION_REFRESH_THRESHOLD
+            * self.config.SESSION_EXPIRATION_DELTA
+        )
+
+    @property
+    def remember_duration(self) -> timedelta:
+        """Returns duration of the remember_token-cookie."""
+        return timedelta(
+            seconds=(
+                34560000
+                if self.config.SESSION_EXPIRATION_DELTA <= 0
+                else self.config.SESSION_EXPIRATION_DELTA
+            )
+        )
+
     def update_session_expiration(
-        self, session_key: str, session: dict
+        self, session_key: str, session: dict, deferred: bool = False
     ) -> None:
         """
         Updates session's-expiresAt field in the session-store.
@@ -66,8 +104,16 @@ class AuthView(services.View):
         Keyword arguments:
         session_key -- session identifier
         session -- session as JSON
+        deferred -- if `True`, the write is deferred and batched by the
+                    session-store
+                    (default False)
         """
-        self.config.sessions.write(
+        write = (
+            self.config.sessions.write_deferred
+            if deferred
+            else self.config.sessions.write
+        )
+        write(
             session_key,
             session
             | (
@@ -92,10 +138,45 @@ class AuthView(services.View):
             r = Response("OK", mimetype="text/plain", status=200)
 
             # refresh session
-            self.update_session_expiration(
-                current_session.key,
-                self.config.sessions.read(current_session.key),
-            )
+            session = self.config.sessions.read(current_session.key)
+            if session is None:
+                # session has been deleted in the meantime (in signed
+                # mode, this is not detected by `load_user`)
+                if self.config.SESSION_SIGNED:
+                    self.config.session_signer.revoke_session(
+                        current_session.key
+                    )
+                logout_user()
+                r = Response("Unauthorized", mimetype="text/plain", status=401)
+                r.delete_cookie("session")
+                r.delete_cookie("remember_token")
+                return r
+            if self.requires_refresh(session):
+                self.update_session_expiration(
+                    current_session.key,
+                    session,
+                    deferred=self.config.SESSION_COALESCE_WRITES,
+                )
+                if self.config.SESSION_SIGNED:
+                    # re-issue signed session with updated expiration
+                    # (this also refreshes the remember_token-cookie)
+                    claim = self.config.session_signer.verify(
+                        current_session.id
+                    )
+                    if claim is not None:
+                        login_user(
+                            Session(
+                                id=self.config.session_signer.issue(
+                                    claim.sid, claim.user_config_id
+                                ),
+                                key=current_session.key,
+                                user_config_id=current_session.user_config_id,
+                                user=current_session.user,
+                            ),
+                            remember=True,
+                            duration=self.remember_duration,
+                        )
+                        return r
             # flask-login does not seem to support refreshing the
             # remember_token-cookie in this way
             # do that explicitly instead:
@@ -185,21 +266,17 @@ class AuthView(services.View):
             self.update_session_expiration(
                 session.key, {"userConfigId": response.data.id}
             )
+            if self.config.SESSION_SIGNED:
+                session.id = self.config.session_signer.issue(
+                    session.id, response.data.id
+                )
 
             print(
                 f"Successful login for user '{response.data.username}'.",
                 file=sys.stderr,
             )
             login_user(
-                session,
-                remember=True,
-                duration=timedelta(
-                    seconds=(
-                        34560000
-                        if self.config.SESSION_EXPIRATION_DELTA <= 0
-                        else self.config.SESSION_EXPIRATION_DELTA
-                    )
-                ),
+                session, remember=True, duration=self.remember_duration
             )
 
             return jsonify(config_jsonable), 200
@@ -232,6 +309,8 @@ class AuthView(services.View):
         def logout():
             """Log user out."""
             self.config.sessions.delete(current_session.key)
+            if self.config.SESSION_SIGNED:
+                self.config.session_signer.revoke_session(current_session.key)
             print(
                 "Successful logout for user "
                 + f"'{current_session.user.config.get('username', '??')}'.",
@@ -4,7 +4,9 @@ Job View-class definition
 
 from typing import Optional
 from collections.abc import Iterable
-from json import loads, JSONDecodeError
+from json import loads, dumps, JSONDecodeError
+from queue import Empty
+from time import monotonic
 
 from flask import Blueprint, Response, request, jsonify, stream_with_context
 from flask_login import login_required, current_user as current_session
@@ -14,7 +16,15 @@ from dcm_backend_sdk import JobApi, ConfigApi, ArtifactApi
 
 from dcm_frontend.config import AppConfig
 from dcm_frontend.decorators import requires_permission, generate_workspaces
-from dcm_frontend.util import call_backend
+from dcm_frontend.util import (
+    call_backend,
+    call_backend_many,
+    call_backend_raw,
+    proxied_streams,
+    stream_raw_response,
+)
+from dcm_frontend.workspace_index import WorkspaceIndex
+from dcm_frontend.job_status import JobStatusBroker
 
 
 class JobView(services.View):
@@ -28,11 +38,110 @@ class JobView(services.View):
         backend_job_api: JobApi,
         backend_config_api: ConfigApi,
         backend_artifact_api: ArtifactApi,
+        backend_session: Optional[requests.Session] = None,
+        workspace_index: Optional[WorkspaceIndex] = None,
+        job_status_broker: Optional[JobStatusBroker] = None,
     ) -> None:
         super().__init__(config)
         self.backend_job_api = backend_job_api
         self.backend_config_api = backend_config_api
         self.backend_artifact_api = backend_artifact_api
+        # used for raw requests to the backend
+        self.backend_session = backend_session or requests.Session()
+        self.workspace_index = workspace_index or WorkspaceIndex(
+            config, backend_config_api, backend_job_api
+        )
+        self.job_status_broker = job_status_broker or JobStatusBroker(
+            config, backend_config_api, backend_job_api, self.workspace_index
+        )
+
+    @staticmethod
+    def _job_in_workspaces(
+        job_info, workspaces: Optional[Iterable[str]]
+    ) -> bool:
+        """
+        Returns `True` if the job described by `job_info` (requires
+        'workspaceId' and 'triggerType') is accessible with the given
+        `workspaces`.
+        """
+        return (
+            # make an exception here to support test-jobs which do
+            # not contain a workspace-reference
+            (job_info.workspace_id is None and job_info.trigger_type == "test")
+            # regular workspace-rules
+            or workspaces is None
+            or job_info.workspace_id in workspaces
+        )
+
+    def _indexed_job_in_workspaces(
+        self, token: Optional[str], workspaces: Iterable[str]
+    ) -> Optional[bool]:
+        """
+        Returns `True` if the job `token` is accessible with the given
+        `workspaces` based on the workspace-index (via the job's
+        configuration). Returns `None` if the job is not indexed.
+        """
+        job_config_id = self.workspace_index.get(WorkspaceIndex.JOB, token)
+        if job_config_id is None:
+            return None
+        response = self.workspace_index.get_job_config_workspace(
+            job_config_id
+        )
+        if response.status_code != 200:
+            return None
+        return response.data in workspaces
+
+    def _check_status_subscription(
+        self,
+        job_config_ids: list[str],
+        tokens: list[str],
+        workspaces: Optional[Iterable[str]],
+    ) -> bool:
+        """
+        Returns `True` if all `job_config_ids` and `tokens` are
+        accessible with the given `workspaces`.
+        """
+        if workspaces is None:
+            return True
+        if any(
+            workspace_id not in workspaces
+            for workspace_id in self.workspace_index.get_job_config_workspaces(
+                job_config_ids
+            ).values()
+        ):
+            return False
+        missing = []
+        for token in tokens:
+            accessible = self._indexed_job_in_workspaces(token, workspaces)
+            if accessible is None:
+                missing.append(token)
+            elif not accessible:
+                return False
+        for token, response in zip(
+            missing,
+            call_backend_many(
+                [
+                    {
+                        "endpoint": (
+                            self.backend_job_api.get_job_info_with_http_info
+                        ),
+                        "args": (token, "jobConfigId,workspaceId,triggerType"),
+                    }
+                    for token in missing
+                ],
+                request_timeout=self.config.BACKEND_TIMEOUT,
+                executor=self.config.backend_executor,
+                deadline=self.config.BACKEND_BATCH_DEADLINE,
+            ),
+        ):
+            if response.status_code != 200:
+                return False
+            self.workspace_index.set(
+                WorkspaceIndex.JOB, token, response.data.job_config_id
+            )
+            if not self._job_in_workspaces(response.data, workspaces):
+                return False
+        return True
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
         @bp.route("/job", methods=["POST"])
@@ -42,26 +151,24 @@ class JobView(services.View):
         def trigger_job(workspaces: Optional[Iterable[str]]):
             # enforce workspace-rules
             if workspaces is not None:
-                # get full config
-                response_job_config = call_backend(
-                    endpoint=(
-                        self.backend_job_api.get_job_config_with_http_info
-                    ),
-                    args=(request.args.get("id"),),
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                # get workspace of config
+                response_workspace = (
+                    self.workspace_index.get_job_config_workspace(
+                        request.args.get("id")
+                    )
                 )
                 if (
-                    response_job_config.status_code == 200
-                    and response_job_config.data.workspace_id not in workspaces
+                    response_workspace.status_code == 200
+                    and response_workspace.data not in workspaces
                 ):
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
-                if response_job_config.status_code != 200:
+                if response_workspace.status_code != 200:
                     return Response(
-                        response_job_config.fail_reason,
+                        response_workspace.fail_reason,
                         mimetype="text/plain",
-                        status=response_job_config.status_code,
+                        status=response_workspace.status_code,
                     )
 
             # attempt submission of job
@@ -81,7 +188,11 @@ class JobView(services.View):
                     mimetype="text/plain",
                     status=response.status_code,
                 )
-            return jsonify(response.data.to_dict()), 200
+            token = response.data.to_dict()
+            self.workspace_index.set(
+                WorkspaceIndex.JOB, token.get("value"), request.args.get("id")
+            )
+            return jsonify(token), 200
 
         @bp.route("/job", methods=["DELETE"])
         @login_required
@@ -93,7 +204,7 @@ class JobView(services.View):
                 # get job info
                 response_job_info = call_backend(
                     endpoint=self.backend_job_api.get_job_info_with_http_info,
-                    args=(request.json.get("token"),),
+                    args=(request.json.get("token"), "status,jobConfigId"),
                     request_timeout=self.config.BACKEND_TIMEOUT,
                 )
                 if response_job_info.status_code != 200:
@@ -108,26 +219,29 @@ class JobView(services.View):
                         mimetype="text/plain",
                         status=400,
                     )
-                # get full config
-                response_job_config = call_backend(
-                    endpoint=(
-                        self.backend_job_api.get_job_config_with_http_info
-                    ),
-                    args=(response_job_info.data.job_config_id,),
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                self.workspace_index.set(
+                    WorkspaceIndex.JOB,
+                    request.json.get("token"),
+                    response_job_info.data.job_config_id,
+                )
+                # get workspace of config
+                response_workspace = (
+                    self.workspace_index.get_job_config_workspace(
+                        response_job_info.data.job_config_id
+                    )
                 )
                 if (
-                    response_job_config.status_code == 200
-                    and response_job_config.data.workspace_id not in workspaces
+                    response_workspace.status_code == 200
+                    and response_workspace.data not in workspaces
                 ):
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
-                if response_job_config.status_code != 200:
+                if response_workspace.status_code != 200:
                     return Response(
-                        response_job_config.fail_reason,
+                        response_workspace.fail_reason,
                         mimetype="text/plain",
-                        status=response_job_config.status_code,
+                        status=response_workspace.status_code,
                     )
 
             # attempt to abort the given job
@@ -162,28 +276,25 @@ class JobView(services.View):
             job_config = request.json
             # enforce workspace-rules
             if workspaces is not None:
-                # get associated template config
-                response_template_config = call_backend(
-                    endpoint=(
-                        self.backend_config_api.get_template_with_http_info
-                    ),
-                    args=(job_config.get("templateId"),),
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                # get workspace of associated template config
+                response_workspace = (
+                    self.workspace_index.get_template_workspace(
+                        job_config.get("templateId")
+                    )
                 )
 
                 if (
-                    response_template_config.status_code == 200
-                    and response_template_config.data.workspace_id
-                    not in workspaces
+                    response_workspace.status_code == 200
+                    and response_workspace.data not in workspaces
                 ):
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
-                if response_template_config.status_code != 200:
+                if response_workspace.status_code != 200:
                     return Response(
-                        response_template_config.fail_reason,
+                        response_workspace.fail_reason,
                         mimetype="text/plain",
-                        status=response_template_config.status_code,
+                        status=response_workspace.status_code,
                     )
 
             # attempt submission of job
@@ -206,13 +317,52 @@ class JobView(services.View):
         @generate_workspaces(*self.config.ACL.READ_JOB)
         def get_job_info(workspaces: Optional[Iterable[str]]):
             request_keys = request.args.get("keys")
+            token = request.args.get("token")
+
+            # enforce workspace-rules via index (if possible)
+            accessible = (
+                None
+                if workspaces is None
+                else self._indexed_job_in_workspaces(token, workspaces)
+            )
+            if accessible is False:
+                return Response("Forbidden", mimetype="text/plain", status=403)
+
+            # passthrough requires that workspace-rules are satisfied
+            # without deserializing the job info
+            if "get_job_info" in self.config.BACKEND_PASSTHROUGH and (
+                workspaces is None or accessible
+            ):
+                response = call_backend_raw(
+                    endpoint=(
+                        self.backend_job_api.get_job_info_without_preload_content
+                    ),
+                    args=(token, request_keys),
+                    request_timeout=self.config.BACKEND_TIMEOUT,
+                )
+                if response.status_code != 200:
+                    return Response(
+                        response.fail_reason,
+                        mimetype="text/plain",
+                        status=response.status_code,
+                    )
+                return stream_raw_response(response.data)
+
             # add 'workspaceId', if not included in request
             # required to enforce the workspace-rules
             if request_keys and "workspaceId" not in request_keys:
                 request_keys += ",workspaceId"
+            # add 'jobConfigId' to index the job (allows passthrough for
+            # subsequent requests); not returned if not requested
+            drop_job_config_id = bool(request_keys) and (
+                "jobConfigId" not in request_keys
+            )
+            if drop_job_config_id:
+                request_keys += ",jobConfigId"
+
             response = call_backend(
                 endpoint=(self.backend_job_api.get_job_info_with_http_info),
-                args=(request.args.get("token"), request_keys),
+                args=(token, request_keys),
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
 
@@ -223,21 +373,113 @@ class JobView(services.View):
                     status=response.status_code,
                 )
 
+            self.workspace_index.set(
+                WorkspaceIndex.JOB, token, response.data.job_config_id
+            )
+
             # enforce workspace-rules
-            if (
-                # make an exception here to support test-jobs which do
-                # not contain a workspace-reference
-                not (
-                    response.data.workspace_id is None
-                    and response.data.trigger_type == "test"
+            if not self._job_in_workspaces(response.data, workspaces):
+                return Response("Forbidden", mimetype="text/plain", status=403)
+
+            job_info = response.data.to_dict()
+            if drop_job_config_id:
+                job_info.pop("jobConfigId", None)
+            return jsonify(job_info), 200
+
+        @bp.route("/jobs/status", methods=["GET"])
+        @login_required
+        @requires_permission(*self.config.ACL.READ_JOB)
+        @generate_workspaces(*self.config.ACL.READ_JOB)
+        def get_jobs_status(workspaces: Optional[Iterable[str]]):
+            if "jobConfigIds" not in request.args:
+                return Response(
+                    "Missing 'jobConfigIds'.",
+                    mimetype="text/plain",
+                    status=400,
+                )
+            job_config_ids = list(
+                dict.fromkeys(
+                    id_
+                    for id_ in request.args["jobConfigIds"].split(",")
+                    if id_
+                )
+            )
+
+            # enforce workspace-rules (omit inaccessible configurations)
+            latest_execs, infos = self.job_status_broker.fetch(
+                job_config_ids, workspaces=workspaces
+            )
+            return (
+                jsonify(
+                    {
+                        job_config_id: {
+                            "token": token,
+                            "info": infos.get(token) if token else None,
+                        }
+                        for job_config_id, token in latest_execs.items()
+                    }
+                ),
+                200,
+            )
+
+        @bp.route("/job/status/stream", methods=["GET"])
+        @login_required
+        @requires_permission(*self.config.ACL.READ_JOB)
+        @generate_workspaces(*self.config.ACL.READ_JOB)
+        def stream_job_status(workspaces: Optional[Iterable[str]]):
+            job_config_ids = [
+                id_
+                for id_ in request.args.get("jobConfigIds", "").split(",")
+                if id_
+            ]
+            tokens = [
+                token
+                for token in request.args.get("tokens", "").split(",")
+                if token
+            ]
+            if not job_config_ids and not tokens:
+                return Response(
+                    "Missing 'jobConfigIds' or 'tokens'.",
+                    mimetype="text/plain",
+                    status=400,
                 )
-                # regular workspace-rules
-                and workspaces is not None
-                and response.data.workspace_id not in workspaces
+
+            # enforce workspace-rules
+            if not self._check_status_subscription(
+                job_config_ids, tokens, workspaces
             ):
                 return Response("Forbidden", mimetype="text/plain", status=403)
 
-            return jsonify(response.data.to_dict()), 200
+            # subscribe only once the body is being streamed (the
+            # subscription is removed when the stream ends)
+            def generate():
+                subscription = self.job_status_broker.subscribe(
+                    job_config_ids, tokens
+                )
+                try:
+                    end = monotonic() + self.config.JOB_STATUS_STREAM_DURATION
+                    while (remaining := end - monotonic()) > 0:
+                        try:
+                            event = subscription.queue.get(
+                                timeout=min(
+                                    remaining, self.config.JOB_STATUS_KEEPALIVE
+                                )
+                            )
+                        except Empty:
+                            yield ": keep-alive\n\n"
+                            continue
+                        yield f"event: status\ndata: {dumps(event)}\n\n"
+                finally:
+                    self.job_status_broker.unsubscribe(subscription)
+
+            return Response(
+                stream_with_context(generate()),
+                mimetype="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "X-Accel-Buffering": "no",
+                },
+            )
 
         @bp.route("/job/ies", methods=["GET"])
         @login_required
@@ -254,34 +496,47 @@ class JobView(services.View):
             # enforce workspace-rules
             if workspaces is not None:
                 # get workspace info
-                response = call_backend(
-                    endpoint=self.backend_job_api.get_job_config_with_http_info,
-                    kwargs={"id": request.args["jobConfigId"]},
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                response = self.workspace_index.get_job_config_workspace(
+                    request.args["jobConfigId"]
                 )
                 if response.status_code != 200:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
 
-                if response.data.workspace_id not in workspaces:
+                if response.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
 
             # fetch IE-data
+            kwargs = {
+                "job_config_id": request.args["jobConfigId"],
+                "filter_by_status": request.args.get("filterByStatus"),
+                "filter_by_text": request.args.get("filterByText"),
+                "sort": request.args.get("sort"),
+                "range": request.args.get("range"),
+                "count": request.args.get("count"),
+            }
+            if "get_job_ies" in self.config.BACKEND_PASSTHROUGH:
+                response = call_backend_raw(
+                    endpoint=(
+                        self.backend_job_api.get_ies_without_preload_content
+                    ),
+                    kwargs=kwargs,
+                    request_timeout=self.config.BACKEND_TIMEOUT,
+                )
+                if response.status_code != 200:
+                    return Response(
+                        response.fail_reason,
+                        mimetype="text/plain",
+                        status=response.status_code,
+                    )
+                return stream_raw_response(response.data)
+
             response = call_backend(
                 endpoint=(self.backend_job_api.get_ies_with_http_info),
-                kwargs=(
-                    {
-                        "job_config_id": request.args["jobConfigId"],
-                        "filter_by_status": request.args.get("filterByStatus"),
-                        "filter_by_text": request.args.get("filterByText"),
-                        "sort": request.args.get("sort"),
-                        "range": request.args.get("range"),
-                        "count": request.args.get("count"),
-                    }
-                ),
+                kwargs=kwargs,
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
 
@@ -306,6 +561,32 @@ class JobView(services.View):
                     status=400,
                 )
 
+            if "get_job_ie" in self.config.BACKEND_PASSTHROUGH:
+                # enforce workspace-rules (via index)
+                if workspaces is not None:
+                    response = self.workspace_index.get_ie_workspace(
+                        request.args["id"]
+                    )
+                    if (
+                        response.status_code != 200
+                        or response.data not in workspaces
+                    ):
+                        return Response(
+                            "Forbidden", mimetype="text/plain", status=403
+                        )
+
+                response = call_backend_raw(
+                    endpoint=self.backend_job_api.get_ie_without_preload_content,
+                    kwargs={"id": request.args["id"]},
+                    request_timeout=self.config.BACKEND_TIMEOUT,
+                )
+                # return if unknown without leaking info
+                if response.status_code != 200:
+                    return Response(
+                        "Forbidden", mimetype="text/plain", status=403
+                    )
+                return stream_raw_response(response.data)
+
             # first fetch data, then check whether user is authorized;
             # because first the job-configuration id is needed which the
             # requested endpoint provides
@@ -325,20 +606,24 @@ class JobView(services.View):
                     "Forbidden", mimetype="text/plain", status=403
                 )
 
+            self.workspace_index.set(
+                WorkspaceIndex.IE,
+                request.args["id"],
+                ie_response.data.job_config_id,
+            )
+
             # enforce workspace-rules
             if workspaces is not None:
                 # get workspace info
-                response = call_backend(
-                    endpoint=self.backend_job_api.get_job_config_with_http_info,
-                    kwargs={"id": ie_response.data.job_config_id},
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                response = self.workspace_index.get_job_config_workspace(
+                    ie_response.data.job_config_id
                 )
                 if response.status_code != 200:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
 
-                if response.data.workspace_id not in workspaces:
+                if response.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -363,30 +648,16 @@ class JobView(services.View):
 
             # enforce workspace-rules
             if workspaces is not None:
-                # get IE
-                ie_response = call_backend(
-                    endpoint=(self.backend_job_api.get_ie_with_http_info),
-                    kwargs={
-                        "id": request.json["id"],
-                    },
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                # get workspace info (via IE's job-configuration)
+                response_workspace = self.workspace_index.get_ie_workspace(
+                    request.json["id"]
                 )
-                if ie_response.status_code != 200:
-                    return Response(
-                        "Forbidden", mimetype="text/plain", status=403
-                    )
-                # get workspace info
-                job_config_response = call_backend(
-                    endpoint=self.backend_job_api.get_job_config_with_http_info,
-                    kwargs={"id": ie_response.data.job_config_id},
-                    request_timeout=self.config.BACKEND_TIMEOUT,
-                )
-                if job_config_response.status_code != 200:
+                if response_workspace.status_code != 200:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
 
-                if job_config_response.data.workspace_id not in workspaces:
+                if response_workspace.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -410,6 +681,28 @@ class JobView(services.View):
         @bp.route("/job/artifacts/report", methods=["GET"])
         @login_required
         def get_bundle_job_report():
+            if "get_bundle_job_report" in self.config.BACKEND_PASSTHROUGH:
+                response = call_backend_raw(
+                    endpoint=(
+                        self.backend_artifact_api.get_bundling_report_without_preload_content
+                    ),
+                    args=(request.args.get("token"),),
+                    request_timeout=self.config.BACKEND_TIMEOUT,
+                )
+                if response.status_code == 200:
+                    return stream_raw_response(response.data)
+                # handle busy-status
+                if response.status_code == 503:
+                    try:
+                        return jsonify(loads(response.data)), 503
+                    except (JSONDecodeError, TypeError):
+                        pass
+                return Response(
+                    response.fail_reason,
+                    mimetype="text/plain",
+                    status=response.status_code,
+                )
+
             response = call_backend(
                 endpoint=(
                     self.backend_artifact_api.get_bundling_report_with_http_info
@@ -454,7 +747,7 @@ class JobView(services.View):
         @bp.route("/job/artifacts/bundle", methods=["GET"])
         @login_required
         def download_artifact_bundle():
-            backend_resp = requests.get(
+            backend_resp = self.backend_session.get(
                 f"{self.config.BACKEND_HOST}/artifact",
                 params=request.args,
                 stream=True,
@@ -468,7 +761,9 @@ class JobView(services.View):
 
             def generate():
                 try:
-                    for chunk in backend_resp.iter_content(chunk_size=8192):
+                    for chunk in proxied_streams.track(
+                        backend_resp.iter_content(chunk_size=8192)
+                    ):
                         if chunk:
                             yield chunk
                 finally:
@@ -478,4 +773,6 @@ class JobView(services.View):
                 stream_with_context(generate()),
                 status=backend_resp.status_code,
                 headers=backend_resp.headers,
+                # already compressed; also prevents response-compression
+                direct_passthrough=True,
             )
@@ -12,8 +12,18 @@ from dcm_common.util import now
 from dcm_backend_sdk import ConfigApi
 
 from dcm_frontend.config import AppConfig
-from dcm_frontend.decorators import requires_permission, generate_workspaces
-from dcm_frontend.util import call_backend, remove_from_json
+from dcm_frontend.decorators import (
+    requires_permission,
+    generate_workspaces,
+    conditional_response,
+)
+from dcm_frontend.util import (
+    call_backend,
+    remove_from_json,
+    model_etag,
+    not_modified,
+)
+from dcm_frontend.workspace_index import WorkspaceIndex
 
 
 class JobConfigView(services.View):
@@ -22,15 +32,22 @@ class JobConfigView(services.View):
     NAME = "job_config"
 
     def __init__(
-        self, config: AppConfig, backend_config_api: ConfigApi
+        self,
+        config: AppConfig,
+        backend_config_api: ConfigApi,
+        workspace_index: Optional[WorkspaceIndex] = None,
     ) -> None:
         super().__init__(config)
         self.backend_config_api = backend_config_api
+        self.workspace_index = workspace_index or WorkspaceIndex(
+            config, backend_config_api
+        )
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
 
         @bp.route("/job-configs", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_JOBCONFIG)
         @generate_workspaces(*self.config.ACL.READ_JOBCONFIG)
         def list_job_configs(workspaces: Optional[Iterable[str]]):
@@ -47,21 +64,19 @@ class JobConfigView(services.View):
 
             # enforce workspace-rules
             if workspaces is not None:
-                # fetch individual job_configs and filter by workspace ids
-                filtered = []
-                for job_config_id in response.data:
-                    response_inner = call_backend(
-                        endpoint=(
-                            self.backend_config_api.get_job_config_with_http_info
-                        ),
-                        args=(job_config_id,),
-                        request_timeout=self.config.BACKEND_TIMEOUT,
+                # get workspaces of individual job_configs (missing
+                # entries are fetched concurrently) and filter by
+                # workspace ids
+                job_config_workspaces = (
+                    self.workspace_index.get_job_config_workspaces(
+                        response.data
                     )
-                    if (
-                        response_inner.status_code == 200
-                        and response_inner.data.workspace_id in workspaces
-                    ):
-                        filtered.append(job_config_id)
+                )
+                filtered = [
+                    job_config_id
+                    for job_config_id in response.data
+                    if job_config_workspaces[job_config_id] in workspaces
+                ]
                 return jsonify(filtered), 200
             return jsonify(response.data), 200
 
@@ -81,12 +96,10 @@ class JobConfigView(services.View):
                         mimetype="text/plain",
                         status=400,
                     )
-                response_template = call_backend(
-                    endpoint=(
-                        self.backend_config_api.get_template_with_http_info
-                    ),
-                    args=(request.json["templateId"],),
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                response_template = (
+                    self.workspace_index.get_template_workspace(
+                        request.json["templateId"]
+                    )
                 )
                 if response_template.status_code != 200:
                     return Response(
@@ -94,7 +107,7 @@ class JobConfigView(services.View):
                         mimetype="text/plain",
                         status=response_template.status_code,
                     )
-                if response_template.data.workspace_id not in workspaces:
+                if response_template.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -114,6 +127,11 @@ class JobConfigView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                self.workspace_index.set(
+                    WorkspaceIndex.JOB_CONFIG,
+                    getattr(response.data, "id", None),
+                    getattr(response.data, "workspace_id", None),
+                )
                 return jsonify(response.data.to_dict()), 200
             return Response(
                 response.fail_reason,
@@ -123,6 +141,7 @@ class JobConfigView(services.View):
 
         @bp.route("/job-config", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_JOBCONFIG)
         @generate_workspaces(*self.config.ACL.READ_JOBCONFIG)
         def get_job_config(workspaces: Optional[Iterable[str]]):
@@ -138,13 +157,34 @@ class JobConfigView(services.View):
                     status=response.status_code
                 )
 
+            self.workspace_index.set(
+                WorkspaceIndex.JOB_CONFIG,
+                response.data.id,
+                response.data.workspace_id,
+            )
+
             # enforce workspace-rules
             if (
                 workspaces is not None
                 and response.data.workspace_id not in workspaces
             ):
                 return Response("Forbidden", mimetype="text/plain", status=403)
-            return jsonify(response.data.to_dict()), 200
+
+            # validate cached copies without serialization
+            etag = model_etag(
+                response.data,
+                "latestExec",
+                "scheduledExec",
+                "IEs",
+                "issues",
+                "issuesLatestExec",
+            )
+            if (not_modified_response := not_modified(etag)) is not None:
+                return not_modified_response
+            json_response = jsonify(response.data.to_dict())
+            if etag is not None:
+                json_response.set_etag(etag)
+            return json_response, 200
 
         @bp.route("/job-config", methods=["PUT"])
         @login_required
@@ -167,12 +207,10 @@ class JobConfigView(services.View):
                         mimetype="text/plain",
                         status=400,
                     )
-                response_template = call_backend(
-                    endpoint=(
-                        self.backend_config_api.get_template_with_http_info
-                    ),
-                    args=(request.json["templateId"],),
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                response_template = (
+                    self.workspace_index.get_template_workspace(
+                        request.json["templateId"]
+                    )
                 )
                 if response_template.status_code != 200:
                     return Response(
@@ -180,7 +218,7 @@ class JobConfigView(services.View):
                         mimetype="text/plain",
                         status=response_template.status_code,
                     )
-                if response_template.data.workspace_id not in workspaces:
+                if response_template.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -200,6 +238,10 @@ class JobConfigView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                # workspace may have changed via the template
+                self.workspace_index.invalidate(
+                    WorkspaceIndex.JOB_CONFIG, request.json.get("id")
+                )
                 return jsonify(response.data), 200
             return Response(
                 response.fail_reason,
@@ -212,13 +254,9 @@ class JobConfigView(services.View):
         @requires_permission(*self.config.ACL.DELETE_JOBCONFIG)
         @generate_workspaces(*self.config.ACL.DELETE_JOBCONFIG)
         def delete_job_config(workspaces: Optional[Iterable[str]]):
-            # get job_config
-            response_inner = call_backend(
-                endpoint=(
-                    self.backend_config_api.get_job_config_with_http_info
-                ),
-                args=(request.args["id"],),
-                request_timeout=self.config.BACKEND_TIMEOUT,
+            # get job_config's workspace
+            response_inner = self.workspace_index.get_job_config_workspace(
+                request.args["id"]
             )
             if response_inner.status_code != 200:
                 return Response(
@@ -229,7 +267,7 @@ class JobConfigView(services.View):
             # enforce workspace-rules
             if workspaces is not None:
                 # bad target-workspace
-                if response_inner.data.workspace_id not in workspaces:
+                if response_inner.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -240,6 +278,9 @@ class JobConfigView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                self.workspace_index.invalidate(
+                    WorkspaceIndex.JOB_CONFIG, request.args["id"]
+                )
                 return Response(
                     "OK",
                     mimetype="text/plain",
@@ -253,6 +294,7 @@ class JobConfigView(services.View):
 
         @bp.route("/job-config/configuration/rights", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_JOBCONFIG
@@ -267,6 +309,7 @@ class JobConfigView(services.View):
             "/job-config/configuration/significant-properties", methods=["GET"]
         )
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_JOBCONFIG
@@ -281,6 +324,7 @@ class JobConfigView(services.View):
             "/job-config/configuration/preservation", methods=["GET"]
         )
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_JOBCONFIG
@@ -2,19 +2,35 @@
 Miscellaneous View-class definition
 """
 
-from typing import Callable, Any
+from typing import Callable, Any, Optional
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import sys
 import threading
 from datetime import datetime
+from hmac import compare_digest
 
-from flask import Blueprint, Response, request, jsonify
-from flask_login import login_required
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    request,
+    jsonify,
+    stream_with_context,
+    url_for,
+)
+from flask_login import login_required, current_user as current_session
 import requests
 from dcm_common import services
 from oai_pmh_extractor import RepositoryInterface
 
 from dcm_frontend.decorators import requires_permission
 from dcm_frontend.config import AppConfig
+from dcm_frontend.util import LRUCache
+from dcm_frontend.metrics import Metrics, MetricFamily
+from dcm_frontend.oai_cache import OAICache
+from dcm_frontend.oai_probes import OAIProbes
 try:
     from dcm_frontend.build_info import BuildInfo
 except ImportError:
@@ -34,19 +50,51 @@ class MiscellaneousView(services.View):
     """View-class for miscellaneous data."""
 
     NAME = "misc"
+    # maximum number of idle `RepositoryInterface`s kept per repository
+    OAI_IDLE_INTERFACES = 3
 
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(
+        self, config: AppConfig, metrics: Optional[Metrics] = None
+    ) -> None:
         super().__init__(config)
+        self.metrics = metrics
         self._welcome = self.config.WELCOME_MESSAGE_TEMPLATE.format(
             VERSION=BuildInfo.VERSION,
             BUILD_DATETIME=BuildInfo.BUILD_DATETIME,
         )
-        self._cache_lock = threading.Lock()
-        self._oai_cache: dict[str, dict] = {
-            "identify": {},
-            "metadata_prefixes": {},
-            "sets": {},
+        # shared by the background refreshes of all oai-caches
+        oai_cache_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.OAI_CACHE_REFRESH_WORKERS),
+            thread_name_prefix="oai-cache-refresh",
+        )
+        self._oai_cache: dict[str, OAICache] = {
+            cache_id: OAICache(
+                maxsize=self.config.OAI_CACHE_MAXSIZE,
+                ttl=self.config.OAI_CACHE_TTL,
+                max_stale=self.config.OAI_CACHE_MAX_STALE,
+                executor=oai_cache_executor,
+            )
+            for cache_id in (
+                "identify",
+                "metadata_prefixes",
+                "sets",
+                # pages of sets (see `GET-/api/misc/oai/sets/stream`)
+                "set_pages",
+            )
         }
+        # repository url -> idle `RepositoryInterface`s (see
+        # `_repository_interface`)
+        self._oai_interfaces = LRUCache(
+            maxsize=self.config.OAI_CACHE_MAXSIZE
+        )
+        self._oai_interfaces_lock = threading.Lock()
+        self._oai_probes = OAIProbes(
+            max_workers=self.config.OAI_PROBE_WORKERS,
+            max_pending=self.config.OAI_PROBE_MAX_PENDING,
+            ttl=self.config.OAI_PROBE_TTL,
+        )
+        if self.metrics is not None:
+            self.metrics.add_collector(self._collect_oai_metrics)
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
         @bp.route("/app-info", methods=["GET"])
@@ -66,6 +114,8 @@ class MiscellaneousView(services.View):
         self._add_build_info_endpoint(bp)
         self._add_welcome_endpoint(bp)
         self._add_oai_endpoints(bp)
+        if self.metrics is not None:
+            self._add_metrics_endpoint(bp)
 
     def _add_build_info_endpoint(self, bp: Blueprint):
         @bp.route("/build-info", methods=["GET"])
@@ -83,12 +133,204 @@ class MiscellaneousView(services.View):
             """Returns formatted welcome-message."""
             return Response(self._welcome, mimetype="text/html", status=200)
 
+    def _add_metrics_endpoint(self, bp: Blueprint):
+        @bp.route("/metrics", methods=["GET"])
+        def metrics():
+            """
+            Returns metrics in the Prometheus text-format. Requires the
+            bearer-token `METRICS_TOKEN`; if not configured, only
+            requests from localhost are accepted in testing-mode.
+            """
+            if self.config.METRICS_TOKEN is not None:
+                if not compare_digest(
+                    request.headers.get("Authorization", ""),
+                    f"Bearer {self.config.METRICS_TOKEN}",
+                ):
+                    return Response(
+                        "Missing or bad token.",
+                        mimetype="text/plain",
+                        status=401,
+                    )
+            elif not getattr(
+                self.config, "TESTING", False
+            ) or request.remote_addr not in ("127.0.0.1", "::1"):
+                # behind a reverse proxy, all requests appear to be local
+                return Response(
+                    "Forbidden.", mimetype="text/plain", status=403
+                )
+            return Response(
+                self.metrics.render(),
+                content_type="text/plain; version=0.0.4; charset=utf-8",
+                status=200,
+            )
+
+    def _collect_oai_metrics(self) -> list[MetricFamily]:
+        """
+        Returns sizes and ages of the oai-caches and the number of
+        pending asynchronous oai-requests.
+        """
+        return [
+            (
+                "dcm_frontend_oai_cache_entries",
+                "gauge",
+                "Number of cached oai-responses.",
+                [
+                    (
+                        "dcm_frontend_oai_cache_entries",
+                        {"cache": cache_id},
+                        len(cache),
+                    )
+                    for cache_id, cache in self._oai_cache.items()
+                ],
+            ),
+            (
+                "dcm_frontend_oai_cache_oldest_entry_age_seconds",
+                "gauge",
+                "Age of the oldest cached oai-response.",
+                [
+                    (
+                        "dcm_frontend_oai_cache_oldest_entry_age_seconds",
+                        {"cache": cache_id},
+                        cache.age() or 0,
+                    )
+                    for cache_id, cache in self._oai_cache.items()
+                ],
+            ),
+            (
+                "dcm_frontend_oai_probes_pending",
+                "gauge",
+                "Number of pending asynchronous oai-requests.",
+                [
+                    (
+                        "dcm_frontend_oai_probes_pending",
+                        {},
+                        self._oai_probes.pending,
+                    )
+                ],
+            ),
+        ]
+
+    @staticmethod
+    def _oai_error(request_url: str, exc_info: Exception) -> tuple[str, int]:
+        """
+        Returns pair of message and status code for a failed
+        oai-request.
+        """
+        if isinstance(exc_info, requests.exceptions.ReadTimeout):
+            return (
+                "Failed to receive a timely response from "
+                + f"'{request_url}': {exc_info}",
+                504,
+            )
+        return f"Unable to connect: {exc_info}", 502
+
+    def _oai_error_response(self, request_url: str, exc_info: Exception):
+        """Returns error-response for a failed oai-request."""
+        message, status = self._oai_error(request_url, exc_info)
+        return Response(message, mimetype="text/plain", status=status)
+
+    def _list_sets(self, interface: RepositoryInterface) -> list:
+        """Collects sets (following resumption tokens)."""
+        sets = []
+        token = None
+        tokens_count = 0
+        while True:
+            sets_, token = interface.list_sets(_resumption_token=token)
+            sets.extend(sets_)
+            if token is None:
+                break
+            tokens_count += 1
+            if tokens_count > self.config.OAI_MAX_RESUMPTION_TOKENS:
+                raise OverflowError(
+                    "Maximum number of resumption tokens exceeded "
+                    + f"({self.config.OAI_MAX_RESUMPTION_TOKENS})."
+                )
+        return sets
+
+    @contextmanager
+    def _repository_interface(
+        self, request_url: str
+    ) -> Iterator[RepositoryInterface]:
+        """
+        Yields a `RepositoryInterface` for `request_url` that is not in
+        use by other requests. Interfaces (and thereby their
+        http-sessions) are pooled per repository url and reused by
+        subsequent requests.
+        """
+        with self._oai_interfaces_lock:
+            idle = self._oai_interfaces.get(request_url)
+            interface = idle.pop() if idle else None
+        if interface is None:
+            interface = RepositoryInterface(
+                base_url=request_url, timeout=self.config.OAI_TIMEOUT
+            )
+        try:
+            yield interface
+        finally:
+            with self._oai_interfaces_lock:
+                idle = self._oai_interfaces.get(request_url)
+                if idle is None:
+                    idle = []
+                    self._oai_interfaces.set(request_url, idle)
+                if len(idle) < self.OAI_IDLE_INTERFACES:
+                    idle.append(interface)
+
+    def _with_repository_interface(
+        self, request_url: str, handler: Callable[[RepositoryInterface], Any]
+    ) -> Any:
+        """
+        Returns result of `handler` for a pooled `RepositoryInterface`
+        (see `_repository_interface`).
+        """
+        with self._repository_interface(request_url) as interface:
+            return handler(interface)
+
+    def _probe_repository(self, request_url: str, force: bool) -> dict:
+        """
+        Returns results of Identify, ListMetadataFormats, and ListSets
+        for the oai-repository at `request_url` (see
+        `GET-/api/misc/oai/repository`). The requests are made
+        concurrently via the shared `backend_executor`, each using its
+        own pooled `RepositoryInterface`.
+        """
+        # result key -> cache id and handler
+        requests_ = {
+            "identify": ("identify", lambda i: i.identify()),
+            "metadataPrefixes": (
+                "metadata_prefixes",
+                lambda i: i.list_metadata_prefixes(),
+            ),
+            "sets": ("sets", self._list_sets),
+        }
+        futures = {
+            key: self.config.backend_executor.submit(
+                self._oai_cache[cache_id].get,
+                request_url,
+                lambda handler=handler: self._with_repository_interface(
+                    request_url, handler
+                ),
+                force,
+            )
+            for key, (cache_id, handler) in requests_.items()
+        }
+        result = {}
+        for key, future in futures.items():
+            exc_info = future.exception()
+            if exc_info is None:
+                result[key] = future.result()
+                continue
+            message, status = self._oai_error(request_url, exc_info)
+            result[key] = {"error": message, "status": status}
+        return result
+
     def _handle_oai_request(
         self, cache_id: str, handler: Callable[[RepositoryInterface], Any]
     ) -> Response:
         """
         Handle oai-request. Requires base url of oai-server as arg
-        'url'.
+        'url'. Stale cache values are served while being refreshed in
+        the background and concurrent requests for the same url share a
+        single request to the oai-repository (see `OAICache`).
 
         Keyword arguments:
         cache_id -- name of the relevant cache in `self._oai_cache`
@@ -97,6 +339,9 @@ class MiscellaneousView(services.View):
 
         Query Parameters:
         no-cache -- ignore any cache values
+        async -- process request in the background; responds with 202
+                 and a token for polling the result via
+                 `GET-/api/misc/oai/probe`
         """
         # validate request
         if "url" not in request.args:
@@ -106,36 +351,48 @@ class MiscellaneousView(services.View):
 
         # check for cached value if applicable
         request_url = request.args["url"]
-        try:
-            if (
-                request_url not in self._oai_cache[cache_id]
-                or "no-cache" in request.args
-            ):
-                result = handler(
-                    RepositoryInterface(
-                        base_url=request_url, timeout=self.config.OAI_TIMEOUT
-                    )
+        force = "no-cache" in request.args
+
+        def fetch():
+            return self._oai_cache[cache_id].get(
+                request_url,
+                lambda: self._with_repository_interface(
+                    request_url, handler
+                ),
+                force=force,
+            )
+
+        return self._oai_response(request_url, fetch)
+
+    def _oai_response(
+        self, request_url: str, fetch: Callable[[], Any]
+    ) -> Response:
+        """
+        Returns response for the oai-request `fetch` to the repository
+        at `request_url` (processed in the background if the
+        query-parameter 'async' is given; see `_handle_oai_request`).
+        """
+        if "async" in request.args:
+            token = self._oai_probes.submit(
+                fetch, request_url, owner=current_session.user_config_id
+            )
+            if token is None:
+                return Response(
+                    "Too many pending requests to oai-repositories.",
+                    mimetype="text/plain",
+                    status=503,
                 )
-                with self._cache_lock:
-                    self._oai_cache[cache_id][request_url] = result
             return (
-                jsonify(self._oai_cache[cache_id][request_url]),
-                200,
-            )
-        except requests.exceptions.ReadTimeout as exc_info:
-            return Response(
-                "Failed to receive a timely response from "
-                + f"'{request_url}': {exc_info}",
-                mimetype="text/plain",
-                status=504,
+                jsonify(token=token, status="pending"),
+                202,
+                {"Location": url_for(".oai_probe", token=token)},
             )
+
+        try:
+            return jsonify(fetch()), 200
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
-            return Response(
-                f"Unable to connect: {exc_info}",
-                mimetype="text/plain",
-                status=502,
-            )
+            return self._oai_error_response(request_url, exc_info)
 
     def _add_oai_endpoints(self, bp: Blueprint) -> None:
         @bp.route("/oai/cache", methods=["DELETE"])
@@ -144,12 +401,46 @@ class MiscellaneousView(services.View):
            *(self.config.ACL.CREATE_TEMPLATE + self.config.ACL.MODIFY_TEMPLATE)
         )
         def clear_cache():
-            """Clear all oai-caches."""
-            with self._cache_lock:
-                for cache in self._oai_cache.values():
+            """
+            Clear oai-caches. If the query-parameter 'url' is given,
+            only the entries for that url are removed.
+            """
+            for cache in self._oai_cache.values():
+                if "url" in request.args:
+                    cache.invalidate(request.args["url"])
+                else:
                     cache.clear()
             return Response("OK", mimetype="text/plain", status=200)
 
+        @bp.route("/oai/probe", methods=["GET"])
+        @login_required
+        def oai_probe():
+            """
+            Returns result of an asynchronous oai-request (see
+            `_handle_oai_request`) identified by the query-parameter
+            'token'. Responds with 202 while the request is pending.
+            """
+            if "token" not in request.args:
+                return Response(
+                    "Missing token.", mimetype="text/plain", status=400
+                )
+            probe = self._oai_probes.get(
+                request.args["token"], owner=current_session.user_config_id
+            )
+            if probe is None:
+                return Response(
+                    "Unknown token.", mimetype="text/plain", status=404
+                )
+            if not probe.future.done():
+                return (
+                    jsonify(token=request.args["token"], status="pending"),
+                    202,
+                )
+            exc_info = probe.future.exception()
+            if exc_info is not None:
+                return self._oai_error_response(probe.url, exc_info)
+            return jsonify(probe.future.result()), 200
+
         @bp.route("/oai/identify", methods=["GET"])
         @login_required
         @requires_permission(
@@ -194,22 +485,129 @@ class MiscellaneousView(services.View):
             in an oai-repository. See also description of
             `_handle_oai_request`.
             """
-            def handler(interface: RepositoryInterface) -> list[str]:
-                """Collects sets."""
-                sets = []
-                token = None
-                tokens_count = 0
-                while True:
-                    sets_, token = interface.list_sets(_resumption_token=token)
-                    sets.extend(sets_)
-                    if token is None:
-                        break
-                    tokens_count += 1
-                    if tokens_count > self.config.OAI_MAX_RESUMPTION_TOKENS:
-                        raise OverflowError(
-                            "Maximum number of resumption tokens exceeded "
-                            + f"({self.config.OAI_MAX_RESUMPTION_TOKENS})."
-                        )
-                return sets
-
-            return self._handle_oai_request("sets", handler)
+            return self._handle_oai_request("sets", self._list_sets)
+
+        @bp.route("/oai/repository", methods=["GET"])
+        @login_required
+        @requires_permission(
+           *(self.config.ACL.CREATE_TEMPLATE + self.config.ACL.MODIFY_TEMPLATE)
+        )
+        def oai_repository():
+            """
+            Returns the results of Identify, ListMetadataFormats, and
+            ListSets for an oai-repository as JSON-object with the keys
+            'identify', 'metadataPrefixes', and 'sets'. The requests are
+            made concurrently and use (and fill) the caches of the
+            individual endpoints. Failed requests are reported as
+            `{"error": <message>, "status": <status code>}`. See also
+            description of `_handle_oai_request`.
+            """
+            if "url" not in request.args:
+                return Response(
+                    "Missing url.", mimetype="text/plain", status=400
+                )
+            request_url = request.args["url"]
+            force = "no-cache" in request.args
+            return self._oai_response(
+                request_url,
+                lambda: self._probe_repository(request_url, force),
+            )
+
+        @bp.route("/oai/sets/stream", methods=["GET"])
+        @login_required
+        @requires_permission(
+            *(
+                self.config.ACL.CREATE_JOBCONFIG
+                + self.config.ACL.MODIFY_JOBCONFIG
+            )
+        )
+        def oai_sets_stream():
+            """
+            Streaming variant of `GET-/api/misc/oai/sets` that returns
+            newline-delimited JSON. Every page of sets is emitted as
+            soon as it is received as `{"sets": [...]}`. The stream ends
+            with either `{"done": true}` or `{"error": <message>,
+            "status": <status code>}`.
+
+            Pages are cached as they arrive, i.e., a later request
+            continues after the last received page (unless 'no-cache'
+            is given). If continuing fails (e.g., due to an expired
+            resumption token), the cached pages are discarded.
+            """
+            if "url" not in request.args:
+                return Response(
+                    "Missing url.", mimetype="text/plain", status=400
+                )
+            return Response(
+                stream_with_context(
+                    self._stream_oai_sets(
+                        request.args["url"], "no-cache" in request.args
+                    )
+                ),
+                mimetype="application/x-ndjson",
+                headers={"X-Accel-Buffering": "no"},
+                # emit pages immediately (prevents buffering by
+                # response-compression)
+                direct_passthrough=True,
+            )
+
+    def _stream_oai_sets(self, request_url: str, force: bool):
+        """
+        Yields lines of newline-delimited JSON for pages of sets of the
+        oai-repository at `request_url` (see `oai_sets_stream`).
+        """
+
+        # `direct_passthrough` requires bytes
+        def line(data) -> bytes:
+            return (current_app.json.dumps(data) + "\n").encode("utf-8")
+
+        if not force:
+            sets = self._oai_cache["sets"].peek(request_url)
+            if sets is not None:
+                yield line({"sets": sets})
+                yield line({"done": True})
+                return
+
+        # pairs of sets and resumption token of received pages
+        pages = (
+            [] if force else self._oai_cache["set_pages"].peek(request_url)
+        ) or []
+        for sets_, _ in pages:
+            yield line({"sets": sets_})
+        token = pages[-1][1] if pages else None
+        tokens_count = sum(1 for _, t in pages if t is not None)
+        # whether the next request uses a cached resumption token (which
+        # may have expired in the meantime)
+        resumed = bool(pages)
+        while not pages or token is not None:
+            try:
+                if tokens_count > self.config.OAI_MAX_RESUMPTION_TOKENS:
+                    raise OverflowError(
+                        "Maximum number of resumption tokens exceeded "
+                        + f"({self.config.OAI_MAX_RESUMPTION_TOKENS})."
+                    )
+                # the interface is not held while the page is consumed
+                with self._repository_interface(request_url) as interface:
+                    sets_, token = interface.list_sets(
+                        _resumption_token=token
+                    )
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                if resumed:
+                    # drop cached pages so that the next request starts
+                    # from the first page
+                    self._oai_cache["set_pages"].invalidate(request_url)
+                message, status = self._oai_error(request_url, exc_info)
+                yield line({"error": message, "status": status})
+                return
+            resumed = False
+            pages = pages + [(sets_, token)]
+            self._oai_cache["set_pages"].set(request_url, pages)
+            yield line({"sets": sets_})
+            if token is not None:
+                tokens_count += 1
+
+        self._oai_cache["sets"].set(
+            request_url, [set_ for sets_, _ in pages for set_ in sets_]
+        )
+        yield line({"done": True})
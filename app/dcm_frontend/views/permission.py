@@ -6,6 +6,8 @@ from flask import Blueprint, jsonify
 from flask_login import login_required
 from dcm_common import services
 
+from dcm_frontend.decorators import conditional_response
+
 
 class PermissionView(services.View):
     """View-class for user/group-permissions."""
@@ -15,6 +17,7 @@ class PermissionView(services.View):
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
         @bp.route("/permissions/groups")
         @login_required
+        @conditional_response
         def get_group_names():
             """Returns app's ACL-groups."""
             return (
@@ -24,6 +27,7 @@ class PermissionView(services.View):
 
         @bp.route("/permissions/config")
         @login_required
+        @conditional_response
         def get_acl_configuration():
             """Returns app's ACL-configuration."""
             return jsonify(self.config.ACL.json), 200
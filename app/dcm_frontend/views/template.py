@@ -12,8 +12,18 @@ from dcm_common.util import now
 from dcm_backend_sdk import ConfigApi, TemplateApi
 
 from dcm_frontend.config import AppConfig
-from dcm_frontend.decorators import requires_permission, generate_workspaces
-from dcm_frontend.util import call_backend, remove_from_json
+from dcm_frontend.decorators import (
+    requires_permission,
+    generate_workspaces,
+    conditional_response,
+)
+from dcm_frontend.util import (
+    call_backend,
+    call_backend_raw,
+    stream_raw_response,
+    remove_from_json,
+)
+from dcm_frontend.workspace_index import WorkspaceIndex
 
 
 class TemplateView(services.View):
@@ -26,15 +36,20 @@ class TemplateView(services.View):
         config: AppConfig,
         backend_config_api: ConfigApi,
         backend_template_api: TemplateApi,
+        workspace_index: Optional[WorkspaceIndex] = None,
     ) -> None:
         super().__init__(config)
         self.backend_config_api = backend_config_api
         self.backend_template_api = backend_template_api
+        self.workspace_index = workspace_index or WorkspaceIndex(
+            config, backend_config_api
+        )
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
 
         @bp.route("/templates", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_TEMPLATE)
         @generate_workspaces(*self.config.ACL.READ_TEMPLATE)
         def list_templates(workspaces: Optional[Iterable[str]]):
@@ -51,21 +66,19 @@ class TemplateView(services.View):
 
             # enforce workspace-rules
             if workspaces is not None:
-                # fetch individual templates and filter by workspace ids
-                filtered = []
-                for template_id in response.data:
-                    response_inner = call_backend(
-                        endpoint=(
-                            self.backend_config_api.get_template_with_http_info
-                        ),
-                        args=(template_id,),
-                        request_timeout=self.config.BACKEND_TIMEOUT,
+                # get workspaces of individual templates (missing
+                # entries are fetched concurrently) and filter by
+                # workspace ids
+                template_workspaces = (
+                    self.workspace_index.get_template_workspaces(
+                        response.data
                     )
-                    if (
-                        response.status_code == 200
-                        and response_inner.data.workspace_id in workspaces
-                    ):
-                        filtered.append(template_id)
+                )
+                filtered = [
+                    template_id
+                    for template_id in response.data
+                    if template_workspaces[template_id] in workspaces
+                ]
                 return jsonify(filtered), 200
             return jsonify(response.data), 200
 
@@ -98,6 +111,11 @@ class TemplateView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                self.workspace_index.set(
+                    WorkspaceIndex.TEMPLATE,
+                    response.data.id,
+                    request.json.get("workspaceId"),
+                )
                 return jsonify({"id": response.data.id}), 200
             return Response(
                 response.fail_reason,
@@ -107,6 +125,7 @@ class TemplateView(services.View):
 
         @bp.route("/template", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_TEMPLATE)
         @generate_workspaces(*self.config.ACL.READ_TEMPLATE)
         def get_template(workspaces: Optional[Iterable[str]]):
@@ -124,6 +143,12 @@ class TemplateView(services.View):
                     status=response.status_code
                 )
 
+            self.workspace_index.set(
+                WorkspaceIndex.TEMPLATE,
+                response.data.id,
+                response.data.workspace_id,
+            )
+
             # enforce workspace-rules
             if (
                 workspaces is not None
@@ -176,12 +201,8 @@ class TemplateView(services.View):
                     return Response(
                         "Missing 'id'", mimetype="text/plain", status=400
                     )
-                response = call_backend(
-                    endpoint=(
-                        self.backend_config_api.get_template_with_http_info
-                    ),
-                    args=[request.json["id"]],
-                    request_timeout=self.config.BACKEND_TIMEOUT,
+                response = self.workspace_index.get_template_workspace(
+                    request.json["id"]
                 )
                 if response.status_code != 200:
                     return Response(
@@ -189,7 +210,7 @@ class TemplateView(services.View):
                         mimetype="text/plain",
                         status=response.status_code,
                     )
-                if response.data.workspace_id not in workspaces:
+                if response.data not in workspaces:
                     return Response(
                         "Forbidden", mimetype="text/plain", status=403
                     )
@@ -211,6 +232,16 @@ class TemplateView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                # job-configurations inherit the template's workspace
+                if self.workspace_index.get(
+                    WorkspaceIndex.TEMPLATE, request.json.get("id")
+                ) != request.json.get("workspaceId"):
+                    self.workspace_index.invalidate(
+                        WorkspaceIndex.JOB_CONFIG
+                    )
+                self.workspace_index.invalidate(
+                    WorkspaceIndex.TEMPLATE, request.json.get("id")
+                )
                 return Response(
                     "OK",
                     mimetype="text/plain",
@@ -227,12 +258,8 @@ class TemplateView(services.View):
         @requires_permission(*self.config.ACL.DELETE_TEMPLATE)
         @generate_workspaces(*self.config.ACL.DELETE_TEMPLATE)
         def delete_template(workspaces: Optional[Iterable[str]]):
-            response = call_backend(
-                endpoint=(
-                    self.backend_config_api.get_template_with_http_info
-                ),
-                args=[request.args.get("id", "")],
-                request_timeout=self.config.BACKEND_TIMEOUT,
+            response = self.workspace_index.get_template_workspace(
+                request.args.get("id", "")
             )
             if response.status_code != 200:
                 return Response(
@@ -242,10 +269,7 @@ class TemplateView(services.View):
                 )
 
             # enforce workspace-rules
-            if (
-                workspaces is not None
-                and response.data.workspace_id not in workspaces
-            ):
+            if workspaces is not None and response.data not in workspaces:
                 return Response("Forbidden", mimetype="text/plain", status=403)
 
             # run query
@@ -257,6 +281,9 @@ class TemplateView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                self.workspace_index.invalidate(
+                    WorkspaceIndex.TEMPLATE, request.args.get("id")
+                )
                 return Response(
                     "OK",
                     mimetype="text/plain",
@@ -270,6 +297,7 @@ class TemplateView(services.View):
 
         @bp.route("/template/hotfolders", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_TEMPLATE
@@ -302,6 +330,7 @@ class TemplateView(services.View):
 
         @bp.route("/template/hotfolder-directories", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_JOBCONFIG
@@ -309,6 +338,22 @@ class TemplateView(services.View):
             )
         )
         def list_hotfolder_directories():
+            if "list_hotfolder_directories" in self.config.BACKEND_PASSTHROUGH:
+                response = call_backend_raw(
+                    endpoint=(
+                        self.backend_template_api.list_hotfolder_directories_without_preload_content
+                    ),
+                    kwargs=request.args,
+                    request_timeout=self.config.BACKEND_TIMEOUT,
+                )
+                if response.status_code == 200:
+                    return stream_raw_response(response.data)
+                return Response(
+                    response.fail_reason,
+                    mimetype="text/plain",
+                    status=response.status_code
+                )
+
             response = call_backend(
                 endpoint=(
                     self.backend_template_api.list_hotfolder_directories_with_http_info
@@ -358,6 +403,7 @@ class TemplateView(services.View):
 
         @bp.route("/template/archives", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(
             *(
                 self.config.ACL.CREATE_TEMPLATE
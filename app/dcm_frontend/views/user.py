@@ -2,12 +2,15 @@
 User View-class definition
 """
 
+from typing import Optional
+
 from flask import Blueprint, jsonify, Response, request
 from flask_login import login_required, current_user as current_session
 from dcm_common import services, util
 from dcm_backend_sdk import UserApi
 
 from dcm_frontend.config import AppConfig
+from dcm_frontend.decorators import conditional_response
 from dcm_frontend.util import call_backend, remove_from_json
 
 
@@ -22,28 +25,65 @@ class UserView(services.View):
         super().__init__(config)
         self.backend_user_api = backend_user_api
 
+    def get_user_config(
+        self, user_config_id: str, refresh: bool = False
+    ) -> tuple[Optional[dict], Optional[Response]]:
+        """
+        Returns a pair of the user-configuration (JSON) and an error-
+        response. The configuration is served from the cache if it is
+        not older than `USER_CACHE_MAX_AGE`; otherwise, it is fetched
+        from the backend and the cache is updated.
+
+        Keyword arguments:
+        user_config_id -- id of the user-configuration
+        refresh -- if `True`, always fetch from the backend
+                   (default False)
+        """
+        caching = not self.config.SESSION_DISABLE_USER_CACHING
+        if caching and not refresh:
+            user_config = self.config.user_configs.read_fresh(
+                user_config_id, self.config.USER_CACHE_MAX_AGE
+            )
+            if user_config is not None:
+                return user_config, None
+
+        response = call_backend(
+            endpoint=self.backend_user_api.get_user_config_with_http_info,
+            kwargs={"id": user_config_id},
+            request_timeout=self.config.BACKEND_TIMEOUT,
+        )
+        if response.status_code != 200:
+            return None, Response(
+                response.fail_reason,
+                mimetype="text/plain",
+                status=response.status_code
+            )
+
+        user_config = response.data.to_dict()
+        if caching:
+            # only replace if changed (keeps parsed User-object)
+            if self.config.user_configs.read(user_config_id) == user_config:
+                self.config.user_configs.touch(user_config_id)
+            else:
+                self.config.user_configs.write(user_config_id, user_config)
+        return user_config, None
+
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
         @bp.route("/config")
         @login_required
+        @conditional_response
         def get_config():
             """Returns current user's configuration."""
-            response = call_backend(
-                endpoint=(
-                    self.backend_user_api.get_user_config_with_http_info
-                ),
-                kwargs={"id": current_session.user_config_id},
-                request_timeout=self.config.BACKEND_TIMEOUT,
-            )
-            if response.status_code == 200:
-                return jsonify(response.data.to_dict()), 200
-            return Response(
-                response.fail_reason,
-                mimetype="text/plain",
-                status=response.status_code
+            user_config, error = self.get_user_config(
+                current_session.user_config_id
             )
+            if error is not None:
+                return error
+            return jsonify(user_config), 200
 
         @bp.route("/acl")
         @login_required
+        @conditional_response
         def get_permission_table():
             """Returns current user's permission-table."""
             return jsonify(self.config.ACL.reduce(current_session.user)), 200
@@ -52,38 +92,36 @@ class UserView(services.View):
         @login_required
         def put_widgets():
             """Update widget-configuration in user-configuration."""
-            # get current user-configuration
-            response = call_backend(
-                endpoint=(
-                    self.backend_user_api.get_user_config_with_http_info
-                ),
-                kwargs={"id": current_session.user_config_id},
-                request_timeout=self.config.BACKEND_TIMEOUT,
+            # get current user-configuration (not from cache, since the
+            # entire configuration is written back; a cached version
+            # may not contain changes made via another worker)
+            user_config, error = self.get_user_config(
+                current_session.user_config_id, refresh=True
             )
-            if response.status_code != 200:
-                return Response(
-                    response.fail_reason,
-                    mimetype="text/plain",
-                    status=response.status_code
-                )
+            if error is not None:
+                return error
 
             # update with new widget-configuration
+            user_config = user_config | {
+                "userModified": current_session.user_config_id,
+                "datetimeModified": util.now().isoformat(),
+                "widgetConfig": request.json,
+            }
             response = call_backend(
                 endpoint=(self.backend_user_api.update_user_with_http_info),
                 args=[
                     remove_from_json(
-                        response.data.to_dict(),
-                        ["userCreated", "datetimeCreated"],
+                        user_config, ["userCreated", "datetimeCreated"]
                     )
-                    | {
-                        "userModified": current_session.user_config_id,
-                        "datetimeModified": util.now().isoformat(),
-                    }
-                    | {"widgetConfig": request.json}
                 ],
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                # update cached user-configuration
+                if not self.config.SESSION_DISABLE_USER_CACHING:
+                    self.config.user_configs.write(
+                        current_session.user_config_id, user_config
+                    )
                 return Response(
                     "OK",
                     mimetype="text/plain",
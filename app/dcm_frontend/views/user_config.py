@@ -26,6 +26,18 @@ class UserConfigView(services.View):
         super().__init__(config)
         self.backend_config_api = backend_config_api
 
+    def invalidate_user_sessions(self, user_config_id: str) -> int:
+        """
+        Invalidates all sessions of the given user and returns the
+        number of deleted session-records.
+
+        Keyword arguments:
+        user_config_id -- id of the user-configuration
+        """
+        if self.config.SESSION_SIGNED:
+            self.config.session_signer.revoke_user(user_config_id)
+        return self.config.sessions.delete_user_sessions(user_config_id)
+
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
 
         @bp.route("/users", methods=["GET"])
@@ -310,13 +322,32 @@ class UserConfigView(services.View):
 
             # invalidate cached user-config and associated sessions
             if not self.config.SESSION_DISABLE_USER_CACHING:
-                # * user config
                 self.config.user_configs.delete(user["id"])
-                # * sessions
-                for session_id in self.config.sessions.keys():
-                    session = self.config.sessions.read(session_id)
-                    if session.get("userConfigId") == user["id"]:
-                        self.config.sessions.delete(session_id)
+            self.invalidate_user_sessions(user["id"])
+
+            return Response(
+                "OK",
+                mimetype="text/plain",
+                status=200,
+            )
+
+        @bp.route("/user/sessions", methods=["DELETE"])
+        @login_required
+        @requires_permission(*self.config.ACL.MODIFY_USERCONFIG)
+        def delete_user_sessions():
+            if "id" not in request.args:
+                return Response(
+                    "Missing id.",
+                    mimetype="text/plain",
+                    status=400,
+                )
+
+            deleted = self.invalidate_user_sessions(request.args["id"])
+            print(
+                f"Deleted {deleted} session(s) of user "
+                + f"'{request.args['id']}'.",
+                file=sys.stderr,
+            )
 
             return Response(
                 "OK",
@@ -396,6 +427,7 @@ class UserConfigView(services.View):
                     mimetype="text/plain",
                     status=response.status_code,
                 )
+            self.invalidate_user_sessions(request.args["id"])
             return jsonify(response.data.to_dict()), 200
 
         @bp.route("/user-info", methods=["GET"])
@@ -12,8 +12,18 @@ from dcm_common.util import now
 from dcm_backend_sdk import ConfigApi
 
 from dcm_frontend.config import AppConfig
-from dcm_frontend.decorators import requires_permission, generate_workspaces
-from dcm_frontend.util import call_backend, remove_from_json
+from dcm_frontend.decorators import (
+    requires_permission,
+    generate_workspaces,
+    conditional_response,
+)
+from dcm_frontend.util import (
+    call_backend,
+    remove_from_json,
+    model_etag,
+    not_modified,
+)
+from dcm_frontend.workspace_index import WorkspaceIndex
 
 
 class WorkspaceView(services.View):
@@ -22,15 +32,22 @@ class WorkspaceView(services.View):
     NAME = "workspace"
 
     def __init__(
-        self, config: AppConfig, backend_config_api: ConfigApi
+        self,
+        config: AppConfig,
+        backend_config_api: ConfigApi,
+        workspace_index: Optional[WorkspaceIndex] = None,
     ) -> None:
         super().__init__(config)
         self.backend_config_api = backend_config_api
+        self.workspace_index = workspace_index or WorkspaceIndex(
+            config, backend_config_api
+        )
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
 
         @bp.route("/workspaces", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_WORKSPACE)
         @generate_workspaces(*self.config.ACL.READ_WORKSPACE)
         def list_workspaces(workspaces: Optional[Iterable[str]]):
@@ -81,6 +98,7 @@ class WorkspaceView(services.View):
 
         @bp.route("/workspace", methods=["GET"])
         @login_required
+        @conditional_response
         @requires_permission(*self.config.ACL.READ_WORKSPACE)
         @generate_workspaces(*self.config.ACL.READ_WORKSPACE)
         def get_workspace(workspaces: Optional[Iterable[str]]):
@@ -101,7 +119,15 @@ class WorkspaceView(services.View):
             # enforce workspace-rules
             if workspaces is not None and response.data.id not in workspaces:
                 return Response("Forbidden", mimetype="text/plain", status=403)
-            return jsonify(response.data.to_dict()), 200
+
+            # validate cached copies without serialization
+            etag = model_etag(response.data, "templates", "users")
+            if (not_modified_response := not_modified(etag)) is not None:
+                return not_modified_response
+            json_response = jsonify(response.data.to_dict())
+            if etag is not None:
+                json_response.set_etag(etag)
+            return json_response, 200
 
         @bp.route("/workspace", methods=["PUT"])
         @login_required
@@ -172,6 +198,9 @@ class WorkspaceView(services.View):
                 request_timeout=self.config.BACKEND_TIMEOUT,
             )
             if response.status_code == 200:
+                # drop all records that may refer to deleted workspace
+                self.workspace_index.invalidate(WorkspaceIndex.TEMPLATE)
+                self.workspace_index.invalidate(WorkspaceIndex.JOB_CONFIG)
                 return Response(
                     "OK",
                     mimetype="text/plain",
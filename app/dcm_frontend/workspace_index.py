@@ -0,0 +1,214 @@
+"""
+In-process index that maps resources to their owning workspace. This
+allows to enforce workspace-rules without additional requests to the
+backend for every call.
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+
+from dcm_backend_sdk import ConfigApi, JobApi
+
+from dcm_frontend.config import AppConfig
+from dcm_frontend.util import (
+    BackendResponse,
+    LRUCache,
+    call_backend,
+    call_backend_many,
+)
+
+
+class WorkspaceIndex:
+    """
+    Time-limited index for the relations
+    * job-configuration-id -> workspace-id (`JOB_CONFIG`),
+    * template-id -> workspace-id (`TEMPLATE`),
+    * IE-id -> job-configuration-id (`IE`), and
+    * job-token -> job-configuration-id (`JOB`).
+
+    Missing entries (except for `JOB`) are fetched from the backend via
+    the `get_*`-methods. Those return `BackendResponse`s (with the
+    requested id as `data`) such that they can be used as drop-in
+    replacement for the corresponding `call_backend`-calls. `JOB`-
+    entries are set by the job-endpoints whenever a job's configuration
+    becomes known.
+
+    The index is kept up to date by the frontend's own create-, update-,
+    and delete-handlers. Changes made elsewhere become visible after at
+    most `WORKSPACE_INDEX_TTL` seconds.
+
+    Keyword arguments:
+    config -- app-configuration
+    backend_config_api -- backend-SDK config-API
+    backend_job_api -- backend-SDK job-API; required for resolving
+                       `IE`-relations
+                       (default None)
+    """
+
+    JOB_CONFIG = "job_config"
+    TEMPLATE = "template"
+    IE = "ie"
+    JOB = "job"
+
+    def __init__(
+        self,
+        config: AppConfig,
+        backend_config_api: ConfigApi,
+        backend_job_api: Optional[JobApi] = None,
+    ) -> None:
+        self.config = config
+        self.backend_config_api = backend_config_api
+        self.backend_job_api = backend_job_api
+        self.enabled = config.WORKSPACE_INDEX_TTL > 0
+        self._maps = {
+            kind: LRUCache(
+                config.WORKSPACE_INDEX_MAXSIZE, config.WORKSPACE_INDEX_TTL
+            )
+            for kind in (self.JOB_CONFIG, self.TEMPLATE, self.IE, self.JOB)
+        }
+
+    def get(self, kind: str, key: Optional[str]) -> Optional[str]:
+        """Returns indexed value (if available)."""
+        if not self.enabled or key is None:
+            return None
+        return self._maps[kind].get(key)
+
+    def set(
+        self, kind: str, key: Optional[str], value: Optional[str]
+    ) -> None:
+        """Sets or updates an index entry (ignores `None`-values)."""
+        if not self.enabled or key is None or value is None:
+            return
+        self._maps[kind].set(key, value)
+
+    def invalidate(self, kind: str, key: Optional[str] = None) -> None:
+        """
+        Removes the entry for `key` or all entries of `kind` if `key` is
+        `None`.
+        """
+        if key is None:
+            self._maps[kind].clear()
+        else:
+            self._maps[kind].pop(key)
+
+    def stats(self) -> dict:
+        """Returns index-statistics as JSON."""
+        return {kind: map_.stats() for kind, map_ in self._maps.items()}
+
+    def _resolve(
+        self, kind: str, key: str, call: dict, attribute: str
+    ) -> BackendResponse:
+        """
+        Returns cached value as `BackendResponse` or makes `call` to the
+        backend and indexes the result's `attribute`.
+        """
+        value = self.get(kind, key)
+        if value is not None:
+            return BackendResponse(
+                fail_reason="No error occurred.", status_code=200, data=value
+            )
+        response = call_backend(
+            **call, request_timeout=self.config.BACKEND_TIMEOUT
+        )
+        if response.status_code == 200:
+            response.data = getattr(response.data, attribute)
+            self.set(kind, key, response.data)
+        return response
+
+    def get_job_config_workspace(
+        self, job_config_id: Optional[str]
+    ) -> BackendResponse:
+        """Returns workspace-id of the given job-configuration."""
+        return self._resolve(
+            self.JOB_CONFIG,
+            job_config_id,
+            {
+                "endpoint": (
+                    self.backend_config_api.get_job_config_with_http_info
+                ),
+                "args": (job_config_id,),
+            },
+            "workspace_id",
+        )
+
+    def get_template_workspace(
+        self, template_id: Optional[str]
+    ) -> BackendResponse:
+        """Returns workspace-id of the given template."""
+        return self._resolve(
+            self.TEMPLATE,
+            template_id,
+            {
+                "endpoint": self.backend_config_api.get_template_with_http_info,
+                "args": (template_id,),
+            },
+            "workspace_id",
+        )
+
+    def get_ie_job_config(self, ie_id: Optional[str]) -> BackendResponse:
+        """Returns job-configuration-id of the given IE."""
+        return self._resolve(
+            self.IE,
+            ie_id,
+            {
+                "endpoint": self.backend_job_api.get_ie_with_http_info,
+                "kwargs": {"id": ie_id},
+            },
+            "job_config_id",
+        )
+
+    def get_ie_workspace(self, ie_id: Optional[str]) -> BackendResponse:
+        """Returns workspace-id of the given IE."""
+        response = self.get_ie_job_config(ie_id)
+        if response.status_code != 200:
+            return response
+        return self.get_job_config_workspace(response.data)
+
+    def _resolve_many(
+        self, kind: str, keys: Iterable[str], endpoint
+    ) -> dict[str, Optional[str]]:
+        """
+        Returns a mapping of `keys` to workspace-ids. Missing entries
+        are fetched concurrently, failed requests map to `None`.
+        """
+        result = {key: self.get(kind, key) for key in keys}
+        missing = [key for key, value in result.items() if value is None]
+        for key, response in zip(
+            missing,
+            call_backend_many(
+                [{"endpoint": endpoint, "args": (key,)} for key in missing],
+                request_timeout=self.config.BACKEND_TIMEOUT,
+                executor=self.config.backend_executor,
+                deadline=self.config.BACKEND_BATCH_DEADLINE,
+            ),
+        ):
+            if response.status_code == 200:
+                result[key] = response.data.workspace_id
+                self.set(kind, key, result[key])
+        return result
+
+    def get_job_config_workspaces(
+        self, job_config_ids: Iterable[str]
+    ) -> dict[str, Optional[str]]:
+        """
+        Returns mapping of job-configuration-ids to workspace-ids
+        (`None` if unavailable).
+        """
+        return self._resolve_many(
+            self.JOB_CONFIG,
+            job_config_ids,
+            self.backend_config_api.get_job_config_with_http_info,
+        )
+
+    def get_template_workspaces(
+        self, template_ids: Iterable[str]
+    ) -> dict[str, Optional[str]]:
+        """
+        Returns mapping of template-ids to workspace-ids (`None` if
+        unavailable).
+        """
+        return self._resolve_many(
+            self.TEMPLATE,
+            template_ids,
+            self.backend_config_api.get_template_with_http_info,
+        )
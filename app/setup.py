@@ -14,7 +14,10 @@ setup(
         "dcm-backend-sdk>=5.3.0,<6",
         "oai-pmh-extractor>=3.0.0,<4",
     ],
-    extras_require={},
+    extras_require={
+        "orjson": ["orjson>=3,<4"],
+        "brotli": ["brotli>=1,<2"],
+    },
     packages=[
         "dcm_frontend",
         "dcm_frontend.views",
@@ -0,0 +1,88 @@
+"""Test module for the recording of backend calls."""
+
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, jsonify
+
+from dcm_frontend.backend_calls import BackendCallRecorder
+from dcm_frontend.util import call_backend, call_backend_many
+
+
+def get_item_with_http_info(*args, **kwargs):
+    """Fake SDK-method."""
+    return SimpleNamespace(status_code=200, data=None)
+
+
+@pytest.fixture(name="recorder")
+def _recorder():
+    return BackendCallRecorder(expose_calls=True, log_threshold=3)
+
+
+@pytest.fixture(name="client")
+def _client(recorder):
+    app = Flask(__name__)
+    recorder.init_app(app)
+
+    @app.route("/single")
+    def single():
+        call_backend(get_item_with_http_info)
+        return jsonify({}), 200
+
+    @app.route("/many")
+    def many():
+        call_backend_many(
+            [{"endpoint": get_item_with_http_info}] * 3, max_workers=2
+        )
+        return jsonify({}), 200
+
+    @app.route("/none")
+    def none():
+        return jsonify({}), 200
+
+    return app.test_client()
+
+
+def test_backend_call_recorder_headers(client):
+    """Test headers added by `BackendCallRecorder`."""
+
+    response = client.get("/single")
+    assert response.headers["Server-Timing"].startswith("backend;dur=")
+    assert 'desc="1 calls"' in response.headers["Server-Timing"]
+    assert response.headers["X-Backend-Calls"].startswith(
+        "get_item;count=1;dur="
+    )
+
+    response = client.get("/many")
+    assert 'desc="3 calls"' in response.headers["Server-Timing"]
+    assert response.headers["X-Backend-Calls"].startswith(
+        "get_item;count=3;dur="
+    )
+
+    response = client.get("/none")
+    assert 'desc="0 calls"' in response.headers["Server-Timing"]
+    assert "X-Backend-Calls" not in response.headers
+
+
+def test_backend_call_recorder_stats(client, recorder, capsys):
+    """Test aggregation and logging of `BackendCallRecorder`."""
+
+    client.get("/single")
+    client.get("/many")
+    client.get("/many")
+
+    stats = recorder.stats()
+    assert stats["single"]["requests"] == 1
+    assert stats["single"]["calls"] == 1
+    assert stats["many"]["requests"] == 2
+    assert stats["many"]["calls"] == 6
+    assert stats["many"]["maxCalls"] == 3
+    assert stats["many"]["methods"] == {"get_item": 6}
+
+    assert "'GET /many' made 3 backend calls" in capsys.readouterr().err
+
+
+def test_backend_calls_outside_of_request():
+    """Test that calls outside of requests are not recorded."""
+
+    assert call_backend(get_item_with_http_info).status_code == 200
@@ -0,0 +1,104 @@
+"""Test module for the response-compression."""
+
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify, stream_with_context
+
+from dcm_frontend.compression import ResponseCompression
+
+
+@pytest.fixture(name="client")
+def _client():
+    app = Flask(__name__)
+
+    @app.route("/api/json")
+    def json():
+        response = jsonify({"data": "a" * 2048})
+        response.set_etag("etag")
+        return response
+
+    @app.route("/api/small")
+    def small():
+        return jsonify({"data": "a"})
+
+    @app.route("/api/stream")
+    def stream():
+        def generate():
+            for _ in range(10):
+                yield "a" * 1024
+
+        return Response(
+            stream_with_context(generate()), mimetype="application/json"
+        )
+
+    @app.route("/api/passthrough")
+    def passthrough():
+        return Response(
+            iter([b"a" * 2048]),
+            mimetype="application/json",
+            direct_passthrough=True,
+        )
+
+    @app.route("/other")
+    def other():
+        return jsonify({"data": "a" * 2048})
+
+    app.after_request(ResponseCompression(min_size=1024))
+    return app.test_client()
+
+
+def test_compression_gzip(client):
+    """Test gzip-compression of responses."""
+
+    response = client.get("/api/json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) < 2048
+    assert response.headers["ETag"] == 'W/"etag"'
+    assert b"a" * 2048 in gzip.decompress(response.data)
+
+
+def test_compression_brotli(client):
+    """Test brotli-compression of responses."""
+
+    brotli = pytest.importorskip("brotli")
+
+    response = client.get(
+        "/api/json", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert response.headers["Content-Encoding"] == "br"
+    assert b"a" * 2048 in brotli.decompress(response.data)
+
+
+def test_compression_stream(client):
+    """Test incremental compression of streamed responses."""
+
+    response = client.get("/api/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(response.data) == b"a" * 10240
+
+
+@pytest.mark.parametrize(
+    ("path", "accept_encoding"),
+    [
+        ("/api/json", None),
+        ("/api/json", "identity"),
+        ("/api/small", "gzip"),
+        ("/api/passthrough", "gzip"),
+        ("/other", "gzip"),
+    ],
+    ids=["no-header", "identity", "small", "passthrough", "other-path"],
+)
+def test_compression_skipped(client, path, accept_encoding):
+    """Test conditions for which responses are not compressed."""
+
+    response = client.get(
+        path,
+        headers=(
+            {} if accept_encoding is None
+            else {"Accept-Encoding": accept_encoding}
+        ),
+    )
+    assert "Content-Encoding" not in response.headers
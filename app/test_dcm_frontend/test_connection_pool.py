@@ -0,0 +1,76 @@
+"""Test module for the backend connection pool."""
+
+from time import sleep
+
+from dcm_backend.util import DemoData
+import dcm_backend_sdk
+
+from dcm_frontend.connection_pool import ConnectionPool
+from dcm_frontend.util import call_backend
+
+
+def test_connection_pool_shared(backend, backend_port):
+    """Test sharing of connections across different APIs."""
+
+    pool = ConnectionPool(f"http://localhost:{backend_port}")
+    config_api = dcm_backend_sdk.ConfigApi(pool.api_client)
+    user_api = dcm_backend_sdk.UserApi(pool.api_client)
+
+    for _ in range(3):
+        assert (
+            call_backend(config_api.list_users_with_http_info).status_code
+            == 200
+        )
+    assert (
+        call_backend(
+            user_api.get_user_config_with_http_info,
+            kwargs={"id": DemoData.user0},
+        ).status_code
+        == 200
+    )
+
+    stats = pool.stats()
+    assert len(stats["pools"]) == 1
+    assert stats["pools"][0]["connectionsCreated"] == 1
+    assert stats["pools"][0]["requests"] == 4
+    assert stats["pools"][0]["idle"] == 1
+
+
+def test_connection_pool_raw_requests(backend, backend_port):
+    """
+    Test raw requests via `ConnectionPool.session` sharing the pool of
+    the SDK-client.
+    """
+
+    pool = ConnectionPool(f"http://localhost:{backend_port}")
+    config_api = dcm_backend_sdk.ConfigApi(pool.api_client)
+
+    for _ in range(2):
+        assert (
+            pool.session.get(
+                f"http://localhost:{backend_port}/ready", timeout=1
+            ).status_code
+            == 200
+        )
+
+    assert call_backend(config_api.list_users_with_http_info).status_code == 200
+
+    stats = pool.stats()
+    assert len(stats["pools"]) == 1
+    assert stats["pools"][0]["connectionsCreated"] == 1
+    assert stats["pools"][0]["requests"] == 3
+
+
+def test_connection_pool_idle_eviction(backend, backend_port):
+    """Test eviction of idle connections."""
+
+    pool = ConnectionPool(
+        f"http://localhost:{backend_port}", idle_timeout=0.1
+    )
+    config_api = dcm_backend_sdk.ConfigApi(pool.api_client)
+
+    assert call_backend(config_api.list_users_with_http_info).status_code == 200
+    assert pool.stats()["evictions"] == 0
+    sleep(0.2)
+    assert call_backend(config_api.list_users_with_http_info).status_code == 200
+    assert pool.stats()["evictions"] == 1
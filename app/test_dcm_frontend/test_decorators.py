@@ -3,7 +3,7 @@
 from unittest.mock import patch
 
 import pytest
-from flask import Response
+from flask import Flask, Response, jsonify
 
 from dcm_frontend import decorators
 from dcm_frontend.models import Session, User, SimpleRule, WorkspaceRule
@@ -88,3 +88,35 @@ def test_generate_workspaces(config, workspaces_):
 
         # pylint: disable=no-value-for-parameter
         decorated_function()
+
+
+def test_conditional_response():
+    """Test decorator `conditional_response`."""
+
+    app = Flask(__name__)
+
+    @app.route("/")
+    @decorators.conditional_response
+    def decorated_function():
+        return jsonify({"some": "data"}), 200
+
+    @app.route("/error")
+    @decorators.conditional_response
+    def decorated_function_error():
+        return Response("error", status=400)
+
+    client = app.test_client()
+    response = client.get("/")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    assert (
+        client.get("/", headers={"If-None-Match": '"other"'}).status_code
+        == 200
+    )
+    assert "ETag" not in client.get("/error").headers
@@ -0,0 +1,35 @@
+"""Test module for the `JobStatusBroker`."""
+
+from time import sleep
+
+from dcm_frontend.job_status import JobStatusBroker
+
+
+def test_job_status_broker_failed_poll(testing_config):
+    """
+    Test that the polling of `JobStatusBroker` continues after a failed
+    poll.
+    """
+
+    class ThisTestingConfig(testing_config):
+        JOB_STATUS_POLL_INTERVAL = 0.05
+
+    broker = JobStatusBroker(ThisTestingConfig(), None, None)
+    calls = []
+
+    def fetch(job_config_ids=(), tokens=()):
+        calls.append(tokens)
+        if len(calls) == 1:
+            raise ValueError("bad response")
+        return {}, {token: {"status": "running"} for token in tokens}
+
+    broker.fetch = fetch
+    subscription = broker.subscribe(tokens=["token-0"])
+
+    event = subscription.queue.get(timeout=1)
+    assert event == {"token": "token-0", "info": {"status": "running"}}
+    assert broker.failed_polls == 1
+
+    broker.unsubscribe(subscription)
+    sleep(0.2)
+    assert broker.subscriptions == 0
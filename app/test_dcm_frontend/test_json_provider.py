@@ -0,0 +1,60 @@
+"""Test module for the JSON-providers."""
+
+from datetime import datetime
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel, Field
+
+from dcm_frontend.json_provider import JSONProvider, FastJSONProvider
+
+
+class _Model(BaseModel):
+    some_field: str = Field(alias="someField")
+    other_field: int | None = Field(default=None, alias="otherField")
+
+
+@pytest.fixture(name="app")
+def _app(request):
+    app = Flask(__name__)
+    app.json = request.param(app)
+    return app
+
+
+@pytest.mark.parametrize(
+    "app", [JSONProvider, FastJSONProvider], indirect=True
+)
+def test_json_provider_pydantic(app: Flask):
+    """Test serialization of pydantic-models."""
+
+    model = _Model(someField="value")
+    with app.app_context():
+        assert jsonify(model).json == {"someField": "value"}
+        assert jsonify([model]).json == [{"someField": "value"}]
+        assert jsonify({"model": model}).json == {
+            "model": {"someField": "value"}
+        }
+
+
+@pytest.mark.parametrize(
+    "app", [JSONProvider, FastJSONProvider], indirect=True
+)
+def test_json_provider_roundtrip(app: Flask):
+    """Test `dumps` and `loads` of JSON-providers."""
+
+    json = {"a": [1, 2.5, None, True], "b": {"c": "ä"}}
+    assert app.json.loads(app.json.dumps(json)) == json
+    assert app.json.loads(app.json.dumps(json, indent=2)) == json
+
+
+def test_fast_json_provider_datetime():
+    """Test serialization of datetime-objects by `FastJSONProvider`."""
+
+    pytest.importorskip("orjson")
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        assert jsonify({"datetime": datetime(2025, 1, 1, 12)}).json == {
+            "datetime": "2025-01-01T12:00:00"
+        }
@@ -0,0 +1,115 @@
+"""Test module for the metrics-collection."""
+
+from types import SimpleNamespace
+
+from flask import Flask, Response, jsonify, stream_with_context
+
+from dcm_frontend.metrics import Histogram, Metrics, render
+from dcm_frontend.util import call_backend, proxied_streams
+
+
+def get_item_with_http_info(*args, **kwargs):
+    """Fake SDK-method."""
+    return SimpleNamespace(status_code=200, data=None)
+
+
+def test_histogram():
+    """Test class `Histogram`."""
+
+    histogram = Histogram("test", "Test histogram.", ("label",), (1, 2))
+    histogram.observe(0.5, "a")
+    histogram.observe(1, "a")
+    histogram.observe(3, "a")
+
+    assert render([histogram.collect()]) == (
+        "# HELP test Test histogram.\n"
+        + "# TYPE test histogram\n"
+        + 'test_bucket{label="a",le="1"} 2\n'
+        + 'test_bucket{label="a",le="2"} 2\n'
+        + 'test_bucket{label="a",le="+Inf"} 3\n'
+        + 'test_sum{label="a"} 4.5\n'
+        + 'test_count{label="a"} 3\n'
+    )
+
+
+def test_render_escapes_labels():
+    """Test escaping of label values in `render`."""
+
+    assert (
+        render([("test", "gauge", "Test.", [("test", {"a": 'x"\\'}, 1)])])
+        .splitlines()[-1]
+        == 'test{a="x\\"\\\\"} 1'
+    )
+
+
+def test_metrics():
+    """Test class `Metrics`."""
+
+    metrics = Metrics()
+    metrics.add_collector(
+        lambda: [("test_custom", "gauge", "Custom.", [("test_custom", {}, 1)])]
+    )
+    app = Flask(__name__)
+    metrics.init_app(app)
+
+    @app.route("/call")
+    def call():
+        call_backend(get_item_with_http_info)
+        return jsonify({}), 200
+
+    @app.route("/stream")
+    def stream():
+        return Response(
+            stream_with_context(proxied_streams.track([b"a" * 10] * 3))
+        )
+
+    client = app.test_client()
+    client.get("/call")
+    streamed_bytes = proxied_streams.bytes
+    assert client.get("/stream").data == b"a" * 30
+    assert proxied_streams.bytes == streamed_bytes + 30
+    assert proxied_streams.active == 0
+
+    text = metrics.render()
+    assert (
+        'dcm_frontend_request_duration_seconds_count{blueprint="",'
+        + 'endpoint="call"} 1'
+    ) in text
+    assert (
+        'dcm_frontend_backend_call_duration_seconds_count{method="get_item"} 1'
+    ) in text
+    assert "dcm_frontend_proxied_streams_active 0" in text
+    assert "test_custom 1" in text
+
+
+def test_metrics_multiple_apps():
+    """
+    Test that calls to the backend are only recorded by the `Metrics`
+    of the app that handles the request.
+    """
+
+    metrics0, metrics1 = Metrics(), Metrics()
+    clients = []
+    for metrics in (metrics0, metrics1):
+        app = Flask(__name__)
+        metrics.init_app(app)
+
+        @app.route("/call")
+        def call():
+            call_backend(get_item_with_http_info)
+            return jsonify({}), 200
+
+        clients.append(app.test_client())
+
+    clients[0].get("/call")
+    clients[0].get("/call")
+    clients[1].get("/call")
+    # outside of requests
+    call_backend(get_item_with_http_info)
+
+    assert (
+        'dcm_frontend_backend_call_duration_seconds_count{method="get_item"} 2'
+    ) in metrics0.render()
+    assert (
+        'dcm_frontend_backend_call_duration_seconds_count{method="get_item"} 1'
+    ) in metrics1.render()
@@ -4,8 +4,10 @@ import pytest
 from dcm_common.models.data_model import get_model_serialization_test
 
 from dcm_frontend.models import (
+    Rule,
     SimpleRule,
     WorkspaceRule,
+    CompiledRules,
     User,
     GroupInfo,
     ACL,
@@ -133,3 +135,77 @@ def test_acl_reduce(user, expected):
     assert all(
         not record for k, record in table.items() if k != "CREATE_USERCONFIG"
     )
+
+
+class _StaticRule(Rule):
+    """Custom rule-type for testing."""
+
+    TYPE = "static"
+
+    def _has_permission(self, user):
+        return self.group_id == "allow"
+
+
+class _CustomWorkspaceRule(WorkspaceRule):
+    """Custom workspace-rule for testing."""
+
+
+@pytest.mark.parametrize(
+    ("rules", "user", "has_permission", "workspaces"),
+    (
+        ((), User({"groups": [{"id": "group-1"}]}), False, frozenset()),
+        (
+            (SimpleRule("group-1"), WorkspaceRule("group-2")),
+            User({"groups": [{"id": "group-1"}]}),
+            True,
+            None,
+        ),
+        (
+            (SimpleRule("group-1"), WorkspaceRule("group-2")),
+            User(
+                {
+                    "groups": [
+                        {"id": "group-2", "workspace": "0"},
+                        {"id": "group-2", "workspace": "1"},
+                        {"id": "group-3", "workspace": "2"},
+                    ]
+                }
+            ),
+            True,
+            frozenset(["0", "1"]),
+        ),
+        (
+            (WorkspaceRule("group-2"),),
+            User({"groups": [{"id": "group-2"}]}),
+            False,
+            frozenset(),
+        ),
+        (
+            (_StaticRule("allow"),),
+            User({}),
+            True,
+            frozenset(),
+        ),
+        (
+            (_StaticRule("deny"),),
+            User({}),
+            False,
+            frozenset(),
+        ),
+        (
+            (_CustomWorkspaceRule("group-2"),),
+            User({"groups": [{"id": "group-2", "workspace": "0"}]}),
+            True,
+            frozenset(["0"]),
+        ),
+    ),
+)
+def test_compiled_rules(rules, user, has_permission, workspaces):
+    """Test class `CompiledRules`."""
+    compiled_rules = CompiledRules(rules)
+
+    assert compiled_rules.has_permission(user) is has_permission
+    assert has_permission is ACL.has_permission(rules, user)
+    assert compiled_rules.workspaces(user) == workspaces
+    # cached
+    assert compiled_rules.workspaces(user) == workspaces
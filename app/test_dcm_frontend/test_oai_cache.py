@@ -0,0 +1,186 @@
+"""Test module for the oai-cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from dcm_frontend.oai_cache import OAICache
+
+
+class Fetcher:
+    """Fake request to an oai-repository."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("unavailable")
+        return self.calls
+
+
+def wait_for_refresh(cache: OAICache):
+    """Waits until no background refresh is running."""
+    for _ in range(100):
+        if not cache._refreshing:
+            return
+        sleep(0.01)
+
+
+def test_oai_cache_fresh():
+    """Test serving fresh entries from `OAICache`."""
+
+    cache = OAICache()
+    fetch = Fetcher()
+    assert cache.get("a", fetch) == 1
+    assert cache.get("a", fetch) == 1
+    assert cache.get("a", fetch, force=True) == 2
+    assert cache.get("b", fetch) == 3
+    assert fetch.calls == 3
+
+
+def test_oai_cache_stale_while_revalidate():
+    """Test serving stale entries from `OAICache`."""
+
+    cache = OAICache(ttl=0.05)
+    fetch = Fetcher()
+    assert cache.get("a", fetch) == 1
+    sleep(0.1)
+
+    # stale entry is served and refreshed in background
+    assert cache.get("a", fetch) == 1
+    wait_for_refresh(cache)
+    assert cache.get("a", fetch) == 2
+    assert cache.stats()["refreshes"] == 1
+
+    # failed refresh keeps stale entry
+    sleep(0.1)
+    fetch.fail = True
+    assert cache.get("a", fetch) == 2
+    wait_for_refresh(cache)
+    assert cache.get("a", fetch) == 2
+    assert cache.stats()["failedRefreshes"] >= 1
+
+
+def test_oai_cache_max_stale():
+    """Test expiration of entries in `OAICache`."""
+
+    cache = OAICache(ttl=0.05, max_stale=0)
+    fetch = Fetcher()
+    assert cache.get("a", fetch) == 1
+    sleep(0.1)
+    assert cache.get("a", fetch) == 2
+    assert cache._refreshing == set()
+
+    # errors are passed on when not served from cache
+    sleep(0.1)
+    fetch.fail = True
+    with pytest.raises(ConnectionError):
+        cache.get("a", fetch)
+
+
+def test_oai_cache_invalidate():
+    """Test invalidation and size-bound of `OAICache`."""
+
+    cache = OAICache(maxsize=2)
+    fetch = Fetcher()
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    cache.get("c", fetch)
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+    cache.invalidate("b")
+    assert len(cache) == 1
+    assert cache.get("c", fetch) == 3
+    assert cache.age() is not None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.age() is None
+
+
+@pytest.mark.parametrize("fail", (False, True), ids=["ok", "error"])
+def test_oai_cache_single_flight(fail):
+    """Test de-duplication of concurrent fetches in `OAICache`."""
+
+    cache = OAICache()
+    release = Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        if fail:
+            raise ConnectionError("unavailable")
+        return "result"
+
+    results = []
+
+    def get():
+        try:
+            results.append(cache.get("a", fetch))
+        except ConnectionError as exc_info:
+            results.append(exc_info)
+
+    threads = [Thread(target=get) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for _ in range(100):
+        if cache.stats()["deduplicated"] == 4:
+            break
+        sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    if fail:
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert len(cache) == 0
+    else:
+        assert results == ["result"] * 5
+        assert len(cache) == 1
+    assert cache._inflight == {}
+
+
+def test_oai_cache_refresh_executor():
+    """
+    Test that background refreshes of `OAICache` are bounded by the
+    executor and run at most once per key.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    cache = OAICache(ttl=0.05, executor=executor)
+    release = Event()
+    running = []
+
+    def fetch():
+        running.append(1)
+        release.wait(1)
+        return len(running)
+
+    release.set()
+    for key in ("a", "b"):
+        assert cache.get(key, fetch) in (1, 2)
+    release.clear()
+    sleep(0.1)
+
+    # stale entries are served; refreshes are queued (single worker)
+    for _ in range(3):
+        cache.get("a", fetch)
+        cache.get("b", fetch)
+    sleep(0.05)
+    assert len(running) == 3
+    assert cache._refreshing == {"a", "b"}
+
+    release.set()
+    wait_for_refresh(cache)
+    assert len(running) == 4
+    assert cache.stats()["refreshes"] == 2
+    executor.shutdown()
@@ -0,0 +1,51 @@
+"""Test module for asynchronous oai-requests."""
+
+from threading import Event
+from time import sleep
+
+from dcm_frontend.oai_probes import OAIProbes
+
+
+def test_oai_probes():
+    """Test submitting and polling probes with `OAIProbes`."""
+
+    probes = OAIProbes(max_workers=1, max_pending=2)
+    release = Event()
+
+    def fn():
+        release.wait(5)
+        return "result"
+
+    token0 = probes.submit(fn, "url0", owner="user0")
+    token1 = probes.submit(fn, "url1", owner="user0")
+    assert token0 is not None and token1 is not None
+    assert probes.submit(fn, "url2", owner="user0") is None
+    assert probes.stats()["rejected"] == 1
+
+    probe = probes.get(token0, owner="user0")
+    assert probe.url == "url0"
+    assert not probe.future.done()
+    assert probes.get(token0, owner="user1") is None
+    assert probes.get("unknown", owner="user0") is None
+
+    release.set()
+    assert probe.future.result(timeout=5) == "result"
+    assert probes.get(token1, owner="user0").future.result(5) == "result"
+    for _ in range(100):
+        if probes.pending == 0:
+            break
+        sleep(0.01)
+    assert probes.pending == 0
+    assert probes.submit(fn, "url2", owner="user0") is not None
+
+
+def test_oai_probes_error():
+    """Test probes that raise an exception in `OAIProbes`."""
+
+    probes = OAIProbes()
+
+    def fn():
+        raise ConnectionError("unavailable")
+
+    probe = probes.get(probes.submit(fn, "url"))
+    assert isinstance(probe.future.exception(timeout=5), ConnectionError)
@@ -0,0 +1,120 @@
+"""Test module for the `SessionStore`."""
+
+from time import sleep
+
+import pytest
+from dcm_common.db.key_value_store import util
+
+from dcm_frontend.session_store import SessionStore
+
+
+@pytest.fixture(name="store")
+def _store():
+    return SessionStore(
+        util.load_adapter("sessions", "native", {"backend": "memory"}),
+        flush_interval=0.05,
+    )
+
+
+def test_session_store_write_deferred(store: SessionStore):
+    """Test method `write_deferred` of `SessionStore`."""
+
+    store.write("a", {"expiresAt": "0"})
+    store.write_deferred("a", {"expiresAt": "1"})
+    store.write_deferred("a", {"expiresAt": "2"})
+
+    # pending write is visible but not yet persisted
+    assert store.read("a") == {"expiresAt": "2"}
+    assert store.adapter.read("a") == {"expiresAt": "0"}
+    assert store.stats()["coalescedWrites"] == 1
+
+    sleep(0.2)
+    assert store.pending == 0
+    assert store.adapter.read("a") == {"expiresAt": "2"}
+    assert store.stats()["writes"] == 2
+
+
+def test_session_store_delete_pending(store: SessionStore):
+    """Test that deletion discards pending writes in `SessionStore`."""
+
+    store.write("a", {"expiresAt": "0"})
+    store.write_deferred("a", {"expiresAt": "1"})
+    store.delete("a")
+    assert store.read("a") is None
+
+    assert store.flush() == 0
+    assert store.adapter.read("a") is None
+
+
+def test_session_store_flush_deleted(store: SessionStore):
+    """
+    Test that flushing does not resurrect sessions that have been
+    deleted directly in the underlying store (e.g., by another worker).
+    """
+
+    store.write("a", {"expiresAt": "0"})
+    store.write("b", {"expiresAt": "0"})
+    store.write_deferred("a", {"expiresAt": "1"})
+    store.write_deferred("b", {"expiresAt": "1"})
+    store.adapter.delete("a")
+
+    assert store.flush() == 1
+    assert store.adapter.read("a") is None
+    assert store.adapter.read("b") == {"expiresAt": "1"}
+
+
+def test_session_store_user_index(store: SessionStore):
+    """Test secondary index of sessions by user in `SessionStore`."""
+
+    store.write("a", {"userConfigId": "user-0"})
+    store.write("b", {"userConfigId": "user-0"})
+    store.write("c", {"userConfigId": "user-1"})
+    store.write_deferred("c", {"userConfigId": "user-1"})
+
+    # index records are kept in the store but are not listed as keys
+    assert store.adapter.read("user:user-0") == ["a", "b"]
+    assert sorted(store.keys()) == ["a", "b", "c"]
+
+    assert store.get_user_sessions("user-0") == {"a", "b"}
+    assert store.get_user_sessions("user-1") == {"c"}
+
+    store.delete("a")
+    assert store.get_user_sessions("user-0") == {"b"}
+
+    assert store.delete_user_sessions("user-0") == 1
+    assert store.get_user_sessions("user-0") == set()
+    assert store.adapter.read("user:user-0") is None
+    assert store.read("b") is None
+    assert store.read("c") is not None
+
+
+def test_session_store_user_index_shared(store: SessionStore):
+    """
+    Test that the index of `SessionStore` is shared between instances
+    using the same store (e.g., different workers).
+    """
+
+    other = SessionStore(store.adapter)
+    store.write("a", {"userConfigId": "user-0"})
+    other.write("b", {"userConfigId": "user-0"})
+
+    assert store.get_user_sessions("user-0") == {"a", "b"}
+    assert other.delete_user_sessions("user-0") == 2
+    assert store.read("a") is None
+    assert store.read("b") is None
+
+
+def test_session_store_repair_index(store: SessionStore):
+    """Test method `repair_index` of `SessionStore`."""
+
+    # sessions without index entry (e.g., lost update or legacy)
+    store.adapter.write("a", {"userConfigId": "user-0"})
+    store.write("b", {"userConfigId": "user-0"})
+    # outdated index entries
+    store.adapter.write("user:user-1", ["c"])
+    store.adapter.write("user:user-0", ["b", "d"])
+
+    assert store.repair_index() == 2
+    assert store.get_user_sessions("user-0") == {"a", "b"}
+    assert store.get_user_sessions("user-1") == set()
+    assert store.repair_index() == 0
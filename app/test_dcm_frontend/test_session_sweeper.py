@@ -0,0 +1,59 @@
+"""Test module for the `SessionSweeper`."""
+
+from time import sleep
+
+import pytest
+from dcm_common.db.key_value_store import util
+
+from dcm_frontend.session_store import SessionStore
+from dcm_frontend.session_sweeper import SessionSweeper
+
+
+@pytest.fixture(name="sessions")
+def _sessions():
+    sessions = SessionStore(
+        util.load_adapter("sessions", "native", {"backend": "memory"})
+    )
+    for i in range(5):
+        sessions.write(f"valid-{i}", {"valid": True})
+        sessions.write(f"expired-{i}", {"valid": False})
+    return sessions
+
+
+def test_session_sweeper_sweep(sessions):
+    """Test method `sweep` of `SessionSweeper`."""
+
+    sweeper = SessionSweeper(
+        sessions, lambda s: s["valid"], batch_size=3, batch_delay=0
+    )
+    assert sweeper.sweep() == 5
+    assert sorted(sessions.keys()) == [f"valid-{i}" for i in range(5)]
+    assert sweeper.stats()["deleted"] == 5
+
+
+def test_session_sweeper_lock(sessions, tmp_path):
+    """Test lock-file based exclusivity of `SessionSweeper`."""
+
+    lock_file = tmp_path / "session-sweeper.lock"
+    sweeper0 = SessionSweeper(
+        sessions, lambda s: s["valid"], interval=0.01, lock_file=lock_file
+    )
+    sweeper1 = SessionSweeper(
+        sessions, lambda s: s["valid"], interval=0.01, lock_file=lock_file
+    )
+
+    sweeper0.start()
+    sleep(0.1)
+    sweeper1.start()
+    sleep(0.1)
+    assert sweeper0.stats()["active"]
+    assert sweeper0.stats()["sweeps"] > 0
+    assert not sweeper1.stats()["active"]
+    assert sweeper1.stats()["sweeps"] == 0
+    assert len(list(sessions.keys())) == 5
+
+    # lock is released on stop
+    sweeper0.stop()
+    sleep(0.1)
+    assert sweeper1.stats()["active"]
+    sweeper1.stop()
@@ -0,0 +1,103 @@
+"""Test module for the `SessionSigner`."""
+
+from time import sleep
+
+from dcm_frontend.signed_session import SessionSigner
+from dcm_frontend.user_cache import InvalidationChannel
+
+
+def test_session_signer_verify():
+    """Test methods `issue` and `verify` of `SessionSigner`."""
+
+    signer = SessionSigner("secret", max_age=0.2)
+    token = signer.issue("sid", "user-0")
+
+    claim = signer.verify(token)
+    assert claim.sid == "sid"
+    assert claim.user_config_id == "user-0"
+
+    # tampered or foreign tokens are rejected
+    assert signer.verify(token[:-1]) is None
+    assert signer.verify("sid") is None
+    assert SessionSigner("other-secret").verify(token) is None
+
+    # expiration
+    sleep(0.3)
+    assert signer.verify(token) is None
+
+
+def test_session_signer_revocation():
+    """Test revocation of sessions via `SessionSigner`."""
+
+    signer = SessionSigner("secret")
+    token0 = signer.issue("sid-0", "user-0")
+    token1 = signer.issue("sid-1", "user-0")
+    token2 = signer.issue("sid-2", "user-1")
+
+    signer.revoke_session(signer.verify(token0).key)
+    assert signer.verify(token0) is None
+    assert signer.verify(token1) is not None
+
+    signer.revoke_user("user-0")
+    assert signer.verify(token1) is None
+    assert signer.verify(token2) is not None
+    # new sessions are not affected
+    assert signer.verify(signer.issue("sid-3", "user-0")) is not None
+
+
+def test_session_signer_revalidation():
+    """Test re-validation-logic of `SessionSigner`."""
+
+    signer = SessionSigner("secret", revalidate_after=0.2)
+    claim = signer.verify(signer.issue("sid", "user-0"))
+    assert signer.requires_revalidation(claim)
+    signer.validated(claim)
+    assert not signer.requires_revalidation(claim)
+    sleep(0.3)
+    assert signer.requires_revalidation(claim)
+
+    assert not SessionSigner(
+        "secret", revalidate_after=0
+    ).requires_revalidation(claim)
+
+
+
+def test_session_signer_revocation_bounded():
+    """
+    Test that `SessionSigner` keeps revocations of single sessions only
+    until re-validation and at most `maxsize` of them.
+    """
+
+    signer = SessionSigner("secret", revalidate_after=0.2)
+    claim = signer.verify(signer.issue("sid", "user-0"))
+    signer.validated(claim)
+    signer.revoke_session(claim.key)
+    assert signer.verify(signer.issue("sid", "user-0")) is None
+    sleep(0.3)
+    # session is now rejected by the re-validation instead
+    assert signer.verify(signer.issue("sid", "user-0")) is not None
+    assert signer.requires_revalidation(claim)
+
+    signer = SessionSigner("secret", revalidate_after=0, maxsize=2)
+    for i in range(5):
+        signer.revoke_session(f"key-{i}")
+    assert signer.stats()["revokedSessions"] == 2
+
+def test_session_signer_channel(tmp_path):
+    """Test sharing revocations between `SessionSigner`s."""
+
+    signer0 = SessionSigner(
+        "secret", channel=InvalidationChannel(tmp_path / "revocations")
+    )
+    signer1 = SessionSigner(
+        "secret", channel=InvalidationChannel(tmp_path / "revocations")
+    )
+    token0 = signer0.issue("sid-0", "user-0")
+    token1 = signer0.issue("sid-1", "user-1")
+
+    signer0.revoke_session(signer0.verify(token0).key)
+    signer0.revoke_user("user-1")
+    assert signer1.verify(token0) is None
+    assert signer1.verify(token1) is None
+    assert signer1.stats()["revokedSessions"] == 1
+    assert signer1.stats()["revokedUsers"] == 1
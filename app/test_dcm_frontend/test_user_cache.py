@@ -0,0 +1,106 @@
+"""Test module for the `UserCache`."""
+
+import pytest
+from dcm_common.db.key_value_store import util
+
+from dcm_frontend.user_cache import UserCache, InvalidationChannel
+
+
+@pytest.fixture(name="cache")
+def _cache():
+    return UserCache(
+        util.load_adapter("user_configs", "native", {"backend": "memory"}),
+        maxsize=2,
+    )
+
+
+def test_user_cache_get_user(cache: UserCache):
+    """Test method `get_user` of `UserCache`."""
+
+    assert cache.get_user("a") is None
+
+    cache.write("a", {"id": "a", "groups": [{"id": "admin"}]})
+    user = cache.get_user("a")
+    assert user.config["id"] == "a"
+    assert cache.get_user("a") is user
+    assert cache.stats()["hits"] == 1
+
+    # invalidation via write
+    cache.write("a", {"id": "a", "groups": []})
+    assert cache.get_user("a") is not user
+    assert not cache.get_user("a").config["groups"]
+
+    # invalidation via delete
+    cache.delete("a")
+    assert cache.get_user("a") is None
+    assert cache.read("a") is None
+
+
+def test_user_cache_read_fresh(cache: UserCache):
+    """Test method `read_fresh` of `UserCache`."""
+
+    cache.adapter.write("a", {"id": "a"})
+    assert cache.read_fresh("a", 60) is None
+
+    cache.touch("a")
+    assert cache.read_fresh("a", 60) == {"id": "a"}
+    assert cache.read_fresh("a", 0) is None
+
+    cache.delete("a")
+    assert cache.age("a") is None
+
+
+def test_user_cache_bounded(cache: UserCache):
+    """Test size-limit of `UserCache`."""
+
+    for user_config_id in ("a", "b", "c"):
+        cache.write(user_config_id, {"id": user_config_id})
+        cache.get_user(user_config_id)
+
+    assert cache.stats()["size"] == 2
+    # store itself is not bounded
+    assert sorted(cache.keys()) == ["a", "b", "c"]
+    assert cache.get_user("a").config["id"] == "a"
+
+
+def test_invalidation_channel(tmp_path):
+    """Test `InvalidationChannel`."""
+
+    channel0 = InvalidationChannel(tmp_path / "channel", max_size=3)
+    channel1 = InvalidationChannel(tmp_path / "channel", max_size=3)
+
+    assert channel1.poll() == []
+    channel0.publish("a")
+    channel0.publish("b")
+    assert channel1.poll() == ["a", "b"]
+    assert channel1.poll() == []
+    # own messages are skipped
+    assert channel0.poll() == []
+
+    # exceeding max_size replaces file and triggers reset
+    channel0.publish("c")
+    assert channel1.poll() is None
+    assert channel1.poll() == []
+    channel0.publish("d")
+    assert channel1.poll() == ["d"]
+
+
+def test_user_cache_shared(tmp_path):
+    """Test `UserCache`s with shared store and `InvalidationChannel`."""
+
+    adapter = util.load_adapter(
+        "user_configs", "native", {"backend": "memory"}
+    )
+    cache0 = UserCache(adapter, channel=InvalidationChannel(tmp_path / "c"))
+    cache1 = UserCache(adapter, channel=InvalidationChannel(tmp_path / "c"))
+
+    cache0.write("a", {"id": "a", "groups": [{"id": "admin"}]})
+    user = cache1.get_user("a")
+    assert user.config["groups"]
+    assert cache1.get_user("a") is user
+
+    # change via cache0 is propagated to cache1
+    cache0.write("a", {"id": "a", "groups": []})
+    assert not cache1.get_user("a").config["groups"]
+    cache0.delete("a")
+    assert cache1.get_user("a") is None
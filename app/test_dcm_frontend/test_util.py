@@ -1,5 +1,11 @@
 """Test module for utility-functions."""
 
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import json
+from time import sleep, time
+
 import pytest
 from dcm_backend.util import DemoData
 import dcm_backend_sdk
@@ -58,3 +64,155 @@ def test_call_backend_timeout(
     )
 
     assert result.status_code == 504
+
+
+def test_call_backend_many_ok(backend, config_sdk: dcm_backend_sdk.ConfigApi):
+    """Minimal test for `call_backend_many`."""
+
+    result = util.call_backend_many(
+        [
+            {
+                "endpoint": config_sdk.get_user_config_with_http_info,
+                "args": (user,),
+            }
+            for user in [DemoData.user0, DemoData.user1, "unknown"]
+        ],
+        request_timeout=1,
+        max_workers=2,
+    )
+
+    assert [r.status_code for r in result] == [200, 200, 404]
+    assert result[0].data.id == DemoData.user0
+    assert result[1].data.id == DemoData.user1
+
+
+def test_call_backend_many_bad_method(config_sdk: dcm_backend_sdk.ConfigApi):
+    """Test for `call_backend_many` with bad method."""
+
+    with pytest.raises(ValueError) as exc_info:
+        util.call_backend_many(
+            [
+                {"endpoint": config_sdk.list_users_with_http_info},
+                {"endpoint": config_sdk.list_users},
+            ]
+        )
+    assert "expected 'list_users_with_http_info'" in str(exc_info.value)
+
+
+def test_call_backend_many_deadline():
+    """Test for `call_backend_many` with exceeded deadline."""
+
+    def fast_with_http_info(**kwargs):
+        return SimpleNamespace(status_code=200, data="fast")
+
+    def slow_with_http_info(**kwargs):
+        sleep(1)
+        return SimpleNamespace(status_code=200, data="slow")
+
+    time0 = time()
+    result = util.call_backend_many(
+        [
+            {"endpoint": fast_with_http_info},
+            {"endpoint": slow_with_http_info},
+        ],
+        deadline=0.1,
+    )
+
+    assert time() - time0 < 0.5
+    assert result[0].status_code == 200
+    assert result[0].data == "fast"
+    assert result[1].status_code == 504
+    assert "deadline" in result[1].fail_reason
+
+
+def test_call_backend_many_shared_executor():
+    """
+    Test for `call_backend_many` with a shared executor that bounds the
+    number of concurrent calls across multiple invocations.
+    """
+
+    threads = set()
+
+    def call_with_http_info(**kwargs):
+        threads.add(threading.current_thread().name)
+        return SimpleNamespace(status_code=200, data="ok")
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test")
+    for _ in range(2):
+        result = util.call_backend_many(
+            [{"endpoint": call_with_http_info}] * 3, executor=executor
+        )
+        assert [r.status_code for r in result] == [200] * 3
+
+    assert len(threads) == 1
+    executor.shutdown()
+
+
+def test_call_backend_raw_ok(backend, config_sdk: dcm_backend_sdk.ConfigApi):
+    """Minimal test for `call_backend_raw`."""
+
+    result = util.call_backend_raw(
+        endpoint=config_sdk.list_users_without_preload_content
+    )
+
+    assert result.status_code == 200
+    assert sorted(json.loads(result.data.data)) == sorted(
+        [DemoData.user0, DemoData.user1, DemoData.user2, DemoData.user3]
+    )
+
+
+def test_call_backend_raw_bad_method(config_sdk: dcm_backend_sdk.ConfigApi):
+    """Minimal test for `call_backend_raw` with bad method."""
+
+    with pytest.raises(ValueError) as exc_info:
+        util.call_backend_raw(endpoint=config_sdk.list_users_with_http_info)
+    assert "expected 'list_users_with_http_info_without_preload_content'" in (
+        str(exc_info.value)
+    )
+
+
+def test_call_backend_raw_error(
+    backend, config_sdk: dcm_backend_sdk.ConfigApi
+):
+    """Test `call_backend_raw` for error-responses."""
+
+    result = util.call_backend_raw(
+        endpoint=config_sdk.get_job_config_without_preload_content,
+        args=("unknown",),
+    )
+
+    assert result.status_code == 404
+    assert "status code 404" in result.fail_reason
+    assert isinstance(result.data, bytes)
+
+
+def test_lru_cache_maxsize():
+    """Test size-limit of `LRUCache`."""
+
+    cache = util.LRUCache(maxsize=2)
+    cache.set("a", 0)
+    cache.set("b", 1)
+    assert cache.get("a") == 0
+    cache.set("c", 2)
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b", "default") == "default"
+    assert cache.stats() == {
+        "size": 2, "maxsize": 2, "hits": 1, "misses": 1, "evictions": 1
+    }
+
+
+def test_lru_cache_ttl():
+    """Test time-to-live of `LRUCache`-entries."""
+
+    cache = util.LRUCache(ttl=0.1)
+    cache.set("a", 0)
+    cache.set("b", 1, ttl=1)
+    assert cache.get("a") == 0
+    sleep(0.15)
+    assert cache.get("a") is None
+    assert cache.get("b") == 1
+    assert cache.pop("b") == 1
+    assert cache.get("b") is None
@@ -1,9 +1,13 @@
 """Test-module for auth-endpoints."""
 
 from hashlib import md5
+from unittest.mock import patch
 
+import pytest
 from dcm_backend.util import DemoData
 
+from dcm_frontend import app_factory
+
 
 def test_login(backend, client, user0_credentials):
     """Minimal test of /login-endpoint."""
@@ -188,3 +192,107 @@ def test_login_logout_multiple_sessions(backend, client, user0_credentials):
     # check back on second session
     client._cookies = {session_cookie_scope: session_1}
     assert client.get("/api/auth/login").status_code == 200
+
+
+def test_unknown_session_id(testing_config):
+    """Test rejection of unknown session ids."""
+
+    config = testing_config()
+    app = app_factory(config)
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["_user_id"] = "unknown-session-id"
+
+    assert client.get("/api/auth/login").status_code == 401
+    assert "unknown-session-id" in app.extensions["unknown_sessions"]
+    assert "unknown-session-id" not in app.extensions["session_key_store"]
+
+    # rejected again without accessing the sessions-db
+    with patch.object(
+        config.sessions, "read", side_effect=config.sessions.read
+    ) as read:
+        assert client.get("/api/auth/login").status_code == 401
+        read.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("threshold", "deferred_writes"),
+    ((0.5, 0), (0, 2)),
+)
+def test_session_refresh_coalesce(
+    backend, testing_config, user0_credentials, threshold, deferred_writes
+):
+    """Test coalesced session-refresh via GET-/login."""
+
+    class ThisConfig(testing_config):
+        SESSION_COALESCE_WRITES = True
+        SESSION_REFRESH_THRESHOLD = threshold
+
+    config = ThisConfig()
+    client = app_factory(config).test_client()
+    client.post("/api/auth/login", json=user0_credentials)
+    assert client.get("/api/auth/login").status_code == 200
+    assert client.get("/api/auth/login").status_code == 200
+
+    assert config.sessions.stats()["writes"] == 1
+    assert config.sessions.stats()["deferredWrites"] == deferred_writes
+
+
+def test_login_logout_signed_session(
+    backend, testing_config, user0_credentials
+):
+    """Test of /login- and /logout-endpoints using signed sessions."""
+
+    class ThisConfig(testing_config):
+        SESSION_SIGNED = True
+
+    config = ThisConfig()
+    client = app_factory(config).test_client()
+    session_cookie_scope = ("localhost", "/", "session")
+
+    assert (
+        client.post("/api/auth/login", json=user0_credentials).status_code
+        == 200
+    )
+    assert client.get("/api/auth/login").status_code == 200
+    session_0 = client._cookies[session_cookie_scope]
+
+    # authentication does not require the sessions-db
+    with patch.object(
+        config.sessions, "read", side_effect=config.sessions.read
+    ) as read:
+        assert (
+            client.get("/api/auth/test-permissions-admin").status_code == 200
+        )
+        read.assert_not_called()
+
+    # logout revokes session
+    assert client.get("/api/auth/logout").status_code == 200
+    client._cookies = {session_cookie_scope: session_0}
+    assert client.get("/api/auth/login").status_code == 401
+
+
+def test_login_signed_session_deleted(
+    backend, testing_config, user0_credentials
+):
+    """
+    Test of /login-endpoint using signed sessions after the session has
+    been deleted from the sessions-db (e.g., by another worker).
+    """
+
+    class ThisConfig(testing_config):
+        SESSION_SIGNED = True
+
+    config = ThisConfig()
+    client = app_factory(config).test_client()
+
+    assert (
+        client.post("/api/auth/login", json=user0_credentials).status_code
+        == 200
+    )
+    for key in list(config.sessions.keys()):
+        config.sessions.adapter.delete(key)
+
+    assert client.get("/api/auth/login").status_code == 401
+    assert not list(config.sessions.keys())
+    assert client.get("/api/auth/login").status_code == 401
@@ -2,10 +2,15 @@
 
 from pathlib import Path
 from uuid import uuid4
+from json import loads
+from unittest import mock
 
 import pytest
 from flask import Flask, jsonify
 from dcm_backend.util import DemoData
+import dcm_backend_sdk
+
+from dcm_frontend import app_factory
 
 
 @pytest.fixture(name="minimal_job_config")
@@ -132,6 +137,7 @@ def test_post_test_job(
 
 def test_get_job_info(
     backend,
+    testing_config,
     client_w_login,
     user1_credentials,
     user2_credentials,
@@ -179,7 +185,24 @@ def test_get_job_info(
         f"/api/curator/job/info?token={DemoData.token1}&keys={keys}"
     )
     assert response.status_code == 200
-    # 'workspaceId' is automatically added in the response
+    # with passthrough, 'workspaceId' is only added if the job's
+    # workspace is not yet known from the workspace-index
+    assert sorted(response.json.keys()) == sorted(["token", "jobConfigId"])
+
+    # without passthrough, 'workspaceId' is automatically added in the
+    # response
+    class RegularConfig(testing_config):
+        BACKEND_PASSTHROUGH = set()
+
+    client = app_factory(RegularConfig()).test_client()
+    assert (
+        client.post("/api/auth/login", json=user1_credentials).status_code
+        == 200
+    )
+    response = client.get(
+        f"/api/curator/job/info?token={DemoData.token1}&keys={keys}"
+    )
+    assert response.status_code == 200
     assert sorted(response.json.keys()) == sorted(
         ["token", "workspaceId", "jobConfigId"]
     )
@@ -201,6 +224,264 @@ def test_get_job_info(
     )
 
 
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        f"/api/curator/job/info?token={DemoData.token1}",
+        f"/api/curator/job/info?token={DemoData.token1}&keys=status",
+        f"/api/curator/job/ies?jobConfigId={DemoData.job_config1}",
+        "/api/curator/job/ie?id=unknown",
+    ],
+)
+def test_backend_passthrough(
+    backend, testing_config, user1_credentials, endpoint
+):
+    """
+    Test that responses are identical with and without
+    `BACKEND_PASSTHROUGH`.
+    """
+
+    class PassthroughConfig(testing_config):
+        BACKEND_PASSTHROUGH = {"get_job_info", "get_job_ies", "get_job_ie"}
+
+    class RegularConfig(testing_config):
+        BACKEND_PASSTHROUGH = set()
+
+    responses = []
+    for config in (PassthroughConfig, RegularConfig):
+        client = app_factory(config()).test_client()
+        assert (
+            client.post(
+                "/api/auth/login", json=user1_credentials
+            ).status_code
+            == 200
+        )
+        responses.append(client.get(endpoint))
+
+    assert responses[0].status_code == responses[1].status_code
+    if responses[0].status_code == 200:
+        assert responses[0].json == responses[1].json
+
+
+def test_get_job_info_passthrough_indexed(
+    backend, testing_config, user1_credentials
+):
+    """
+    Test that GET-/job/info with passthrough requires a single backend
+    request once the job's workspace is known.
+    """
+
+    class PassthroughConfig(testing_config):
+        BACKEND_PASSTHROUGH = {"get_job_info"}
+
+    client = app_factory(PassthroughConfig()).test_client()
+    assert (
+        client.post("/api/auth/login", json=user1_credentials).status_code
+        == 200
+    )
+    endpoint = f"/api/curator/job/info?token={DemoData.token1}&keys=status"
+    first = client.get(endpoint)
+    assert first.status_code == 200
+    assert "jobConfigId" not in first.json
+
+    with mock.patch.object(
+        dcm_backend_sdk.JobApi, "get_job_info_with_http_info"
+    ) as parsed:
+        second = client.get(endpoint)
+        parsed.assert_not_called()
+    assert second.status_code == 200
+    assert second.json["status"] == first.json["status"]
+
+
+def test_get_jobs_status(
+    backend,
+    client_w_login,
+    user1_credentials,
+    user2_credentials,
+):
+    """Test basic GET-/jobs/status with workspace-permission filtering."""
+
+    # user0 not a curator
+    assert (
+        client_w_login.get(
+            f"/api/curator/jobs/status?jobConfigIds={DemoData.job_config1}"
+        ).status_code
+        == 403
+    )
+
+    # switch to user1
+    assert client_w_login.get("/api/auth/logout").status_code == 200
+    assert (
+        client_w_login.post(
+            "/api/auth/login", json=user1_credentials
+        ).status_code
+        == 200
+    )
+
+    # missing args
+    assert client_w_login.get("/api/curator/jobs/status").status_code == 400
+
+    # ok (unknown ids are omitted)
+    response = client_w_login.get(
+        "/api/curator/jobs/status"
+        + f"?jobConfigIds={DemoData.job_config1},unknown"
+    )
+    assert response.status_code == 200
+    assert list(response.json.keys()) == [DemoData.job_config1]
+    status = response.json[DemoData.job_config1]
+    if status["token"] is not None:
+        assert sorted(status["info"].keys()) == sorted(
+            ["status", "datetimeStarted", "triggerType"]
+        )
+
+    # switch to user2
+    assert client_w_login.get("/api/auth/logout").status_code == 200
+    assert (
+        client_w_login.post(
+            "/api/auth/login", json=user2_credentials
+        ).status_code
+        == 200
+    )
+    # wrong workspace
+    response = client_w_login.get(
+        f"/api/curator/jobs/status?jobConfigIds={DemoData.job_config1}"
+    )
+    assert response.status_code == 200
+    assert response.json == {}
+
+
+def test_get_job_status_stream(
+    backend, testing_config, user1_credentials, user2_credentials
+):
+    """Test GET-/job/status/stream with workspace-permission filtering."""
+
+    class ThisTestingConfig(testing_config):
+        JOB_STATUS_POLL_INTERVAL = 0.1
+        JOB_STATUS_STREAM_DURATION = 0.5
+
+    client = app_factory(ThisTestingConfig()).test_client()
+    assert (
+        client.post("/api/auth/login", json=user1_credentials).status_code
+        == 200
+    )
+
+    # missing args
+    assert client.get("/api/curator/job/status/stream").status_code == 400
+
+    # ok
+    response = client.get(
+        "/api/curator/job/status/stream"
+        + f"?jobConfigIds={DemoData.job_config1}&tokens={DemoData.token1}"
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = [
+        loads(line.removeprefix("data: "))
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    # every status is sent only once
+    assert len(events) == 2
+    event = next(e for e in events if "jobConfigId" not in e)
+    assert event["token"] == DemoData.token1
+    assert sorted(event["info"].keys()) == sorted(
+        ["status", "datetimeStarted", "triggerType"]
+    )
+    assert next(e for e in events if "jobConfigId" in e)["jobConfigId"] == (
+        DemoData.job_config1
+    )
+
+    # switch to user2
+    assert client.get("/api/auth/logout").status_code == 200
+    assert (
+        client.post("/api/auth/login", json=user2_credentials).status_code
+        == 200
+    )
+    # wrong workspace
+    assert (
+        client.get(
+            f"/api/curator/job/status/stream?tokens={DemoData.token1}"
+        ).status_code
+        == 403
+    )
+    assert (
+        client.get(
+            "/api/curator/job/status/stream"
+            + f"?jobConfigIds={DemoData.job_config1}"
+        ).status_code
+        == 403
+    )
+
+
+def test_get_job_status_stream_not_consumed(
+    backend, testing_config, user1_credentials
+):
+    """
+    Test that GET-/job/status/stream does not leave a subscription if
+    the response body is never consumed.
+    """
+
+    app = app_factory(testing_config())
+    client = app.test_client()
+    assert (
+        client.post("/api/auth/login", json=user1_credentials).status_code
+        == 200
+    )
+
+    response = client.get(
+        f"/api/curator/job/status/stream?tokens={DemoData.token1}",
+        buffered=False,
+    )
+    assert response.status_code == 200
+    response.close()
+    assert app.extensions["job_status_broker"].subscriptions == 0
+
+
+def test_get_job_status_stream_indexed(
+    backend, testing_config, user1_credentials
+):
+    """
+    Test that GET-/job/status/stream resolves the workspace of known
+    jobs via the workspace-index.
+    """
+
+    class ThisTestingConfig(testing_config):
+        JOB_STATUS_POLL_INTERVAL = 0.1
+        JOB_STATUS_STREAM_DURATION = 0.2
+
+    client = app_factory(ThisTestingConfig()).test_client()
+    assert (
+        client.post("/api/auth/login", json=user1_credentials).status_code
+        == 200
+    )
+
+    get_job_info = dcm_backend_sdk.JobApi.get_job_info_with_http_info
+    with mock.patch.object(
+        dcm_backend_sdk.JobApi,
+        "get_job_info_with_http_info",
+        autospec=True,
+        side_effect=get_job_info,
+    ) as patched:
+        for _ in range(2):
+            assert (
+                client.get(
+                    f"/api/curator/job/status/stream?tokens={DemoData.token1}"
+                ).status_code
+                == 200
+            )
+        # only the first request requires the job's workspace
+        assert (
+            len(
+                [
+                    call
+                    for call in patched.call_args_list
+                    if "workspaceId" in (call.args[2:3] or [""])[0]
+                ]
+            )
+            == 1
+        )
+
+
 def test_get_job_ies(
     backend,
     client_w_login,
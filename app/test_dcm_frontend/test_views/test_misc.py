@@ -1,5 +1,6 @@
 """'Frontend'-app test-module for base-app."""
 
+import json
 from urllib.parse import quote
 from time import sleep
 from unittest import mock
@@ -491,3 +492,283 @@ def test_delete_oai_cache(run_service, client_w_login):
         ).status_code
         == 502
     )
+
+
+@pytest.mark.parametrize(
+    ("token", "remote_addr", "headers", "status"),
+    [
+        (None, "127.0.0.1", {}, 200),
+        (None, "10.0.0.1", {}, 403),
+        ("secret", "10.0.0.1", {"Authorization": "Bearer secret"}, 200),
+        ("secret", "127.0.0.1", {"Authorization": "Bearer other"}, 401),
+        ("secret", "127.0.0.1", {}, 401),
+    ],
+    ids=["localhost", "remote", "token", "bad-token", "missing-token"],
+)
+def test_get_metrics(token, remote_addr, headers, status, testing_config):
+    """Test endpoint `GET-/api/misc/metrics`."""
+
+    class ThisTestingConfig(testing_config):
+        METRICS_TOKEN = token
+
+    client = app_factory(ThisTestingConfig()).test_client()
+    client.get("/api/misc/app-info")
+    response = client.get(
+        "/api/misc/metrics",
+        headers=headers,
+        environ_base={"REMOTE_ADDR": remote_addr},
+    )
+    assert response.status_code == status
+    if status == 200:
+        assert response.mimetype == "text/plain"
+        assert (
+            'dcm_frontend_request_duration_seconds_count{blueprint="misc",'
+            + 'endpoint="misc.configuration"} 1'
+        ) in response.text
+        assert 'dcm_frontend_cache_hits_total{cache="session_key"}' in (
+            response.text
+        )
+        assert 'dcm_frontend_oai_cache_entries{cache="identify"} 0' in (
+            response.text
+        )
+
+
+def test_get_metrics_no_token(testing_config):
+    """
+    Test endpoint `GET-/api/misc/metrics` without token outside of
+    testing-mode.
+    """
+
+    class ThisTestingConfig(testing_config):
+        TESTING = False
+
+    client = app_factory(ThisTestingConfig()).test_client()
+    assert (
+        client.get(
+            "/api/misc/metrics", environ_base={"REMOTE_ADDR": "127.0.0.1"}
+        ).status_code
+        == 403
+    )
+
+
+def test_get_metrics_disabled(testing_config):
+    """Test endpoint `GET-/api/misc/metrics` if disabled."""
+
+    class ThisTestingConfig(testing_config):
+        METRICS = False
+
+    app = app_factory(ThisTestingConfig())
+    assert "metrics" not in app.extensions
+    assert "dcm_frontend_" not in (
+        app.test_client().get("/api/misc/metrics").text
+    )
+
+
+
+def test_delete_oai_cache_url(client_w_login):
+    """Test endpoint `DELETE-/api/misc/oai/cache` with url-arg."""
+
+    url1 = quote("http://localhost:5001/oai")
+    url2 = quote("http://localhost:5002/oai")
+    with mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.identify",
+        side_effect=[{"id": 1}, {"id": 2}, {"id": 3}],
+    ):
+        assert client_w_login.get(
+            f"/api/misc/oai/identify?url={url1}"
+        ).json == {"id": 1}
+        assert client_w_login.get(
+            f"/api/misc/oai/identify?url={url2}"
+        ).json == {"id": 2}
+        assert (
+            client_w_login.delete(
+                f"/api/misc/oai/cache?url={url1}"
+            ).status_code
+            == 200
+        )
+        assert client_w_login.get(
+            f"/api/misc/oai/identify?url={url1}"
+        ).json == {"id": 3}
+        assert client_w_login.get(
+            f"/api/misc/oai/identify?url={url2}"
+        ).json == {"id": 2}
+
+
+def test_get_oai_identify_async(client_w_login, client_w_login_user1):
+    """
+    Test endpoints `GET-/api/misc/oai/identify?async` and
+    `GET-/api/misc/oai/probe`.
+    """
+
+    with mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.identify",
+        side_effect=[{"id": 1}, ReadTimeout()],
+    ):
+        response = client_w_login.get(
+            f"/api/misc/oai/identify?url={quote('http://localhost:5001/oai')}"
+            + "&async"
+        )
+        assert response.status_code == 202
+        assert response.json["status"] == "pending"
+        token = response.json["token"]
+        assert response.headers["Location"].endswith(f"token={token}")
+
+        for _ in range(100):
+            response = client_w_login.get(f"/api/misc/oai/probe?token={token}")
+            if response.status_code != 202:
+                break
+            sleep(0.01)
+        assert response.status_code == 200
+        assert response.json == {"id": 1}
+
+        # not accessible for other users
+        assert (
+            client_w_login_user1.get(
+                f"/api/misc/oai/probe?token={token}"
+            ).status_code
+            == 404
+        )
+
+        # errors
+        token = client_w_login.get(
+            f"/api/misc/oai/identify?url={quote('http://localhost:5001/oai')}"
+            + "&async&no-cache"
+        ).json["token"]
+        for _ in range(100):
+            response = client_w_login.get(f"/api/misc/oai/probe?token={token}")
+            if response.status_code != 202:
+                break
+            sleep(0.01)
+        assert response.status_code == 504
+
+    assert client_w_login.get("/api/misc/oai/probe").status_code == 400
+    assert (
+        client_w_login.get("/api/misc/oai/probe?token=unknown").status_code
+        == 404
+    )
+
+
+def test_get_oai_sets_stream(client_w_login_user1):
+    """Test endpoint `GET-/api/misc/oai/sets/stream`."""
+
+    url = quote("http://localhost:5001/oai")
+    with mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.list_sets",
+        side_effect=[
+            (["set1"], "token1"),
+            ReadTimeout(),
+            (["set2"], None),
+        ],
+    ) as list_sets:
+        # interrupted stream
+        response = client_w_login_user1.get(
+            f"/api/misc/oai/sets/stream?url={url}"
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"sets": ["set1"]}
+        assert lines[1]["status"] == 504
+
+        # continues after cached pages
+        response = client_w_login_user1.get(
+            f"/api/misc/oai/sets/stream?url={url}"
+        )
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"sets": ["set1"]},
+            {"sets": ["set2"]},
+            {"done": True},
+        ]
+        assert list_sets.call_args.kwargs["_resumption_token"] == "token1"
+
+    # complete list is cached
+    assert client_w_login_user1.get(f"/api/misc/oai/sets?url={url}").json == [
+        "set1",
+        "set2",
+    ]
+    assert [
+        json.loads(line)
+        for line in client_w_login_user1.get(
+            f"/api/misc/oai/sets/stream?url={url}"
+        ).text.splitlines()
+    ] == [{"sets": ["set1", "set2"]}, {"done": True}]
+
+    # chunks are passed to the WSGI-server unchanged and have to be bytes
+    response = client_w_login_user1.get(
+        f"/api/misc/oai/sets/stream?url={url}", buffered=False
+    )
+    chunks = list(response.response)
+    response.close()
+    assert chunks
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+
+def test_get_oai_sets_stream_failed_resume(client_w_login_user1):
+    """
+    Test endpoint `GET-/api/misc/oai/sets/stream` if continuing after
+    cached pages fails (e.g., due to an expired resumption token).
+    """
+
+    url = quote("http://localhost:5001/oai")
+    with mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.list_sets",
+        side_effect=[
+            (["set1"], "token1"),
+            ReadTimeout(),
+            ValueError("badResumptionToken"),
+            (["set1"], "token2"),
+            (["set2"], None),
+        ],
+    ) as list_sets:
+        # interrupted stream
+        client_w_login_user1.get(f"/api/misc/oai/sets/stream?url={url}")
+
+        # failed resume
+        lines = [
+            json.loads(line)
+            for line in client_w_login_user1.get(
+                f"/api/misc/oai/sets/stream?url={url}"
+            ).text.splitlines()
+        ]
+        assert lines[0] == {"sets": ["set1"]}
+        assert "error" in lines[1]
+
+        # starts from the first page
+        lines = [
+            json.loads(line)
+            for line in client_w_login_user1.get(
+                f"/api/misc/oai/sets/stream?url={url}"
+            ).text.splitlines()
+        ]
+        assert lines == [
+            {"sets": ["set1"]},
+            {"sets": ["set2"]},
+            {"done": True},
+        ]
+        assert list_sets.call_args_list[3].kwargs["_resumption_token"] is None
+
+
+def test_get_oai_repository(client_w_login):
+    """Test endpoint `GET-/api/misc/oai/repository`."""
+
+    url = quote("http://localhost:5001/oai")
+    with mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.identify",
+        return_value={"id": 1},
+    ), mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.list_metadata_prefixes",
+        side_effect=ReadTimeout(),
+    ), mock.patch(
+        "oai_pmh_extractor.RepositoryInterface.list_sets",
+        side_effect=[(["set1"], "token"), (["set2"], None)],
+    ):
+        response = client_w_login.get(f"/api/misc/oai/repository?url={url}")
+        assert response.status_code == 200
+        assert response.json["identify"] == {"id": 1}
+        assert response.json["metadataPrefixes"]["status"] == 504
+        assert response.json["sets"] == ["set1", "set2"]
+
+        # individual caches are filled
+        assert client_w_login.get(
+            f"/api/misc/oai/identify?url={url}"
+        ).json == {"id": 1}
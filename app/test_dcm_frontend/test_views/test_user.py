@@ -1,7 +1,12 @@
 """Test-module for user-endpoints."""
 
+from unittest.mock import patch
+
 from dcm_backend.util import DemoData
 
+from dcm_frontend import app_factory
+from dcm_frontend.views import user
+
 
 def test_get_user_config(
     backend,
@@ -15,6 +20,61 @@ def test_get_user_config(
     assert response.json.get("id") == DemoData.user0
 
 
+def test_get_user_config_cached(
+    backend,
+    client_w_login,
+):
+    """Test GET-/config-endpoint with cached user-configuration."""
+
+    with patch.object(
+        user, "call_backend", side_effect=user.call_backend
+    ) as call_backend:
+        # served from cache after login
+        response = client_w_login.get("/api/user/config")
+        assert response.status_code == 200
+        assert response.json.get("id") == DemoData.user0
+        call_backend.assert_not_called()
+
+        # widget update is based on current configuration from backend
+        assert (
+            client_w_login.put("/api/user/widgets", json={}).status_code
+            == 200
+        )
+        assert call_backend.call_count == 2
+
+        # cache has been updated
+        response = client_w_login.get("/api/user/config")
+        assert response.json.get("userModified") == DemoData.user0
+        assert call_backend.call_count == 2
+
+
+def test_put_widgets_stale_cache(
+    backend, testing_config, user0_credentials
+):
+    """
+    Test that PUT-/widgets-endpoint does not write back an outdated
+    cached user-configuration (e.g., after changes via another worker).
+    """
+
+    config = testing_config()
+    client = app_factory(config).test_client()
+    assert (
+        client.post("/api/auth/login", json=user0_credentials).status_code
+        == 200
+    )
+    current_user_config = client.get("/api/user/config").json
+
+    # fake outdated cache
+    config.user_configs.write(
+        DemoData.user0, current_user_config | {"groups": []}
+    )
+
+    assert client.put("/api/user/widgets", json={}).status_code == 200
+    assert client.get("/api/user/config").json["groups"] == (
+        current_user_config["groups"]
+    )
+
+
 def test_get_permission_table(client_w_login):
     """Minimal test of GET-/acl-endpoint."""
 
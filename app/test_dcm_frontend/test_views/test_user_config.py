@@ -7,6 +7,8 @@ import pytest
 from dcm_common.util import now
 from dcm_backend.util import DemoData
 
+from dcm_frontend import app_factory
+
 
 @pytest.fixture(name="minimal_user_config")
 def _minimal_user_config():
@@ -245,3 +247,46 @@ def test_delete_user_secrets(
         ).status_code
         == 401
     )
+
+
+def test_delete_user_sessions(
+    backend,
+    testing_config,
+    user0_credentials,
+    user1_credentials,
+):
+    """Test of DELETE /user/sessions-endpoint."""
+
+    config = testing_config()
+    app = app_factory(config)
+    admin_client = app.test_client()
+    user_client = app.test_client()
+    assert (
+        admin_client.post(
+            "/api/auth/login", json=user0_credentials
+        ).status_code
+        == 200
+    )
+    for _ in range(2):
+        user_client._cookies = {}
+        assert (
+            user_client.post(
+                "/api/auth/login", json=user1_credentials
+            ).status_code
+            == 200
+        )
+    assert user_client.get("/api/auth/login").status_code == 200
+    assert len(config.sessions.get_user_sessions(DemoData.user1)) == 2
+
+    # missing 'id' argument
+    assert admin_client.delete("/api/admin/user/sessions").status_code == 400
+
+    assert (
+        admin_client.delete(
+            f"/api/admin/user/sessions?id={DemoData.user1}"
+        ).status_code
+        == 200
+    )
+    assert not config.sessions.get_user_sessions(DemoData.user1)
+    assert user_client.get("/api/auth/login").status_code == 401
+    assert admin_client.get("/api/auth/login").status_code == 200
@@ -103,6 +103,36 @@ def test_get_workspace(
     )
 
 
+def test_get_workspace_conditional(
+    backend, client_w_login, minimal_workspace_config
+):
+    """Test conditional requests for GET /workspace-endpoint."""
+
+    url = "/api/admin/workspace?id=" + DemoData.workspace1
+    response = client_w_login.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # not modified
+    response = client_w_login.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    # modified
+    assert (
+        client_w_login.put(
+            "/api/admin/workspace",
+            json=minimal_workspace_config
+            | {"name": "new name", "id": DemoData.workspace1},
+        ).status_code
+        == 200
+    )
+    response = client_w_login.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["name"] == "new name"
+    assert response.headers["ETag"] != etag
+
+
 def test_modify_workspace(
     backend,
     client_w_login,
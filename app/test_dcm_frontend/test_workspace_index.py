@@ -0,0 +1,86 @@
+"""Test module for the `WorkspaceIndex`."""
+
+import pytest
+from dcm_backend.util import DemoData
+import dcm_backend_sdk
+
+from dcm_frontend.workspace_index import WorkspaceIndex
+
+
+@pytest.fixture(name="config_sdk")
+def _config_sdk(backend_port):
+    return dcm_backend_sdk.ConfigApi(
+        dcm_backend_sdk.ApiClient(
+            dcm_backend_sdk.Configuration(
+                host=f"http://localhost:{backend_port}"
+            )
+        )
+    )
+
+
+@pytest.fixture(name="index")
+def _index(testing_config, config_sdk):
+    return WorkspaceIndex(testing_config(), config_sdk)
+
+
+def test_workspace_index_job_config(backend, config_sdk, index):
+    """Test resolving job-configurations via `WorkspaceIndex`."""
+
+    workspace_id = config_sdk.get_job_config(DemoData.job_config1).workspace_id
+
+    response = index.get_job_config_workspace(DemoData.job_config1)
+    assert response.status_code == 200
+    assert response.data == workspace_id
+    assert index.get(WorkspaceIndex.JOB_CONFIG, DemoData.job_config1) == (
+        workspace_id
+    )
+
+    # served from index
+    misses = index.stats()[WorkspaceIndex.JOB_CONFIG]["misses"]
+    assert index.get_job_config_workspace(DemoData.job_config1).data == (
+        workspace_id
+    )
+    assert index.stats()[WorkspaceIndex.JOB_CONFIG]["misses"] == misses
+
+    # invalidate
+    index.invalidate(WorkspaceIndex.JOB_CONFIG, DemoData.job_config1)
+    assert index.get(WorkspaceIndex.JOB_CONFIG, DemoData.job_config1) is None
+
+
+def test_workspace_index_unknown(backend, index):
+    """Test resolving unknown resources via `WorkspaceIndex`."""
+
+    response = index.get_template_workspace("unknown")
+    assert response.status_code == 404
+    assert index.get(WorkspaceIndex.TEMPLATE, "unknown") is None
+
+
+def test_workspace_index_many(backend, config_sdk, index):
+    """Test resolving multiple templates via `WorkspaceIndex`."""
+
+    workspaces = index.get_template_workspaces(
+        [DemoData.template1, DemoData.template2, "unknown"]
+    )
+
+    assert workspaces == {
+        DemoData.template1: config_sdk.get_template(
+            DemoData.template1
+        ).workspace_id,
+        DemoData.template2: config_sdk.get_template(
+            DemoData.template2
+        ).workspace_id,
+        "unknown": None,
+    }
+
+
+def test_workspace_index_disabled(backend, testing_config, config_sdk):
+    """Test `WorkspaceIndex` with TTL of zero."""
+
+    class ThisTestingConfig(testing_config):
+        WORKSPACE_INDEX_TTL = 0
+
+    index = WorkspaceIndex(ThisTestingConfig(), config_sdk)
+    assert index.get_job_config_workspace(DemoData.job_config1).status_code == (
+        200
+    )
+    assert index.get(WorkspaceIndex.JOB_CONFIG, DemoData.job_config1) is None